@@ -0,0 +1,10 @@
+"""
+Benchmarks of the mock API.
+
+They are not part of the test suite: run them explicitly against a
+seeded database, see the README for the available suites.
+"""
+
+# The service modules can only be imported after the API routers they are
+# used by (services -> web.api.*.schema -> web.api.*.views -> services).
+import operaclone2.web.api.router  # noqa: F401
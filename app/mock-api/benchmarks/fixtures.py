@@ -0,0 +1,155 @@
+"""In-memory datasets for the service micro-benchmarks."""
+
+import random
+from dataclasses import dataclass
+from datetime import date
+
+from benchmarks.generate_data import ReservationSampler
+from operaclone2.db.models.hotel import Hotel
+from operaclone2.db.models.reservation import ReservationModel
+from operaclone2.db.models.room_type import RoomType
+from operaclone2.seed import room_type_seed_data
+
+# Size of the startup seed (see operaclone2.seed). The seed has no
+# reservations, one page of 10 per hotel stands in.
+SEED_HOTELS = 1
+SEED_ROOM_TYPES_PER_HOTEL = len(room_type_seed_data())
+SEED_RESERVATIONS_PER_HOTEL = 10
+
+CITIES = (
+    ("El Gouna", "EG", "Red Sea"),
+    ("Hurghada", "EG", "Red Sea"),
+    ("Lisbon", "PT", "Lisboa"),
+    ("Berlin", "DE", "Berlin"),
+    ("Kyoto", "JP", "Kyoto"),
+    ("Austin", "US", "TX"),
+)
+AMENITIES = ("BEACH", "SPA", "POOL", "WIFI", "GOLF", "CONFERENCE", "GYM", "PARKING")
+ROOM_NAMES = ("Classic King", "Classic Twin", "Deluxe Lagoon View", "Family Suite", "Suite")
+
+
+@dataclass(slots=True)
+class Dataset:
+    """Transient ORM objects, never added to a session."""
+
+    scale: int
+    hotels: list[Hotel]
+    room_types: list[RoomType]
+    reservations: list[ReservationModel]
+
+
+def _hotel(index: int, rng: random.Random) -> Hotel:
+    city, country, state = rng.choice(CITIES)
+    return Hotel(
+        id=index + 1,
+        hotel_id=f"BENCH{index:06d}",
+        hotel_code=f"BCH{index:06d}",
+        enterprise_id="BENCH",
+        chain_code="BENCH",
+        cluster_code=city.upper().replace(" ", "")[:20],
+        hotel_name=f"Benchmark Resort {city} {index}",
+        hotel_description=f"Resort number {index} in {city}. " * rng.randint(2, 6),
+        city_name=city,
+        country_code=country,
+        state_prov=state,
+        postal_code=f"{rng.randint(10000, 99999)}",
+        address_lines=[f"{rng.randint(1, 200)} Beach Road", city],
+        latitude=rng.uniform(-60, 60),
+        longitude=rng.uniform(-180, 180),
+        currency_code="USD",
+        primary_language="en",
+        total_number_of_rooms=rng.randint(40, 600),
+        property_amenities=[
+            {"hotelAmenity": code, "description": code.title()}
+            for code in rng.sample(AMENITIES, rng.randint(2, len(AMENITIES)))
+        ],
+        point_of_interest=[
+            {"name": f"Sight {poi}", "distance": rng.randint(1, 30), "unit": "km"}
+            for poi in range(rng.randint(0, 4))
+        ],
+        meta={},
+    )
+
+
+def _room_type(hotel: Hotel, index: int, rng: random.Random) -> RoomType:
+    name = ROOM_NAMES[index % len(ROOM_NAMES)]
+    return RoomType(
+        hotel_id_fk=hotel.id,
+        hotel_room_type=f"RT{index:03d}",
+        room_type=f"RT{index:03d}",
+        description=[f"{name} with {rng.randint(25, 120)} sqm."],
+        room_name=name,
+        room_category="Standard" if index % 2 else "Deluxe",
+        room_amenities=[
+            {"roomAmenity": code, "description": code.title(), "quantity": 1}
+            for code in rng.sample(AMENITIES, 3)
+        ],
+        room_view_type="Garden View",
+        room_primary_bed_type="King",
+        non_smoking_ind=True,
+        occupancy={"minOccupancy": 1, "maxOccupancy": 4, "maxAdults": 2, "maxChildren": 2},
+        number_of_units=rng.randint(5, 80),
+    )
+
+
+def _reservation(hotel: Hotel, index: int, sampler: ReservationSampler) -> ReservationModel:
+    arrival, departure = sampler.stay()
+    given_name, surname = sampler.guest_name()
+    created = sampler.created(arrival)
+    cancellation = sampler.cancellation()
+    return ReservationModel(
+        reservation_id=f"{hotel.id:06d}{index:06d}",
+        confirmation_number=f"C{hotel.id:06d}{index:06d}",
+        hotel_id=hotel.hotel_id,
+        reservation_status="Reserved" if cancellation is None else "Cancelled",
+        arrival_date=arrival,
+        departure_date=departure,
+        guest_first_name=given_name,
+        guest_last_name=surname,
+        number_of_adults=2,
+        number_of_children=0,
+        room_stay={
+            "arrivalDate": arrival.isoformat(),
+            "departureDate": departure.isoformat(),
+            "guestCounts": {"adults": 2, "children": 0},
+            "roomRates": [{"roomType": "RT000", "ratePlanCode": "BAR"}],
+        },
+        reservation_guests=[
+            {
+                "profileInfo": {
+                    "profile": {
+                        "customer": {
+                            "personName": [{"givenName": given_name, "surname": surname}],
+                        },
+                    },
+                },
+                "primary": True,
+            },
+        ],
+        create_date_time=created,
+        update_date_time=created,
+    )
+
+
+def build_dataset(scale: int, seed: int = 0) -> Dataset:
+    """
+    Build a dataset ``scale`` times the size of the startup seed.
+
+    :param scale: multiple of the seed size.
+    :param seed: seed of the random generator, the same seed gives the same data.
+    :return: dataset.
+    """
+    rng = random.Random(seed)  # noqa: S311
+    hotels = [_hotel(index, rng) for index in range(SEED_HOTELS * scale)]
+    room_types = [
+        _room_type(hotel, index, rng)
+        for hotel in hotels
+        for index in range(SEED_ROOM_TYPES_PER_HOTEL)
+    ]
+    sampler = ReservationSampler(rng, date(2026, 1, 1), 365)
+    reservations = [
+        _reservation(hotel, index, sampler)
+        for hotel in hotels
+        for index in range(SEED_RESERVATIONS_PER_HOTEL)
+    ]
+    return Dataset(scale, hotels, room_types, reservations)
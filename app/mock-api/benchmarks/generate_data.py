@@ -0,0 +1,588 @@
+"""
+Synthetic dataset generator for scaling tests.
+
+Generates hotels, room types and reservations and loads them with
+``COPY`` (asyncpg ``copy_records_to_table``)::
+
+    python -m benchmarks.generate_data --reservations 10000000 --jobs 8
+    python -m benchmarks.generate_data --hotels 1000 --room-types 20000 --replace
+
+The data is deterministic for a given ``--seed`` and sizes, whatever the
+number of ``--jobs``: reservations are produced in fixed-size chunks, each
+with its own random generator, and the chunks are loaded in parallel by
+worker processes. Arrivals follow a yearly season with a summer peak and
+more weekend arrivals, stay lengths a skewed distribution with a bump at
+one week, guest names come from several regions with a long tail, and a
+share of the reservations is cancelled.
+
+Synthetic rows are recognised by the ``--prefix`` of their hotel ids,
+``--replace`` deletes the previous synthetic data before loading.
+"""
+
+import argparse
+import asyncio
+import bisect
+import itertools
+import logging
+import math
+import random
+import sys
+import time
+from collections.abc import Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from typing import Any
+
+import asyncpg
+import ujson
+
+from operaclone2.settings import settings
+
+logger = logging.getLogger(__name__)
+
+CHUNK_SIZE = 100_000
+
+CITIES = (
+    # city, country, state, time zone, currency, weight
+    ("El Gouna", "EG", "Red Sea", "Africa/Cairo", "EGP", 6),
+    ("Hurghada", "EG", "Red Sea", "Africa/Cairo", "EGP", 8),
+    ("Sharm El Sheikh", "EG", "South Sinai", "Africa/Cairo", "EGP", 6),
+    ("Cairo", "EG", "Cairo", "Africa/Cairo", "EGP", 5),
+    ("Lisbon", "PT", "Lisboa", "Europe/Lisbon", "EUR", 4),
+    ("Barcelona", "ES", "Catalonia", "Europe/Madrid", "EUR", 5),
+    ("Berlin", "DE", "Berlin", "Europe/Berlin", "EUR", 4),
+    ("Paris", "FR", "Ile-de-France", "Europe/Paris", "EUR", 6),
+    ("Dubai", "AE", "Dubai", "Asia/Dubai", "AED", 7),
+    ("Kyoto", "JP", "Kyoto", "Asia/Tokyo", "JPY", 3),
+    ("Bangkok", "TH", "Bangkok", "Asia/Bangkok", "THB", 5),
+    ("Austin", "US", "TX", "America/Chicago", "USD", 3),
+    ("New York", "US", "NY", "America/New_York", "USD", 6),
+    ("Cancun", "MX", "Quintana Roo", "America/Cancun", "MXN", 4),
+)
+CHAINS = ("MOVENPICK", "NOVOTEL", "PULLMAN", "SOFITEL", "IBIS", "FAIRMONT", "INDEPENDENT")
+AMENITIES = (
+    "BEACH",
+    "SPA",
+    "POOL",
+    "WIFI",
+    "GOLF",
+    "CONFERENCE",
+    "GYM",
+    "PARKING",
+    "KIDS_CLUB",
+)
+ROOM_TYPES = (
+    # code, name, category, view, bed, max occupancy
+    ("CLSKG", "Classic King", "Standard", "Garden View", "King", 3),
+    ("CLSTW", "Classic Twin", "Standard", "Garden View", "Twin", 3),
+    ("DLXLG", "Deluxe King Lagoon View", "Deluxe", "Lagoon View", "King", 3),
+    ("DLXSV", "Deluxe King Sea View", "Deluxe", "Sea View", "King", 3),
+    ("FAMLG", "Family Room Lagoon View", "Family", "Lagoon View", "King", 4),
+    ("SUISV", "Deluxe Suite Sea View", "Suite", "Sea View", "King", 4),
+    ("FAMSV", "Family Suite Sea View", "Suite", "Sea View", "King", 6),
+    ("PRSTV", "Presidential Suite", "Suite", "Sea View", "King", 6),
+)
+# Names from several regions. Earlier names are more common (Zipf-like),
+# so that surname searches return realistically sized result sets.
+GIVEN_NAMES = (
+    *("Mohamed", "Ahmed", "Fatma", "Omar", "Nour", "Youssef", "Mariam", "Hana", "Karim", "Salma"),
+    *("Anna", "Lukas", "Sofia", "Jonas", "Emma", "Mateo", "Chloe", "Luca", "Elena", "Noah"),
+    *("James", "Olivia", "Liam", "Ava", "Ethan", "Mia", "Lucas", "Amelia", "Jack", "Grace"),
+    *("Yuki", "Haruto", "Sakura", "Wei", "Min-jun", "Aarav", "Priya", "Ananya", "Chen", "Mei"),
+    *("Ivan", "Olga", "Dmitri", "Nia", "Kwame", "Amara", "Chidi", "Zanele", "Tiago", "Lucia"),
+)
+SURNAMES = (
+    *("Hassan", "Mohamed", "Ali", "Ibrahim", "Mahmoud", "Abdelrahman", "Saleh", "Farouk"),
+    *("Muller", "Schmidt", "Rossi", "Garcia", "Martin", "Dubois", "Novak", "Kowalski"),
+    *("Smith", "Johnson", "Brown", "Taylor", "Wilson", "Clarke", "Walker", "Hughes"),
+    *("Tanaka", "Sato", "Wang", "Li", "Kim", "Nguyen", "Patel", "Sharma"),
+    *("Ivanov", "Petrova", "Okafor", "Mensah", "Dlamini", "Silva", "Santos", "Fernandez"),
+)
+CANCELLATION_REASONS = (
+    ("CHANGE", "Change of plans"),
+    ("PRICE", "Found a better price"),
+    ("ILLNESS", "Illness"),
+    ("DUPLICATE", "Duplicate booking"),
+    ("TRAVEL", "Travel restrictions"),
+)
+# Relative frequency of stays of 1..14 nights, with a bump at one week.
+STAY_LENGTH_WEIGHTS = (18, 22, 17, 12, 8, 5, 9, 2.5, 1.5, 1.2, 1, 0.8, 0.6, 1.4)
+
+
+def _zipf_weights(count: int, exponent: float = 0.8) -> list[float]:
+    return [1 / (rank**exponent) for rank in range(1, count + 1)]
+
+
+def _cumulative(weights: Sequence[float]) -> list[float]:
+    return list(itertools.accumulate(weights))
+
+
+class ReservationSampler:
+    """Draws the random attributes of reservations."""
+
+    def __init__(
+        self,
+        rng: random.Random,
+        start: date,
+        days: int,
+        cancellation_rate: float = 0.18,
+    ) -> None:
+        self.rng = rng
+        self.start = start
+        self.cancellation_rate = cancellation_rate
+        self._day_weights = _cumulative([self._season(start + timedelta(d)) for d in range(days)])
+        self._stay_weights = _cumulative(STAY_LENGTH_WEIGHTS)
+        self._given_weights = _cumulative(_zipf_weights(len(GIVEN_NAMES)))
+        self._surname_weights = _cumulative(_zipf_weights(len(SURNAMES)))
+
+    @staticmethod
+    def _season(day: date) -> float:
+        # Peak in mid July, low in mid January, more arrivals on Fri/Sat.
+        yearly = 1 + 0.45 * math.cos(2 * math.pi * (day.timetuple().tm_yday - 196) / 365)
+        return yearly * (1.3 if day.weekday() in {4, 5} else 1.0)
+
+    def _pick(self, cumulative: list[float]) -> int:
+        return bisect.bisect(cumulative, self.rng.random() * cumulative[-1])
+
+    def stay(self) -> tuple[date, date]:
+        """
+        Draw arrival and departure dates.
+
+        :return: arrival and departure date.
+        """
+        arrival = self.start + timedelta(days=self._pick(self._day_weights))
+        return arrival, arrival + timedelta(days=self._pick(self._stay_weights) + 1)
+
+    def guest_name(self) -> tuple[str, str]:
+        """
+        Draw a guest name.
+
+        :return: given name and surname.
+        """
+        return (
+            GIVEN_NAMES[self._pick(self._given_weights)],
+            SURNAMES[self._pick(self._surname_weights)],
+        )
+
+    def guests(self) -> tuple[int, int]:
+        """
+        Draw the guest counts.
+
+        :return: adults and children.
+        """
+        adults = self.rng.choices((1, 2, 3, 4), weights=(20, 65, 10, 5))[0]
+        children = self.rng.choices((0, 1, 2, 3), weights=(70, 15, 12, 3))[0]
+        return adults, children
+
+    def created(self, arrival: date) -> datetime:
+        """
+        Draw the booking time, most bookings are made a few weeks ahead.
+
+        :param arrival: arrival date.
+        :return: creation time.
+        """
+        lead_days = min(int(self.rng.expovariate(1 / 35)), 365)
+        booked = datetime.combine(arrival, datetime.min.time()) - timedelta(days=lead_days)
+        return booked + timedelta(seconds=self.rng.randrange(24 * 60 * 60))
+
+    def cancellation(self) -> tuple[str, str] | None:
+        """
+        Decide whether a reservation is cancelled.
+
+        :return: reason code and description, None if not cancelled.
+        """
+        if self.rng.random() >= self.cancellation_rate:
+            return None
+        return self.rng.choice(CANCELLATION_REASONS)
+
+
+@dataclass(slots=True)
+class GeneratorConfig:
+    """Parameters shared by all worker processes."""
+
+    dsn: str
+    seed: int
+    prefix: str
+    start: date
+    days: int
+    cancellation_rate: float
+    reservations: int
+    # (hotel_id, weight) of every generated hotel.
+    hotels: list[tuple[str, int]]
+
+
+def hotel_records(count: int, first_id: int, seed: int, prefix: str) -> list[tuple[Any, ...]]:
+    """
+    Generate hotel rows.
+
+    :param count: number of hotels.
+    :param first_id: primary key of the first hotel.
+    :param seed: random seed.
+    :param prefix: prefix of the synthetic hotel ids.
+    :return: rows in the order of ``HOTEL_COLUMNS``.
+    """
+    rng = random.Random(f"{seed}-hotels")  # noqa: S311
+    city_weights = [city[-1] for city in CITIES]
+    records = []
+    for index in range(count):
+        city, country, state, time_zone, currency, _ = rng.choices(CITIES, city_weights)[0]
+        chain = rng.choice(CHAINS)
+        rooms = int(min(max(rng.lognormvariate(5.2, 0.6), 20), 1500))
+        amenities = rng.sample(AMENITIES, rng.randint(2, len(AMENITIES)))
+        records.append(
+            (
+                first_id + index,
+                f"{prefix}H{index:07d}",
+                f"{prefix}{index:07d}",
+                "SYNTHETIC",
+                chain,
+                city.upper().replace(" ", "")[:20],
+                f"{chain.title()} {city} {index}",
+                f"Synthetic {rooms} room property in {city}.",
+                city,
+                country,
+                state,
+                f"{rng.randint(10000, 99999)}",
+                ujson.dumps([f"{rng.randint(1, 300)} Corniche Road", city]),
+                round(rng.uniform(-60, 60), 6),
+                round(rng.uniform(-180, 180), 6),
+                currency,
+                "en",
+                rooms,
+                time_zone,
+                "15:00",
+                "12:00",
+                ujson.dumps(
+                    [{"hotelAmenity": code, "description": code.title()} for code in amenities]
+                ),
+                ujson.dumps({"synthetic": True}),
+            ),
+        )
+    return records
+
+
+HOTEL_COLUMNS = (
+    "id",
+    "hotel_id",
+    "hotel_code",
+    "enterprise_id",
+    "chain_code",
+    "cluster_code",
+    "hotel_name",
+    "hotel_description",
+    "city_name",
+    "country_code",
+    "state_prov",
+    "postal_code",
+    "address_lines",
+    "latitude",
+    "longitude",
+    "currency_code",
+    "primary_language",
+    "total_number_of_rooms",
+    "time_zone_name",
+    "check_in_time",
+    "check_out_time",
+    "property_amenities",
+    "meta",
+)
+
+
+def room_type_records(
+    hotels: Sequence[tuple[Any, ...]],
+    count: int,
+    seed: int,
+) -> list[tuple[Any, ...]]:
+    """
+    Generate room type rows, spread evenly over the hotels.
+
+    :param hotels: hotel rows from ``hotel_records``.
+    :param count: total number of room types.
+    :param seed: random seed.
+    :return: rows in the order of ``ROOM_TYPE_COLUMNS``.
+    """
+    rng = random.Random(f"{seed}-room-types")  # noqa: S311
+    records = []
+    for index in range(count):
+        hotel = hotels[index % len(hotels)]
+        position = index // len(hotels)
+        code, name, category, view, bed, max_occupancy = ROOM_TYPES[position % len(ROOM_TYPES)]
+        suffix = "" if position < len(ROOM_TYPES) else str(position // len(ROOM_TYPES))
+        records.append(
+            (
+                hotel[0],
+                f"{code}{suffix}",
+                f"{code}{suffix}",
+                ujson.dumps([f"{name} of {rng.randint(25, 120)} sqm."]),
+                name,
+                category,
+                ujson.dumps(
+                    [
+                        {"roomAmenity": amenity, "description": amenity.title(), "quantity": 1}
+                        for amenity in rng.sample(AMENITIES, 3)
+                    ],
+                ),
+                view,
+                bed,
+                rng.random() < 0.9,
+                ujson.dumps(
+                    {
+                        "minOccupancy": 1,
+                        "maxOccupancy": max_occupancy,
+                        "maxAdults": min(max_occupancy, 4),
+                        "maxChildren": max_occupancy - 2,
+                    },
+                ),
+                max(int(hotel[17] / len(ROOM_TYPES)), 1),
+            ),
+        )
+    return records
+
+
+ROOM_TYPE_COLUMNS = (
+    "hotel_id_fk",
+    "hotel_room_type",
+    "room_type",
+    "description",
+    "room_name",
+    "room_category",
+    "room_amenities",
+    "room_view_type",
+    "room_primary_bed_type",
+    "non_smoking_ind",
+    "occupancy",
+    "number_of_units",
+)
+
+
+def reservation_records(config: GeneratorConfig, chunk: int) -> Iterator[tuple[Any, ...]]:
+    """
+    Generate the reservation rows of one chunk.
+
+    :param config: generator parameters.
+    :param chunk: chunk number, chunks hold ``CHUNK_SIZE`` reservations.
+    :yield: rows in the order of ``RESERVATION_COLUMNS``.
+    """
+    rng = random.Random(f"{config.seed}-reservations-{chunk}")  # noqa: S311
+    sampler = ReservationSampler(rng, config.start, config.days, config.cancellation_rate)
+    hotel_ids = [hotel_id for hotel_id, _ in config.hotels]
+    hotel_weights = _cumulative([weight for _, weight in config.hotels])
+
+    first = chunk * CHUNK_SIZE
+    for number in range(first, min(first + CHUNK_SIZE, config.reservations)):
+        hotel_id = hotel_ids[bisect.bisect(hotel_weights, rng.random() * hotel_weights[-1])]
+        arrival, departure = sampler.stay()
+        given_name, surname = sampler.guest_name()
+        adults, children = sampler.guests()
+        created = sampler.created(arrival)
+        cancellation = sampler.cancellation()
+        updated = created
+        if cancellation is not None:
+            updated = (
+                created + (datetime.combine(arrival, datetime.min.time()) - created) * rng.random()
+            )
+        yield (
+            f"{config.prefix}{number:010d}",
+            f"{config.prefix}C{number:010d}",
+            hotel_id,
+            "Reserved" if cancellation is None else "Cancelled",
+            arrival,
+            departure,
+            given_name,
+            surname,
+            adults,
+            children,
+            ujson.dumps(
+                {
+                    "arrivalDate": arrival.isoformat(),
+                    "departureDate": departure.isoformat(),
+                    "guestCounts": {"adults": adults, "children": children},
+                },
+            ),
+            ujson.dumps(
+                [
+                    {
+                        "profileInfo": {
+                            "profile": {
+                                "customer": {
+                                    "personName": [{"givenName": given_name, "surname": surname}],
+                                },
+                            },
+                        },
+                        "primary": True,
+                    },
+                ],
+            ),
+            created,
+            updated,
+            None if cancellation is None else f"{config.prefix}X{number:010d}",
+            None if cancellation is None else cancellation[0],
+            None if cancellation is None else cancellation[1],
+        )
+
+
+RESERVATION_COLUMNS = (
+    "reservation_id",
+    "confirmation_number",
+    "hotel_id",
+    "reservation_status",
+    "arrival_date",
+    "departure_date",
+    "guest_first_name",
+    "guest_last_name",
+    "number_of_adults",
+    "number_of_children",
+    "room_stay",
+    "reservation_guests",
+    "create_date_time",
+    "update_date_time",
+    "cancellation_number",
+    "cancellation_reason_code",
+    "cancellation_reason_desc",
+)
+
+
+async def _copy_reservation_chunk(config: GeneratorConfig, chunk: int) -> int:
+    connection = await asyncpg.connect(config.dsn)
+    try:
+        await connection.copy_records_to_table(
+            "reservations",
+            records=reservation_records(config, chunk),
+            columns=RESERVATION_COLUMNS,
+        )
+    finally:
+        await connection.close()
+    return min(CHUNK_SIZE, config.reservations - chunk * CHUNK_SIZE)
+
+
+def load_reservation_chunk(config: GeneratorConfig, chunk: int) -> int:
+    """
+    Load one chunk of reservations, in a worker process.
+
+    :param config: generator parameters.
+    :param chunk: chunk number.
+    :return: number of loaded reservations.
+    """
+    return asyncio.run(_copy_reservation_chunk(config, chunk))
+
+
+async def _delete_synthetic(connection: asyncpg.Connection, prefix: str) -> None:
+    pattern = f"{prefix}%"
+    async with connection.transaction():
+        await connection.execute("DELETE FROM reservations WHERE hotel_id LIKE $1", pattern)
+        await connection.execute(
+            "DELETE FROM room_types WHERE hotel_id_fk IN "
+            "(SELECT id FROM hotels WHERE hotel_id LIKE $1)",
+            pattern,
+        )
+        await connection.execute("DELETE FROM hotels WHERE hotel_id LIKE $1", pattern)
+
+
+async def generate(args: argparse.Namespace) -> None:
+    """
+    Generate and load the whole dataset.
+
+    :param args: parsed command line arguments.
+    :raises SystemExit: if synthetic data exists and ``--replace`` is not set.
+    """
+    dsn = str(settings.db_url.with_scheme("postgresql"))
+    connection = await asyncpg.connect(dsn)
+    try:
+        if args.replace:
+            await _delete_synthetic(connection, args.prefix)
+        elif await connection.fetchval(
+            "SELECT 1 FROM hotels WHERE hotel_id LIKE $1 LIMIT 1",
+            f"{args.prefix}%",
+        ):
+            raise SystemExit(f"Synthetic data with prefix {args.prefix} exists, use --replace")
+
+        started = time.perf_counter()
+        first_id = await connection.fetchval("SELECT coalesce(max(id), 0) + 1 FROM hotels")
+        hotels = hotel_records(args.hotels, first_id, args.seed, args.prefix)
+        await connection.copy_records_to_table("hotels", records=hotels, columns=HOTEL_COLUMNS)
+        await connection.execute(
+            "SELECT setval(pg_get_serial_sequence('hotels', 'id'), (SELECT max(id) FROM hotels))",
+        )
+        room_types = room_type_records(hotels, args.room_types, args.seed)
+        await connection.copy_records_to_table(
+            "room_types",
+            records=room_types,
+            columns=ROOM_TYPE_COLUMNS,
+        )
+        logger.info("Loaded %d hotels and %d room types", len(hotels), len(room_types))
+    finally:
+        await connection.close()
+
+    config = GeneratorConfig(
+        dsn=dsn,
+        seed=args.seed,
+        prefix=args.prefix,
+        start=args.start,
+        days=args.days,
+        cancellation_rate=args.cancellation_rate,
+        reservations=args.reservations,
+        # Bigger hotels get proportionally more reservations.
+        hotels=[(hotel[1], hotel[17]) for hotel in hotels],
+    )
+    chunks = range(math.ceil(args.reservations / CHUNK_SIZE))
+    loaded = 0
+    loop = asyncio.get_running_loop()
+    with ProcessPoolExecutor(max_workers=args.jobs) as executor:
+        futures = [
+            loop.run_in_executor(executor, load_reservation_chunk, config, chunk)
+            for chunk in chunks
+        ]
+        for future in asyncio.as_completed(futures):
+            loaded += await future
+            elapsed = time.perf_counter() - started
+            logger.info(
+                "Loaded %d/%d reservations (%.0f rows/s)",
+                loaded,
+                args.reservations,
+                loaded / elapsed,
+            )
+
+    connection = await asyncpg.connect(dsn)
+    try:
+        await connection.execute("ANALYZE hotels, room_types, reservations")
+    finally:
+        await connection.close()
+    logger.info("Done in %.1f s", time.perf_counter() - started)
+
+
+def _parse_args(argv: list[str] | None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--hotels", type=int, default=100, help="number of hotels")
+    parser.add_argument("--room-types", type=int, default=1000, help="total room types")
+    parser.add_argument("--reservations", type=int, default=100_000, help="total reservations")
+    parser.add_argument("--seed", type=int, default=0, help="random seed")
+    parser.add_argument("--jobs", type=int, default=4, help="worker processes")
+    parser.add_argument("--prefix", default="SYN", help="prefix of synthetic ids")
+    parser.add_argument(
+        "--start",
+        type=date.fromisoformat,
+        default=date(2026, 1, 1),
+        help="first arrival date",
+    )
+    parser.add_argument("--days", type=int, default=365, help="arrival window in days")
+    parser.add_argument("--cancellation-rate", type=float, default=0.18, help="cancelled share")
+    parser.add_argument("--replace", action="store_true", help="delete previous synthetic data")
+    args = parser.parse_args(argv)
+    if args.hotels < 1 or args.room_types < 0 or args.reservations < 0:
+        parser.error("--hotels must be positive, sizes must not be negative")
+    return args
+
+
+def main(argv: list[str] | None = None) -> None:
+    """
+    Run the generator from the command line.
+
+    :param argv: command line arguments.
+    """
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    asyncio.run(generate(_parse_args(argv)))
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,488 @@
+"""
+End-to-end HTTP load benchmark of the mock API.
+
+Drives every shop, content, reservation and inventory route with a
+weighted request mix, either in-process through ``httpx.ASGITransport``
+(the default) or against a running server::
+
+    python -m benchmarks.http_load
+    python -m benchmarks.http_load --url http://localhost:8000
+    python -m benchmarks.http_load --save-baseline
+
+Latency percentiles and throughput are reported per route. Database
+round trips are read from the ``Server-Timing`` header, so they are only
+available while ``server_timing_enabled`` is on. When a baseline exists
+the run fails on regressions beyond ``--tolerance``.
+"""
+
+import argparse
+import asyncio
+import platform
+import random
+import re
+import sys
+import time
+from collections.abc import AsyncIterator, Callable, Iterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from datetime import UTC, date, datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+from benchmarks.stats import Summary, compare, format_table, load_baseline, save_baseline, summarize
+from operaclone2.web.application import get_app
+
+BASELINE_DIR = Path(__file__).parent / "baselines"
+ALL_ROUTES = "ALL"
+
+_DB_ROUND_TRIPS = re.compile(r'db;dur=[\d.]+;desc="(\d+) round trips"')
+
+GIVEN_NAMES = ("Amira", "Omar", "Lena", "Jonas", "Sofia", "Yuki", "Mateo", "Chloe", "Ivan", "Nia")
+SURNAMES = ("Hassan", "Schmidt", "Rossi", "Tanaka", "Garcia", "Dubois", "Novak", "Okafor")
+
+
+@dataclass(slots=True)
+class RequestSpec:
+    """One HTTP request to send."""
+
+    method: str
+    url: str
+    params: dict[str, Any] | None = None
+    json: dict[str, Any] | None = None
+
+
+@dataclass(slots=True)
+class LoadState:
+    """Data shared by the requests of one run."""
+
+    rng: random.Random
+    hotel_code: str
+    hotel_id: str
+    # Reservations created during the run, used by updates and cancellations.
+    reservation_ids: list[str] = field(default_factory=list)
+
+    def stay(self) -> tuple[date, date]:
+        """
+        Pick a stay in the next months, mostly short.
+
+        :return: arrival and departure date.
+        """
+        arrival = date.today() + timedelta(days=self.rng.randint(1, 180))
+        nights = min(int(self.rng.expovariate(1 / 3)) + 1, 21)
+        return arrival, arrival + timedelta(days=nights)
+
+
+@dataclass(slots=True)
+class Scenario:
+    """Route of the request mix and its relative frequency."""
+
+    name: str
+    weight: int
+    build: Callable[[LoadState], RequestSpec]
+
+
+def _shop_hotels(state: LoadState) -> RequestSpec:
+    arrival, departure = state.stay()
+    return RequestSpec(
+        "GET",
+        "/api/shop/v1/hotels",
+        params={
+            "HotelCodes": state.hotel_code,
+            "ArrivalDate": arrival.isoformat(),
+            "DepartureDate": departure.isoformat(),
+            "Adults": state.rng.choice((1, 2, 2, 2, 3)),
+        },
+    )
+
+
+def _shop_offers(state: LoadState) -> RequestSpec:
+    arrival, departure = state.stay()
+    return RequestSpec(
+        "GET",
+        f"/api/shop/v1/hotels/{state.hotel_code}/offers",
+        params={
+            "ArrivalDate": arrival.isoformat(),
+            "DepartureDate": departure.isoformat(),
+            "Adults": state.rng.choice((1, 2, 2, 2, 3)),
+            "Children": state.rng.choice((0, 0, 0, 1, 2)),
+        },
+    )
+
+
+def _shop_offer(state: LoadState) -> RequestSpec:
+    arrival, departure = state.stay()
+    return RequestSpec(
+        "GET",
+        f"/api/shop/v1/hotels/{state.hotel_code}/offer",
+        params={
+            "ArrivalDate": arrival.isoformat(),
+            "DepartureDate": departure.isoformat(),
+            "RoomType": "CLSKG",
+            "RatePlanCode": "BAR",
+        },
+    )
+
+
+def _content_hotels(state: LoadState) -> RequestSpec:
+    return RequestSpec(
+        "GET",
+        "/api/content/v1/hotels",
+        params={"limit": 20, "offset": 0},
+    )
+
+
+def _content_hotel(state: LoadState) -> RequestSpec:
+    return RequestSpec("GET", f"/api/content/v1/hotels/{state.hotel_code}")
+
+
+def _content_room_types(state: LoadState) -> RequestSpec:
+    return RequestSpec("GET", f"/api/content/v1/hotels/{state.hotel_code}/roomTypes")
+
+
+def _inventory_statistics(state: LoadState) -> RequestSpec:
+    start = date.today() + timedelta(days=state.rng.randint(0, 60))
+    return RequestSpec(
+        "GET",
+        f"/api/inv/v1/hotels/{state.hotel_id}/inventoryStatistics",
+        params={
+            "dateRangeStart": start.isoformat(),
+            "dateRangeEnd": (start + timedelta(days=state.rng.choice((7, 14, 30)))).isoformat(),
+            "reportCode": "DetailedAvailabiltySummary",
+        },
+    )
+
+
+def _reservations(state: LoadState) -> RequestSpec:
+    params: dict[str, Any] = {"limit": 100}
+    if state.rng.random() < 0.5:
+        params["surname"] = state.rng.choice(SURNAMES)
+    return RequestSpec("GET", f"/api/rsv/v1/hotels/{state.hotel_id}/reservations", params=params)
+
+
+def _reservations_summary(state: LoadState) -> RequestSpec:
+    return RequestSpec("GET", f"/api/rsv/v1/hotels/{state.hotel_id}/reservations/summary")
+
+
+def _reservation_statistics(state: LoadState) -> RequestSpec:
+    start = date.today() - timedelta(days=30)
+    return RequestSpec(
+        "GET",
+        f"/api/rsv/v1/hotels/{state.hotel_id}/reservations/statistics",
+        params={"startDate": start.isoformat(), "endDate": date.today().isoformat()},
+    )
+
+
+def _reservation_body(state: LoadState) -> dict[str, Any]:
+    arrival, departure = state.stay()
+    adults = state.rng.choice((1, 2, 2, 2, 3))
+    return {
+        "reservations": {
+            "reservation": [
+                {
+                    "roomStay": {
+                        "arrivalDate": arrival.isoformat(),
+                        "departureDate": departure.isoformat(),
+                        "guestCounts": {"adults": adults, "children": 0},
+                        "roomRates": [{"roomType": "CLSKG", "ratePlanCode": "BAR"}],
+                    },
+                    "reservationGuests": [
+                        {
+                            "profileInfo": {
+                                "profile": {
+                                    "customer": {
+                                        "personName": [
+                                            {
+                                                "givenName": state.rng.choice(GIVEN_NAMES),
+                                                "surname": state.rng.choice(SURNAMES),
+                                            },
+                                        ],
+                                    },
+                                },
+                            },
+                        },
+                    ],
+                },
+            ],
+        },
+    }
+
+
+def _create_reservation(state: LoadState) -> RequestSpec:
+    return RequestSpec(
+        "POST",
+        f"/api/rsv/v1/hotels/{state.hotel_id}/reservations",
+        json=_reservation_body(state),
+    )
+
+
+def _update_reservation(state: LoadState) -> RequestSpec:
+    if not state.reservation_ids:
+        return _create_reservation(state)
+    reservation_id = state.rng.choice(state.reservation_ids)
+    return RequestSpec(
+        "PUT",
+        f"/api/rsv/v1/hotels/{state.hotel_id}/reservations/{reservation_id}",
+        json=_reservation_body(state),
+    )
+
+
+def _cancel_reservation(state: LoadState) -> RequestSpec:
+    if not state.reservation_ids:
+        return _create_reservation(state)
+    reservation_id = state.reservation_ids.pop(state.rng.randrange(len(state.reservation_ids)))
+    return RequestSpec(
+        "POST",
+        f"/api/rsv/v1/hotels/{state.hotel_id}/reservations/{reservation_id}/cancellations",
+        json={"reason": {"code": "CHANGE", "description": "Change of plans"}},
+    )
+
+
+# Roughly the mix seen from the partner portal: mostly shopping and content
+# reads, few writes.
+SCENARIOS = (
+    Scenario("GET /api/shop/v1/hotels", 10, _shop_hotels),
+    Scenario("GET /api/shop/v1/hotels/{hotelCode}/offers", 30, _shop_offers),
+    Scenario("GET /api/shop/v1/hotels/{hotelCode}/offer", 10, _shop_offer),
+    Scenario("GET /api/content/v1/hotels", 8, _content_hotels),
+    Scenario("GET /api/content/v1/hotels/{hotelCode}", 8, _content_hotel),
+    Scenario("GET /api/content/v1/hotels/{hotelCode}/roomTypes", 8, _content_room_types),
+    Scenario("GET /api/inv/v1/hotels/{hotelId}/inventoryStatistics", 6, _inventory_statistics),
+    Scenario("GET /api/rsv/v1/hotels/{hotelId}/reservations", 6, _reservations),
+    Scenario("GET /api/rsv/v1/hotels/{hotelId}/reservations/summary", 4, _reservations_summary),
+    Scenario(
+        "GET /api/rsv/v1/hotels/{hotelId}/reservations/statistics",
+        3,
+        _reservation_statistics,
+    ),
+    Scenario("POST /api/rsv/v1/hotels/{hotelId}/reservations", 4, _create_reservation),
+    Scenario(
+        "PUT /api/rsv/v1/hotels/{hotelId}/reservations/{reservationId}",
+        2,
+        _update_reservation,
+    ),
+    Scenario(
+        "POST /api/rsv/v1/hotels/{hotelId}/reservations/{reservationId}/cancellations",
+        1,
+        _cancel_reservation,
+    ),
+)
+
+
+@dataclass(slots=True)
+class _Samples:
+    durations: list[float] = field(default_factory=list)
+    round_trips: list[int] = field(default_factory=list)
+    errors: int = 0
+
+
+def _remember_reservation(state: LoadState, response: httpx.Response) -> None:
+    try:
+        reservation = response.json()["reservations"]["reservation"][0]
+        state.reservation_ids.append(reservation["reservationIdList"][0]["id"])
+    except (ValueError, KeyError, IndexError, TypeError):
+        return
+
+
+async def _send(
+    client: httpx.AsyncClient,
+    scenario: Scenario,
+    state: LoadState,
+    samples: dict[str, _Samples] | None,
+) -> None:
+    spec = scenario.build(state)
+    start = time.perf_counter()
+    try:
+        response = await client.request(spec.method, spec.url, params=spec.params, json=spec.json)
+    except httpx.HTTPError:
+        if samples is not None:
+            samples.setdefault(scenario.name, _Samples()).errors += 1
+        return
+    duration = time.perf_counter() - start
+
+    if spec.method == "POST" and spec.url.endswith("/reservations"):
+        _remember_reservation(state, response)
+    if samples is None:
+        return
+    case = samples.setdefault(scenario.name, _Samples())
+    if response.is_error:
+        case.errors += 1
+        return
+    case.durations.append(duration)
+    match = _DB_ROUND_TRIPS.search(response.headers.get("server-timing", ""))
+    if match:
+        case.round_trips.append(int(match.group(1)))
+
+
+async def _drive(
+    client: httpx.AsyncClient,
+    plan: Iterator[Scenario],
+    state: LoadState,
+    concurrency: int,
+    samples: dict[str, _Samples] | None,
+) -> None:
+    async def worker() -> None:
+        # All workers share the plan iterator, so every request runs once.
+        for scenario in plan:
+            await _send(client, scenario, state, samples)
+
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+
+
+async def run_load(
+    client: httpx.AsyncClient,
+    state: LoadState,
+    requests: int,
+    concurrency: int,
+    warmup: int,
+) -> dict[str, Summary]:
+    """
+    Send the request mix and summarize it per route.
+
+    :param client: client for the target.
+    :param state: shared run state, its random generator decides the mix.
+    :param requests: number of measured requests.
+    :param concurrency: number of requests in flight.
+    :param warmup: number of requests sent before measuring.
+    :return: summaries by route, plus one for all routes.
+    """
+    weights = [scenario.weight for scenario in SCENARIOS]
+    warmup_plan = state.rng.choices(SCENARIOS, weights=weights, k=warmup)
+    await _drive(client, iter(warmup_plan), state, concurrency, None)
+
+    plan = state.rng.choices(SCENARIOS, weights=weights, k=requests)
+    samples: dict[str, _Samples] = {}
+    start = time.perf_counter()
+    await _drive(client, iter(plan), state, concurrency, samples)
+    elapsed = time.perf_counter() - start
+
+    summaries = {
+        scenario.name: summarize(
+            scenario.name,
+            case.durations,
+            elapsed,
+            case.errors,
+            case.round_trips,
+        )
+        for scenario in SCENARIOS
+        if (case := samples.get(scenario.name)) is not None
+    }
+    summaries[ALL_ROUTES] = summarize(
+        ALL_ROUTES,
+        [duration for case in samples.values() for duration in case.durations],
+        elapsed,
+        sum(case.errors for case in samples.values()),
+        [trips for case in samples.values() for trips in case.round_trips],
+    )
+    return summaries
+
+
+@asynccontextmanager
+async def open_client(url: str | None, concurrency: int) -> AsyncIterator[httpx.AsyncClient]:
+    """
+    Open a client for a running server or for the app in-process.
+
+    :param url: base URL of a running server, None to run the app in-process.
+    :param concurrency: number of requests in flight.
+    :yield: client.
+    """
+    headers = {"x-channelCode": "BENCH"}
+    if url is not None:
+        limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+        async with httpx.AsyncClient(
+            base_url=url,
+            headers=headers,
+            limits=limits,
+            timeout=30.0,
+        ) as client:
+            yield client
+        return
+
+    app = get_app()
+    async with (
+        app.router.lifespan_context(app),
+        httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app),
+            base_url="http://benchmark",
+            headers=headers,
+            timeout=30.0,
+        ) as client,
+    ):
+        yield client
+
+
+def _parse_args(argv: list[str] | None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--url", help="base URL of a running server (default: in-process)")
+    parser.add_argument("--requests", type=int, default=2000, help="measured requests")
+    parser.add_argument("--concurrency", type=int, default=16, help="requests in flight")
+    parser.add_argument("--warmup", type=int, default=200, help="requests before measuring")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the request mix")
+    parser.add_argument("--hotel-code", default="MOV_EG_001", help="hotel code of shop/content")
+    parser.add_argument("--hotel-id", default="MOVENPICK_ELGOUNA", help="hotel id of rsv/inv")
+    parser.add_argument("--baseline", type=Path, help="baseline file to compare with")
+    parser.add_argument("--save-baseline", action="store_true", help="write the baseline")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.2,
+        help="allowed relative regression against the baseline",
+    )
+    return parser.parse_args(argv)
+
+
+async def main(argv: list[str] | None = None) -> int:
+    """
+    Run the benchmark from the command line.
+
+    :param argv: command line arguments.
+    :return: exit code, 1 on errors or regressions.
+    """
+    args = _parse_args(argv)
+    target = "live" if args.url else "asgi"
+    baseline_path = args.baseline or BASELINE_DIR / f"http-{target}.json"
+    state = LoadState(random.Random(args.seed), args.hotel_code, args.hotel_id)  # noqa: S311
+
+    async with open_client(args.url, args.concurrency) as client:
+        summaries = await run_load(
+            client,
+            state,
+            args.requests,
+            args.concurrency,
+            args.warmup,
+        )
+
+    sys.stdout.write(format_table(summaries) + "\n")
+    if summaries[ALL_ROUTES].errors:
+        sys.stdout.write(f"\n{summaries[ALL_ROUTES].errors} requests failed\n")
+        return 1
+
+    if args.save_baseline:
+        save_baseline(
+            baseline_path,
+            summaries,
+            {
+                "target": args.url or "asgi",
+                "requests": args.requests,
+                "concurrency": args.concurrency,
+                "seed": args.seed,
+                "python": platform.python_version(),
+                "machine": platform.machine(),
+                "created": datetime.now(UTC).isoformat(),
+            },
+        )
+        sys.stdout.write(f"\nBaseline written to {baseline_path}\n")
+        return 0
+
+    if not baseline_path.exists():
+        sys.stdout.write(f"\nNo baseline at {baseline_path}, run with --save-baseline\n")
+        return 0
+    regressions = compare(summaries, load_baseline(baseline_path), args.tolerance)
+    for regression in regressions:
+        sys.stdout.write(f"REGRESSION {regression}\n")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -0,0 +1,331 @@
+"""
+Micro-benchmarks of the service layer on in-memory datasets.
+
+Calls the mapping code of ``ShopService``, ``ContentService``,
+``ReservationService._map_to_schema`` and ``InventoryService`` directly,
+without a database, on datasets 1x, 100x and 10,000x the size of the
+startup seed, and separately times serializing the resulting responses::
+
+    python -m benchmarks.services
+    python -m benchmarks.services --scales 1,100 --repeats 11
+    python -m benchmarks.services --save-baseline
+
+Methodology: each case is warmed up, then timed ``--repeats`` times with
+the garbage collector disabled. A repeat runs the case as many times as
+needed to last at least ``--min-time`` and reports the time per run, so
+fast cases are not dominated by timer resolution. The median (p50) is
+the number to compare.
+
+For stable numbers run on an otherwise idle machine, pin the process to
+one isolated core (``--cpu 3`` or ``taskset -c 3``), disable frequency
+scaling/turbo boost (``pyperf system tune`` does both) and only compare
+baselines recorded on the same machine. The 10,000x dataset holds about
+130,000 ORM objects and needs roughly 600 MB of memory.
+"""
+
+import argparse
+import asyncio
+import gc
+import inspect
+import os
+import platform
+import sys
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import UTC, date, datetime, timedelta
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, cast
+
+from pydantic import BaseModel
+
+from benchmarks.fixtures import Dataset, build_dataset
+from benchmarks.stats import Summary, compare, format_table, load_baseline, save_baseline, summarize
+from operaclone2.db.models.hotel import Hotel
+from operaclone2.services.content_service import ContentService
+from operaclone2.services.inventory_service import InventoryService
+from operaclone2.services.reservation_service import ReservationService
+from operaclone2.services.shop_service import ShopService
+from operaclone2.web.api.content.schema import PropertyInfoSummaryResponse, RoomTypesResponse
+from operaclone2.web.api.reservation.schema import ReservationCollection, ReservationListResponse
+
+if TYPE_CHECKING:
+    from operaclone2.db.dao.hotel_dao import HotelDAO
+    from operaclone2.db.dao.reservation_dao import ReservationDAO
+    from operaclone2.services.concurrency import ConcurrentQueries
+
+BASELINE_PATH = Path(__file__).parent / "baselines" / "services.json"
+ARRIVAL = date(2026, 6, 1)
+DEPARTURE = ARRIVAL + timedelta(days=3)
+
+
+@dataclass(slots=True)
+class Case:
+    """One benchmarked operation on one dataset."""
+
+    name: str
+    scale: int
+    # Number of domain objects handled by one run.
+    items: int
+    run: Callable[[], Any]
+
+    @property
+    def label(self) -> str:
+        """Case name with its scale."""
+        return f"{self.name}[{self.scale}x]"
+
+
+class FixtureHotelDAO:
+    """Read-only stand-in for ``HotelDAO`` serving a dataset."""
+
+    def __init__(self, dataset: Dataset) -> None:
+        self.hotels = {hotel.hotel_code: hotel for hotel in dataset.hotels}
+
+    async def get_hotels_by_codes(self, hotel_codes: list[str]) -> list[Hotel]:
+        """
+        Get hotels by codes.
+
+        :param hotel_codes: hotel codes.
+        :return: known hotels.
+        """
+        return [self.hotels[code] for code in hotel_codes if code in self.hotels]
+
+    async def get_hotel_by_code(self, hotel_code: str) -> Hotel | None:
+        """
+        Get a hotel by code.
+
+        :param hotel_code: hotel code.
+        :return: hotel or None.
+        """
+        return self.hotels.get(hotel_code)
+
+
+def _serialize(response: BaseModel) -> Callable[[], bytes]:
+    return lambda: response.model_dump_json().encode()
+
+
+async def build_cases(dataset: Dataset) -> list[Case]:
+    """
+    Build the mapping and serialization cases of a dataset.
+
+    :param dataset: dataset to run on.
+    :return: cases.
+    """
+    hotel_dao = cast("HotelDAO", FixtureHotelDAO(dataset))
+    shop = ShopService(queries=cast("ConcurrentQueries", None))
+    content = ContentService(queries=cast("ConcurrentQueries", None))
+    reservations = ReservationService(reservation_dao=cast("ReservationDAO", None))
+    inventory = InventoryService()
+    hotels = dataset.hotels
+    codes = [hotel.hotel_code for hotel in hotels]
+
+    async def search_properties() -> BaseModel:
+        return await shop._build_property_search(  # noqa: SLF001
+            hotel_dao,
+            codes,
+            ARRIVAL,
+            DEPARTURE,
+        )
+
+    async def property_offers() -> list[BaseModel]:
+        return [
+            await shop._build_property_offers(hotel_dao, code, ARRIVAL, DEPARTURE)  # noqa: SLF001
+            for code in codes
+        ]
+
+    def properties_summary() -> BaseModel:
+        snippets = [content.map_hotel_to_summary(hotel) for hotel in hotels]
+        return PropertyInfoSummaryResponse(hotels=snippets, count=len(snippets))
+
+    def property_details() -> list[BaseModel]:
+        return [content.map_hotel_to_detail(hotel) for hotel in hotels]
+
+    def room_types() -> BaseModel:
+        return RoomTypesResponse(
+            roomTypes=[
+                content._map_room_type(room_type, include_amenities=True)  # noqa: SLF001
+                for room_type in dataset.room_types
+            ],
+        )
+
+    def map_reservations() -> BaseModel:
+        return ReservationListResponse(
+            reservations=ReservationCollection(
+                reservation=[
+                    reservations._map_to_schema(model)  # noqa: SLF001
+                    for model in dataset.reservations
+                ],
+            ),
+        )
+
+    def inventory_statistics() -> list[Any]:
+        return [
+            inventory.get_inventory_statistics(
+                hotel.hotel_id,
+                ARRIVAL,
+                ARRIVAL + timedelta(days=29),
+                "DetailedAvailabiltySummary",
+            )
+            for hotel in hotels
+        ]
+
+    scale = dataset.scale
+    cases = [
+        Case("shop.search_properties", scale, len(hotels), search_properties),
+        Case("shop.property_offers", scale, len(hotels), property_offers),
+        Case("content.properties_summary", scale, len(hotels), properties_summary),
+        Case("content.property_details", scale, len(hotels), property_details),
+        Case("content.room_types", scale, len(dataset.room_types), room_types),
+        Case("reservation.map_to_schema", scale, len(dataset.reservations), map_reservations),
+        Case("inventory.statistics", scale, len(hotels), inventory_statistics),
+    ]
+
+    # Serialization of every single-response case, on a response built once.
+    for case in list(cases):
+        result = case.run()
+        if inspect.isawaitable(result):
+            result = await result
+        if isinstance(result, BaseModel):
+            cases.append(
+                Case(f"{case.name}.serialize", scale, case.items, _serialize(result)),
+            )
+    return cases
+
+
+async def _call(run: Callable[[], Any]) -> None:
+    result = run()
+    if inspect.isawaitable(result):
+        await result
+
+
+async def measure(case: Case, warmup: int, repeats: int, min_time: float) -> list[float]:
+    """
+    Time a case.
+
+    :param case: case to time.
+    :param warmup: untimed runs before measuring.
+    :param repeats: number of timed repeats.
+    :param min_time: minimum duration of one repeat in seconds.
+    :return: duration of one run, for every repeat.
+    """
+    for _ in range(warmup):
+        await _call(case.run)
+
+    # Calibrate the number of runs per repeat, like timeit.autorange().
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            await _call(case.run)
+        if time.perf_counter() - start >= min_time:
+            break
+        number *= 2
+
+    durations = []
+    gc.collect()
+    gc.disable()
+    try:
+        for _ in range(repeats):
+            start = time.perf_counter()
+            for _ in range(number):
+                await _call(case.run)
+            durations.append((time.perf_counter() - start) / number)
+    finally:
+        gc.enable()
+    return durations
+
+
+def format_scaling(summaries: dict[str, Summary], cases: list[Case]) -> str:
+    """
+    Render the p50 time per item of every case relative to its smallest scale.
+
+    A growth factor around 1 means the cost is linear in the data size.
+
+    :param summaries: summaries by case label.
+    :param cases: measured cases.
+    :return: table.
+    """
+    per_item: dict[str, list[tuple[int, float]]] = {}
+    for case in cases:
+        summary = summaries[case.label]
+        per_item.setdefault(case.name, []).append((case.scale, summary.p50 / max(case.items, 1)))
+
+    width = max((len(name) for name in per_item), default=4)
+    lines = [f"{'case':<{width}} {'scale':>7} {'us/item':>10} {'growth':>7}"]
+    for name, points in per_item.items():
+        base = points[0][1]
+        for scale, cost in points:
+            growth = cost / base if base else 0.0
+            lines.append(f"{name:<{width}} {scale:>6}x {cost * 1e6:>10.3f} {growth:>7.2f}")
+    return "\n".join(lines)
+
+
+def _parse_args(argv: list[str] | None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--scales", default="1,100,10000", help="comma separated multiples")
+    parser.add_argument("--repeats", type=int, default=7, help="timed repeats per case")
+    parser.add_argument("--warmup", type=int, default=2, help="untimed runs per case")
+    parser.add_argument("--min-time", type=float, default=0.05, help="seconds per repeat")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the datasets")
+    parser.add_argument("--cpu", type=int, help="pin the process to this CPU (Linux only)")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH, help="baseline file")
+    parser.add_argument("--save-baseline", action="store_true", help="write the baseline")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.1,
+        help="allowed relative regression against the baseline",
+    )
+    return parser.parse_args(argv)
+
+
+async def main(argv: list[str] | None = None) -> int:
+    """
+    Run the micro-benchmarks from the command line.
+
+    :param argv: command line arguments.
+    :return: exit code, 1 on regressions.
+    """
+    args = _parse_args(argv)
+    if args.cpu is not None:
+        os.sched_setaffinity(0, {args.cpu})
+
+    summaries: dict[str, Summary] = {}
+    measured: list[Case] = []
+    for scale in sorted(int(value) for value in args.scales.split(",")):
+        dataset = build_dataset(scale, args.seed)
+        for case in await build_cases(dataset):
+            durations = await measure(case, args.warmup, args.repeats, args.min_time)
+            summaries[case.label] = summarize(case.label, durations, sum(durations))
+            measured.append(case)
+        del dataset
+        gc.collect()
+
+    sys.stdout.write(format_table(summaries) + "\n\n" + format_scaling(summaries, measured) + "\n")
+
+    if args.save_baseline:
+        save_baseline(
+            args.baseline,
+            summaries,
+            {
+                "scales": args.scales,
+                "repeats": args.repeats,
+                "seed": args.seed,
+                "python": platform.python_version(),
+                "machine": platform.machine(),
+                "created": datetime.now(UTC).isoformat(),
+            },
+        )
+        sys.stdout.write(f"\nBaseline written to {args.baseline}\n")
+        return 0
+
+    if not args.baseline.exists():
+        return 0
+    regressions = compare(summaries, load_baseline(args.baseline), args.tolerance)
+    for regression in regressions:
+        sys.stdout.write(f"REGRESSION {regression}\n")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
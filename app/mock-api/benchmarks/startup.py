@@ -0,0 +1,226 @@
+"""
+Cold start profile of the mock API.
+
+Starts fresh interpreters with ``python -X importtime`` that import the
+application, build it with ``get_app()`` and serve one request through
+``httpx.ASGITransport``, then reports the time of every phase and the
+most expensive imports::
+
+    python -m benchmarks.startup
+    python -m benchmarks.startup --lazy-routers --repeats 9
+    python -m benchmarks.startup --path /api/content/v1/hotels --lifespan
+
+The lifespan (seeding, pool warmup) needs the database and only runs
+with ``--lifespan``. Phases are the median over ``--repeats`` runs, the
+import table comes from the last run.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+PROJECT_DIR = Path(__file__).parent.parent
+PHASES = ("interpreter", "import", "get_app", "lifespan", "first_request", "total")
+
+# Runs in the child interpreter, it must not import the benchmarks package.
+# httpx is imported before the clock starts, it is only the test client.
+CHILD = """
+import asyncio, json, sys, time
+import httpx
+start = time.perf_counter()
+from operaclone2.web.application import get_app
+imported = time.perf_counter()
+app = get_app()
+built = time.perf_counter()
+
+async def first_request():
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://startup") as client:
+        if {lifespan}:
+            async with app.router.lifespan_context(app):
+                started = time.perf_counter()
+                response = await client.get({path!r})
+        else:
+            started = time.perf_counter()
+            response = await client.get({path!r})
+    return started, response.status_code
+
+started, status = asyncio.run(first_request())
+served = time.perf_counter()
+json.dump(
+    {{
+        "import": imported - start,
+        "get_app": built - imported,
+        "lifespan": started - built,
+        "first_request": served - started,
+        "in_process": served - start,
+        "status": status,
+    }},
+    sys.stdout,
+)
+"""
+
+
+@dataclass(slots=True)
+class ImportRecord:
+    """One line of ``-X importtime``."""
+
+    module: str
+    self_us: int
+    cumulative_us: int
+
+
+def parse_importtime(output: str) -> list[ImportRecord]:
+    """
+    Parse the report of ``python -X importtime``.
+
+    :param output: stderr of the interpreter.
+    :return: one record per imported module.
+    """
+    records = []
+    for line in output.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, module = line.removeprefix("import time:").split("|")
+        records.append(ImportRecord(module.strip(), int(self_us), int(cumulative_us)))
+    return records
+
+
+def package_of(module: str) -> str:
+    """
+    Get the package an import is attributed to.
+
+    Third-party modules count towards their distribution, application
+    modules towards their API package or subpackage.
+
+    :param module: dotted module name.
+    :return: package name.
+    """
+    parts = module.split(".")
+    if parts[0] != "operaclone2":
+        return parts[0]
+    depth = 4 if parts[1:3] == ["web", "api"] else 2
+    return ".".join(parts[:depth])
+
+
+def imports_by_package(records: list[ImportRecord]) -> dict[str, int]:
+    """
+    Sum the self time of the imports by package.
+
+    :param records: parsed import times.
+    :return: microseconds by package, most expensive first.
+    """
+    totals: dict[str, int] = {}
+    for record in records:
+        package = package_of(record.module)
+        totals[package] = totals.get(package, 0) + record.self_us
+    return dict(sorted(totals.items(), key=lambda item: item[1], reverse=True))
+
+
+def run_child(path: str, lifespan: bool, lazy_routers: bool) -> tuple[dict[str, float], str]:
+    """
+    Measure one cold start in a fresh interpreter.
+
+    :param path: path of the first request.
+    :param lifespan: whether to run the lifespan before the request.
+    :param lazy_routers: value of ``OPERACLONE2_LAZY_ROUTERS``.
+    :return: phase durations in seconds, and the importtime report.
+    """
+    env = {
+        **os.environ,
+        "OPERACLONE2_LAZY_ROUTERS": str(lazy_routers).lower(),
+        "PYTHONPATH": str(PROJECT_DIR),
+    }
+    code = CHILD.format(path=path, lifespan=lifespan)
+    start = time.perf_counter()
+    completed = subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        env=env,
+        cwd=PROJECT_DIR,
+        check=True,
+    )
+    total = time.perf_counter() - start
+    result = json.loads(completed.stdout.splitlines()[-1])
+    if result.pop("status") >= 500:
+        raise RuntimeError(f"First request to {path} failed")
+    phases = {
+        "interpreter": total - result.pop("in_process"),
+        **result,
+        "total": total,
+    }
+    return phases, completed.stderr
+
+
+def format_report(
+    phases: dict[str, list[float]],
+    records: list[ImportRecord],
+    top: int,
+) -> str:
+    """
+    Render the phase timings and the most expensive imports.
+
+    :param phases: durations of every run by phase.
+    :param records: import times of one run.
+    :param top: number of modules and packages to list.
+    :return: report.
+    """
+    lines = [f"{'phase':<14} {'p50 ms':>9} {'min ms':>9}"]
+    for name in PHASES:
+        values = phases[name]
+        lines.append(
+            f"{name:<14} {statistics.median(values) * 1000:>9.1f} {min(values) * 1000:>9.1f}",
+        )
+
+    packages = list(imports_by_package(records).items())[:top]
+    width = max((len(name) for name, _ in packages), default=7)
+    lines += ["", f"{'package':<{width}} {'self ms':>9}"]
+    lines += [f"{name:<{width}} {total / 1000:>9.1f}" for name, total in packages]
+
+    slowest = sorted(records, key=lambda record: record.self_us, reverse=True)[:top]
+    width = max((len(record.module) for record in slowest), default=6)
+    lines += ["", f"{'module':<{width}} {'self ms':>9} {'cumul ms':>9}"]
+    for record in slowest:
+        self_ms, cumulative_ms = record.self_us / 1000, record.cumulative_us / 1000
+        lines.append(f"{record.module:<{width}} {self_ms:>9.1f} {cumulative_ms:>9.1f}")
+    return "\n".join(lines)
+
+
+def _parse_args(argv: list[str] | None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--path", default="/api/health", help="path of the first request")
+    parser.add_argument("--repeats", type=int, default=5, help="cold starts to measure")
+    parser.add_argument("--top", type=int, default=15, help="imports to list")
+    parser.add_argument("--lifespan", action="store_true", help="run the lifespan (needs the DB)")
+    parser.add_argument("--lazy-routers", action="store_true", help="load optional routers lazily")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """
+    Run the cold start profile from the command line.
+
+    :param argv: command line arguments.
+    :return: exit code.
+    """
+    args = _parse_args(argv)
+    phases: dict[str, list[float]] = {name: [] for name in PHASES}
+    importtime = ""
+    for _ in range(args.repeats):
+        run, importtime = run_child(args.path, args.lifespan, args.lazy_routers)
+        for name in PHASES:
+            phases[name].append(run[name])
+
+    sys.stdout.write(format_report(phases, parse_importtime(importtime), args.top) + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,149 @@
+"""Latency statistics and baseline comparison shared by the benchmarks."""
+
+import json
+import math
+from collections.abc import Mapping, Sequence
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+
+@dataclass(slots=True)
+class Summary:
+    """Aggregated results of one benchmark case, durations in seconds."""
+
+    name: str
+    count: int
+    errors: int
+    throughput: float
+    p50: float
+    p95: float
+    p99: float
+    # Mean number of database round trips per operation, if known.
+    db_round_trips: float | None = None
+
+
+def percentile(sorted_values: Sequence[float], q: float) -> float:
+    """
+    Get a percentile with the nearest-rank method.
+
+    :param sorted_values: values in ascending order.
+    :param q: percentile between 0 and 100.
+    :return: percentile value, 0 for no values.
+    """
+    if not sorted_values:
+        return 0.0
+    rank = max(math.ceil(q / 100 * len(sorted_values)), 1)
+    return sorted_values[rank - 1]
+
+
+def summarize(
+    name: str,
+    durations: Sequence[float],
+    elapsed: float,
+    errors: int = 0,
+    db_round_trips: Sequence[int] | None = None,
+) -> Summary:
+    """
+    Summarize the durations of one benchmark case.
+
+    :param name: case name.
+    :param durations: duration of every operation.
+    :param elapsed: wall-clock time of the whole run.
+    :param errors: number of failed operations.
+    :param db_round_trips: round trips of every operation, if known.
+    :return: summary.
+    """
+    ordered = sorted(durations)
+    return Summary(
+        name=name,
+        count=len(ordered),
+        errors=errors,
+        throughput=len(ordered) / elapsed if elapsed > 0 else 0.0,
+        p50=percentile(ordered, 50),
+        p95=percentile(ordered, 95),
+        p99=percentile(ordered, 99),
+        db_round_trips=sum(db_round_trips) / len(db_round_trips) if db_round_trips else None,
+    )
+
+
+def compare(
+    current: Mapping[str, Summary],
+    baseline: Mapping[str, Summary],
+    tolerance: float,
+) -> list[str]:
+    """
+    Find cases that got slower than their baseline.
+
+    p50, p95 and round trips may grow and throughput may drop by at most
+    ``tolerance`` (0.2 means 20%). p99 is reported but too noisy to gate on.
+
+    :param current: summaries of this run by case name.
+    :param baseline: summaries of the baseline by case name.
+    :param tolerance: allowed relative regression.
+    :return: one message per regression.
+    """
+    regressions = []
+    for name, before in baseline.items():
+        after = current.get(name)
+        if after is None:
+            continue
+        for metric in ("p50", "p95", "db_round_trips"):
+            old, new = getattr(before, metric), getattr(after, metric)
+            if old is not None and new is not None and new > old * (1 + tolerance):
+                regressions.append(f"{name}: {metric} {old:.4g} -> {new:.4g}")
+        if after.throughput < before.throughput * (1 - tolerance):
+            regressions.append(
+                f"{name}: throughput {before.throughput:.4g} -> {after.throughput:.4g}",
+            )
+    return regressions
+
+
+def save_baseline(path: Path, summaries: Mapping[str, Summary], metadata: dict[str, Any]) -> None:
+    """
+    Write summaries to a JSON baseline file.
+
+    :param path: baseline file.
+    :param summaries: summaries by case name.
+    :param metadata: description of the run (target, sizes, versions...).
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    document = {
+        "metadata": metadata,
+        "results": {name: asdict(summary) for name, summary in summaries.items()},
+    }
+    path.write_text(json.dumps(document, indent=2, sort_keys=True) + "\n")
+
+
+def load_baseline(path: Path) -> dict[str, Summary]:
+    """
+    Read summaries from a JSON baseline file.
+
+    :param path: baseline file.
+    :return: summaries by case name.
+    """
+    document = json.loads(path.read_text())
+    return {name: Summary(**result) for name, result in document["results"].items()}
+
+
+def format_table(summaries: Mapping[str, Summary]) -> str:
+    """
+    Render summaries as a text table, durations in milliseconds.
+
+    :param summaries: summaries by case name.
+    :return: table.
+    """
+    width = max((len(name) for name in summaries), default=4)
+    header = (
+        f"{'case':<{width}} {'count':>7} {'err':>5} {'ops/s':>9} "
+        f"{'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'db rt':>6}"
+    )
+    lines = [header, "-" * len(header)]
+    for summary in summaries.values():
+        round_trips = "" if summary.db_round_trips is None else f"{summary.db_round_trips:.1f}"
+        lines.append(
+            f"{summary.name:<{width}} {summary.count:>7} {summary.errors:>5} "
+            f"{summary.throughput:>9.1f} {summary.p50 * 1000:>9.2f} "
+            f"{summary.p95 * 1000:>9.2f} {summary.p99 * 1000:>9.2f} {round_trips:>6}",
+        )
+    return "\n".join(lines)
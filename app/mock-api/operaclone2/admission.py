@@ -0,0 +1,127 @@
+"""Load shedding of low-priority requests when the database falls behind."""
+
+import math
+import time
+
+from fastapi import HTTPException
+from starlette.types import Scope
+
+from operaclone2.metrics import Counter, registry
+from operaclone2.settings import settings
+
+# Weight of a new pool wait in the moving average.
+POOL_WAIT_WEIGHT = 0.2
+# Seconds after which the pool wait average loses half of its value when
+# no connection is checked out, so shedding stops once traffic is gone.
+POOL_WAIT_HALF_LIFE = 1.0
+
+admission_rejected = registry.register(
+    Counter(
+        "admission_rejected",
+        "Low-priority requests rejected with 503 by admission control, by reason.",
+        ("reason",),
+    ),
+)
+
+
+class DecayingAverage:
+    """
+    Exponential moving average that decays toward zero over time.
+
+    Every sample moves the average by ``weight``. Between samples the
+    average halves every ``half_life`` seconds.
+    """
+
+    def __init__(self, weight: float, half_life: float) -> None:
+        self.weight = weight
+        self.half_life = half_life
+        self._value = 0.0
+        self._updated = time.monotonic()
+
+    def value(self, now: float | None = None) -> float:
+        """
+        Get the current average.
+
+        :param now: ``time.monotonic()`` value, defaults to now.
+        :return: average.
+        """
+        elapsed = (time.monotonic() if now is None else now) - self._updated
+        return self._value * math.pow(0.5, max(elapsed, 0.0) / self.half_life)
+
+    def add(self, sample: float) -> None:
+        """
+        Add a sample.
+
+        :param sample: new value.
+        """
+        now = time.monotonic()
+        self._value = self.value(now) * (1 - self.weight) + sample * self.weight
+        self._updated = now
+
+
+class AdmissionController:
+    """
+    Tracks the load of a worker to decide whether to shed requests.
+
+    The worker is overloaded when it serves too many requests at once or
+    when getting a database session takes too long on average, waiting
+    for a slot of the fair scheduler or a pooled connection, see the
+    ``admission_*`` settings. A threshold of zero disables its check.
+    """
+
+    def __init__(self) -> None:
+        self.in_flight = 0
+        self.pool_wait = DecayingAverage(POOL_WAIT_WEIGHT, POOL_WAIT_HALF_LIFE)
+
+    def overload_reason(self) -> str | None:
+        """
+        Check the thresholds.
+
+        :return: ``in_flight`` or ``pool_wait`` when overloaded, else None.
+        """
+        max_in_flight = settings.admission_max_in_flight
+        if max_in_flight and self.in_flight >= max_in_flight:
+            return "in_flight"
+        max_pool_wait = settings.admission_max_pool_wait_ms / 1000
+        if max_pool_wait and self.pool_wait.value() >= max_pool_wait:
+            return "pool_wait"
+        return None
+
+
+admission_controller = AdmissionController()
+
+
+def is_low_priority(scope: Scope) -> bool:
+    """
+    Check whether a request may be shed under load.
+
+    :param scope: ASGI scope.
+    :return: whether its path starts with one of ``admission_low_priority_paths``.
+    """
+    path: str = scope["path"]
+    return path.startswith(tuple(settings.admission_low_priority_paths))
+
+
+def check_admission(scope: Scope) -> None:
+    """
+    Reject a low-priority request about to use the database while overloaded.
+
+    Search and content requests get a 503 with ``Retry-After`` so that
+    the database capacity left goes to reservation writes, which are
+    always admitted. The check runs when a request opens its database
+    session, so requests answered from caches are never shed.
+
+    :param scope: ASGI scope of the request.
+    :raises HTTPException: 503 when the worker is overloaded.
+    """
+    if not is_low_priority(scope):
+        return
+    reason = admission_controller.overload_reason()
+    if reason is None:
+        return
+    admission_rejected.inc(reason)
+    raise HTTPException(
+        status_code=503,
+        detail="Server is overloaded, retry later",
+        headers={"Retry-After": str(settings.admission_retry_after_seconds)},
+    )
@@ -0,0 +1,69 @@
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+
+
+class TTLCache[K: Hashable, V]:
+    """
+    Bounded in-memory LRU cache with per-entry expiration.
+
+    Entries are evicted lazily: expired items are dropped when they are
+    read, and the least recently used item is dropped when the cache is full.
+    The cache is local to the worker process and is not thread-safe;
+    it is meant to be used from the event loop only.
+    """
+
+    def __init__(self, ttl: float, maxsize: int) -> None:
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._data: OrderedDict[K, tuple[float, V]] = OrderedDict()
+
+    def get(self, key: K) -> V | None:
+        """
+        Get a value if it is present and not expired.
+
+        :param key: cache key.
+        :return: cached value or None.
+        """
+        item = self._data.get(key)
+        if item is None:
+            return None
+        expires_at, value = item
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: K, value: V, ttl: float | None = None) -> None:
+        """
+        Store a value.
+
+        :param key: cache key.
+        :param value: value to store.
+        :param ttl: entry lifetime in seconds, defaults to the cache TTL.
+        """
+        lifetime = self.ttl if ttl is None else ttl
+        if lifetime <= 0:
+            return
+        self._data[key] = (time.monotonic() + lifetime, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def pop(self, key: K) -> V | None:
+        """
+        Remove a value from the cache.
+
+        :param key: cache key.
+        :return: removed value or None.
+        """
+        item = self._data.pop(key, None)
+        return item[1] if item else None
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
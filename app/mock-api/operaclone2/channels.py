@@ -0,0 +1,48 @@
+"""Distribution channels of requests, identified by the ``x-channelCode`` header."""
+
+from collections.abc import Container
+
+from starlette.types import Scope
+
+from operaclone2.settings import settings
+
+MAX_CHANNEL_LENGTH = 32
+# Metric label shared by all channels that are not known.
+OTHER_CHANNEL = "other"
+
+
+def channel_code(scope: Scope) -> str:
+    """
+    Get the ``x-channelCode`` header of a request.
+
+    :param scope: ASGI scope.
+    :return: channel code, empty if missing.
+    """
+    headers: list[tuple[bytes, bytes]] = scope["headers"]
+    for name, value in headers:
+        if name == b"x-channelcode":
+            return value.decode("latin-1")[:MAX_CHANNEL_LENGTH]
+    return ""
+
+
+def channel_label(channel: str, known: Container[str]) -> str:
+    """
+    Get the metric label of a channel.
+
+    Channel codes come from clients, so only known channels get a label
+    of their own: any other value would add series without bound.
+
+    :param channel: channel code, empty if missing.
+    :param known: channels labelled by name.
+    :return: channel code, or ``OTHER_CHANNEL`` for unknown channels.
+    """
+    return channel if not channel or channel in known else OTHER_CHANNEL
+
+
+def known_channels() -> set[str]:
+    """
+    Get the channels labelled by name in metrics.
+
+    :return: channels of ``metric_channels``, ``db_channel_weights`` and ``db_channel_limits``.
+    """
+    return {*settings.metric_channels, *settings.db_channel_weights, *settings.db_channel_limits}
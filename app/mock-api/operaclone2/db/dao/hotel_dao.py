@@ -1,16 +1,21 @@
 from typing import Any
 
 from fastapi import Depends
-from sqlalchemy import func, select
+from sqlalchemy import Select, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from operaclone2.db.dao.memo import current_memo, memoized
 from operaclone2.db.dependencies import get_db_session
 from operaclone2.db.models.hotel import Hotel
 from operaclone2.db.models.room_type import RoomType
 
 
 class HotelDAO:
-    """Class for accessing hotel table."""
+    """
+    Class for accessing hotel table.
+
+    Reads are memoized per request, see ``DAOMemo``.
+    """
 
     def __init__(self, session: AsyncSession = Depends(get_db_session)) -> None:
         self.session = session
@@ -22,7 +27,11 @@ class HotelDAO:
         :param kargs: fields of a hotel.
         """
         self.session.add(Hotel(**kargs))
+        memo = current_memo()
+        if memo is not None:
+            memo.clear()
 
+    @memoized
     async def get_hotel_by_code(self, hotel_code: str) -> Hotel | None:
         """
         Get hotel by its code.
@@ -35,6 +44,7 @@ class HotelDAO:
         )
         return raw_hotel.scalars().first()
 
+    @memoized
     async def get_hotels_by_codes(self, hotel_codes: list[str]) -> list[Hotel]:
         """
         Get hotels by their codes.
@@ -47,6 +57,7 @@ class HotelDAO:
         )
         return list(raw_hotels.scalars().fetchall())
 
+    @memoized
     async def get_all_hotels(self, limit: int, offset: int) -> list[Hotel]:
         """
         Get all hotels with limit/offset pagination.
@@ -61,6 +72,7 @@ class HotelDAO:
 
         return list(raw_hotels.scalars().fetchall())
 
+    @memoized
     async def total_properties_count(self) -> int:
         """
         Get total count of properties.
@@ -70,6 +82,48 @@ class HotelDAO:
         total_count = await self.session.scalar(select(func.count()).select_from(Hotel))
         return total_count or 0
 
+    @memoized
+    async def get_room_types_page(
+        self,
+        hotel_code: str,
+        limit: int,
+        offset: int,
+        room_type_filter: str | None = None,
+    ) -> list[RoomType]:
+        """
+        Get one page of room types of a hotel.
+
+        :param hotel_code: Hotel code filter.
+        :param limit: Page limit.
+        :param offset: Page offset.
+        :param room_type_filter: Room type string filter.
+        :return: List of room types.
+        """
+        query = self._room_types_query(hotel_code, room_type_filter).limit(limit).offset(offset)
+
+        # If we weren't storing amenities in JSON, we'd join here.
+        # Since it's JSON, we just fetch normally.
+
+        result = await self.session.execute(query)
+        return list(result.scalars().fetchall())
+
+    @memoized
+    async def count_room_types(
+        self,
+        hotel_code: str,
+        room_type_filter: str | None = None,
+    ) -> int:
+        """
+        Count room types of a hotel.
+
+        :param hotel_code: Hotel code filter.
+        :param room_type_filter: Room type string filter.
+        :return: Total count.
+        """
+        query = self._room_types_query(hotel_code, room_type_filter)
+        total_count = await self.session.scalar(select(func.count()).select_from(query.subquery()))
+        return total_count or 0
+
     async def get_room_types_by_hotel(
         self,
         hotel_code: str,
@@ -87,20 +141,13 @@ class HotelDAO:
         :param room_type_filter: Room type string filter.
         :return: List of room types and total count.
         """
-        query = select(RoomType).join(Hotel).where(Hotel.hotel_code == hotel_code)
+        total_count = await self.count_room_types(hotel_code, room_type_filter)
+        room_types = await self.get_room_types_page(hotel_code, limit, offset, room_type_filter)
+        return room_types, total_count
 
+    @staticmethod
+    def _room_types_query(hotel_code: str, room_type_filter: str | None) -> Select[tuple[RoomType]]:
+        query = select(RoomType).join(Hotel).where(Hotel.hotel_code == hotel_code)
         if room_type_filter:
             query = query.where(RoomType.room_type == room_type_filter)
-
-        # Count query
-        count_query = select(func.count()).select_from(query.subquery())
-        total_count = await self.session.scalar(count_query)
-
-        # Paginated results
-        query = query.limit(limit).offset(offset)
-
-        # If we weren't storing amenities in JSON, we'd join here.
-        # Since it's JSON, we just fetch normally.
-
-        result = await self.session.execute(query)
-        return list(result.scalars().fetchall()), total_count or 0
+        return query
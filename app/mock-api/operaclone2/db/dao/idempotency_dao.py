@@ -0,0 +1,104 @@
+from datetime import datetime
+from typing import Any
+
+from fastapi import Depends
+from sqlalchemy import delete, null, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from operaclone2.db.dependencies import get_db_session
+from operaclone2.db.models.idempotency_key import IdempotencyKeyModel
+
+
+class IdempotencyDAO:
+    """DAO for stored idempotent responses."""
+
+    def __init__(self, session: AsyncSession = Depends(get_db_session)) -> None:
+        self.session = session
+
+    async def get_by_key(self, idempotency_key: str) -> IdempotencyKeyModel | None:
+        """
+        Get a non-expired stored response by its key.
+
+        :param idempotency_key: value of the Idempotency-Key header.
+        :return: stored response or None.
+        """
+        query = select(IdempotencyKeyModel).where(
+            IdempotencyKeyModel.idempotency_key == idempotency_key,
+            IdempotencyKeyModel.expire_date_time > datetime.now(),
+        )
+        result = await self.session.execute(query)
+        return result.scalars().first()
+
+    async def claim(
+        self,
+        idempotency_key: str,
+        request_hash: str,
+        expire_date_time: datetime,
+    ) -> bool:
+        """
+        Reserve a key for the current transaction, without a response yet.
+
+        An expired row with the same key is taken over, a live one is kept.
+        A concurrent claim of the key waits until the transaction holding
+        it ends, so only one request per key runs at a time, on any worker.
+
+        :param idempotency_key: value of the Idempotency-Key header.
+        :param request_hash: fingerprint of the request.
+        :param expire_date_time: moment after which the key may be reused.
+        :return: whether the key was claimed, False if a live row holds it.
+        """
+        stmt = insert(IdempotencyKeyModel).values(
+            idempotency_key=idempotency_key,
+            request_hash=request_hash,
+            response_body=null(),
+            create_date_time=datetime.now(),
+            expire_date_time=expire_date_time,
+        )
+        claim = stmt.on_conflict_do_update(
+            index_elements=[IdempotencyKeyModel.idempotency_key],
+            set_={
+                "request_hash": stmt.excluded.request_hash,
+                "response_body": null(),
+                "create_date_time": stmt.excluded.create_date_time,
+                "expire_date_time": stmt.excluded.expire_date_time,
+            },
+            where=IdempotencyKeyModel.expire_date_time <= datetime.now(),
+        ).returning(IdempotencyKeyModel.id)
+        result = await self.session.execute(claim)
+        return result.first() is not None
+
+    async def complete(self, idempotency_key: str, response_body: dict[str, Any]) -> None:
+        """
+        Store the response of a claimed key, committed by the caller.
+
+        :param idempotency_key: key claimed in the current transaction.
+        :param response_body: JSON-serializable response.
+        """
+        await self.session.execute(
+            update(IdempotencyKeyModel)
+            .where(IdempotencyKeyModel.idempotency_key == idempotency_key)
+            .values(response_body=response_body),
+        )
+
+    async def commit(self) -> None:
+        """Commit the write and the stored response together."""
+        await self.session.commit()
+
+    async def rollback(self) -> None:
+        """Drop the claim and the write of a failed request."""
+        await self.session.rollback()
+
+    async def delete_expired(self) -> int:
+        """
+        Delete all expired keys.
+
+        :return: number of deleted rows.
+        """
+        result = await self.session.execute(
+            delete(IdempotencyKeyModel).where(
+                IdempotencyKeyModel.expire_date_time <= datetime.now(),
+            ),
+        )
+        await self.session.commit()
+        return result.rowcount  # type: ignore[attr-defined,no-any-return]
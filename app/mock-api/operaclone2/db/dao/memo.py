@@ -0,0 +1,126 @@
+import asyncio
+import functools
+import logging
+from collections.abc import Awaitable, Callable, Coroutine, Hashable
+from contextvars import ContextVar
+from typing import Any, Concatenate
+
+logger = logging.getLogger(__name__)
+
+
+class DAOMemo:
+    """
+    Request-scoped identity map for DAO reads.
+
+    Identical reads issued during one request are executed once. A read
+    that is already in flight is awaited by every caller instead of being
+    started again.
+
+    Results are shared between callers and may have been loaded by another
+    session (see ``ConcurrentQueries``), so memoized methods must return
+    objects that are only read, never modified or lazy-loaded.
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[Hashable, asyncio.Future[Any]] = {}
+        self.calls = 0
+        self.duplicates = 0
+
+    async def get_or_run[T](self, key: Hashable, factory: Callable[[], Awaitable[T]]) -> T:
+        """
+        Return the memoized result for a key, running the factory only once.
+
+        :param key: identity of the read.
+        :param factory: callable performing the read.
+        :return: read result.
+        """
+        self.calls += 1
+        future = self._entries.get(key)
+        if future is not None:
+            self.duplicates += 1
+            logger.debug("Duplicate DAO read served from request memo: %s", key)
+            # A cancelled waiter must not cancel the read for everyone else.
+            return await asyncio.shield(future)  # type: ignore[no-any-return]
+
+        future = asyncio.get_running_loop().create_future()
+        self._entries[key] = future
+        try:
+            result = await factory()
+        except asyncio.CancelledError:
+            del self._entries[key]
+            future.cancel()
+            raise
+        except BaseException as exc:
+            del self._entries[key]
+            future.set_exception(exc)
+            # Mark the exception as retrieved when nobody else is waiting.
+            future.exception()
+            raise
+        future.set_result(result)
+        return result
+
+    def clear(self) -> None:
+        """Forget all memoized reads, e.g. after a write."""
+        self._entries.clear()
+
+
+_current_memo: ContextVar[DAOMemo | None] = ContextVar("dao_memo", default=None)
+
+
+def current_memo() -> DAOMemo | None:
+    """
+    Get the memo of the current request.
+
+    :return: memo or None outside of a request.
+    """
+    return _current_memo.get()
+
+
+def activate_memo() -> tuple[DAOMemo, Any]:
+    """
+    Start a new memo for the current context.
+
+    :return: memo and the token to pass to ``deactivate_memo``.
+    """
+    memo = DAOMemo()
+    return memo, _current_memo.set(memo)
+
+
+def deactivate_memo(token: Any) -> None:
+    """
+    Restore the memo that was active before ``activate_memo``.
+
+    :param token: token returned by ``activate_memo``.
+    """
+    _current_memo.reset(token)
+
+
+def _freeze(value: Any) -> Hashable:
+    if isinstance(value, list | tuple | set | frozenset):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    return value  # type: ignore[no-any-return]
+
+
+def memoized[DAOT, **P, T](
+    method: Callable[Concatenate[DAOT, P], Coroutine[Any, Any, T]],
+) -> Callable[Concatenate[DAOT, P], Coroutine[Any, Any, T]]:
+    """
+    Memoize a read-only DAO method for the duration of a request.
+
+    Outside of a request the method is called directly.
+
+    :param method: DAO method to wrap.
+    :return: wrapped method.
+    """
+
+    @functools.wraps(method)
+    async def wrapper(dao: DAOT, /, *args: P.args, **kwargs: P.kwargs) -> T:
+        memo = _current_memo.get()
+        if memo is None:
+            return await method(dao, *args, **kwargs)
+        key = (method.__qualname__, _freeze(args), _freeze(kwargs))
+        return await memo.get_or_run(key, lambda: method(dao, *args, **kwargs))
+
+    return wrapper
@@ -6,7 +6,16 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from operaclone2.db.dependencies import get_db_session
-from operaclone2.db.models.reservation import ReservationModel
+from operaclone2.db.id_allocator import BlockIdAllocator
+from operaclone2.db.models.reservation import (
+    ReservationModel,
+    confirmation_number_seq,
+    reservation_id_seq,
+)
+
+# Per-worker allocators, shared by all requests of the process.
+_reservation_ids = BlockIdAllocator(reservation_id_seq)
+_confirmation_numbers = BlockIdAllocator(confirmation_number_seq)
 
 
 class ReservationDAO:
@@ -15,11 +24,19 @@ class ReservationDAO:
     def __init__(self, session: AsyncSession = Depends(get_db_session)) -> None:
         self.session = session
 
+    async def next_reservation_id(self) -> str:
+        """Allocate a new OPERA reservation ID."""
+        return str(await _reservation_ids.next_id(self.session))
+
+    async def next_confirmation_number(self) -> str:
+        """Allocate a new confirmation number."""
+        return str(await _confirmation_numbers.next_id(self.session))
+
     async def create_reservation(self, **kwargs: Any) -> ReservationModel:
-        """Create a new reservation in the database."""
+        """Create a new reservation in the database, committed by the caller."""
         reservation = ReservationModel(**kwargs)
         self.session.add(reservation)
-        await self.session.commit()
+        await self.session.flush()
         await self.session.refresh(reservation)
         return reservation
 
@@ -32,7 +49,7 @@ class ReservationDAO:
     async def update_reservation(
         self, reservation_id: str, **kwargs: Any
     ) -> ReservationModel | None:
-        """Update an existing reservation."""
+        """Update an existing reservation, committed by the caller."""
         reservation = await self.get_reservation_by_id(reservation_id)
         if not reservation:
             return None
@@ -40,7 +57,7 @@ class ReservationDAO:
         for key, value in kwargs.items():
             setattr(reservation, key, value)
 
-        await self.session.commit()
+        await self.session.flush()
         await self.session.refresh(reservation)
         return reservation
 
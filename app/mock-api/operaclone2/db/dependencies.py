@@ -1,8 +1,42 @@
-from collections.abc import AsyncGenerator
+import asyncio
+from collections.abc import AsyncGenerator, AsyncIterator, Callable
+from contextlib import AbstractAsyncContextManager, AsyncExitStack, asynccontextmanager, nullcontext
+from functools import partial
+from typing import Self
 
 from sqlalchemy.ext.asyncio import AsyncSession
 from starlette.requests import Request
 
+from operaclone2.admission import check_admission
+from operaclone2.channels import channel_code
+
+
+@asynccontextmanager
+async def open_db_session(request: Request) -> AsyncIterator[AsyncSession]:
+    """
+    Open the database session of a request.
+
+    The session waits for a slot of the fair scheduler of its
+    ``x-channelCode``, when the application has one. Low-priority requests
+    are shed here while the worker is overloaded, see ``check_admission``.
+
+    :param request: current request.
+    :yield: database session, committed and closed on exit.
+    """
+    check_admission(request.scope)
+    scheduler = getattr(request.app.state, "db_scheduler", None)
+    slot: AbstractAsyncContextManager[None] = (
+        scheduler.slot(channel_code(request.scope)) if scheduler is not None else nullcontext()
+    )
+    async with slot:
+        session: AsyncSession = request.app.state.db_session_factory()
+
+        try:
+            yield session
+        finally:
+            await session.commit()
+            await session.close()
+
 
 async def get_db_session(request: Request) -> AsyncGenerator[AsyncSession]:
     """
@@ -11,10 +45,66 @@ async def get_db_session(request: Request) -> AsyncGenerator[AsyncSession]:
     :param request: current request.
     :yield: database session.
     """
-    session: AsyncSession = request.app.state.db_session_factory()
+    async with open_db_session(request) as session:
+        yield session
+
 
+class LazySession:
+    """
+    Database session opened on first use.
+
+    Requests answered from caches never use it, so they neither wait for
+    a scheduler slot nor take a pooled connection.
+    """
+
+    def __init__(
+        self, open_session: Callable[[], AbstractAsyncContextManager[AsyncSession]]
+    ) -> None:
+        self._open_session = open_session
+        self._session: AsyncSession | None = None
+        self._stack = AsyncExitStack()
+        self._lock = asyncio.Lock()
+
+    @classmethod
+    def of(cls, session: AsyncSession) -> Self:
+        """
+        Wrap a session that is already open.
+
+        :param session: session, closed by its owner.
+        :return: lazy session returning it.
+        """
+        return cls(lambda: nullcontext(session))
+
+    @property
+    def opened(self) -> bool:
+        """Whether the session was used."""
+        return self._session is not None
+
+    async def get(self) -> AsyncSession:
+        """
+        Get the session, opening it on the first call.
+
+        :return: database session.
+        """
+        async with self._lock:
+            if self._session is None:
+                self._session = await self._stack.enter_async_context(self._open_session())
+            return self._session
+
+    async def close(self) -> None:
+        """Close the session, if it was opened."""
+        await self._stack.aclose()
+
+
+async def get_lazy_db_session(request: Request) -> AsyncGenerator[LazySession]:
+    """
+    Get a database session opened on first use, see ``LazySession``.
+
+    :param request: current request.
+    :yield: lazy database session.
+    """
+    session = LazySession(partial(open_db_session, request))
     try:
         yield session
     finally:
-        await session.commit()
         await session.close()
@@ -0,0 +1,44 @@
+import asyncio
+
+from sqlalchemy import Sequence, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+class BlockIdAllocator:
+    """
+    Hands out numeric IDs from ranges reserved on a Postgres sequence.
+
+    The sequence must be created with ``INCREMENT BY`` equal to the block
+    size. Each ``nextval`` call then reserves a whole block for this worker,
+    which is handed out locally, so only one create out of ``block_size``
+    pays a database round trip. Values are unique across workers and
+    increase monotonically within a worker, keeping B-tree inserts on the
+    right-most pages.
+    """
+
+    def __init__(self, sequence: Sequence) -> None:
+        if not sequence.increment or sequence.increment < 1:
+            raise ValueError(f"Sequence {sequence.name} must have a positive increment")
+        self.sequence = sequence
+        self.block_size = sequence.increment
+        self._next = 0
+        self._end = 0
+        self._lock = asyncio.Lock()
+
+    async def next_id(self, session: AsyncSession) -> int:
+        """
+        Get the next ID, reserving a new block when the current one is used up.
+
+        :param session: session used to reserve a block.
+        :return: allocated ID.
+        """
+        async with self._lock:
+            if self._next >= self._end:
+                start = await session.scalar(select(self.sequence.next_value()))
+                if start is None:
+                    raise RuntimeError(f"Sequence {self.sequence.name} returned no value")
+                self._next = start
+                self._end = start + self.block_size
+            value = self._next
+            self._next += 1
+            return value
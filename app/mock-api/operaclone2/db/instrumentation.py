@@ -0,0 +1,197 @@
+"""SQL statement timing based on SQLAlchemy cursor events."""
+
+import functools
+import hashlib
+import logging
+import re
+import time
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from operaclone2.metrics import Histogram, registry
+from operaclone2.settings import settings
+from operaclone2.timing import current_timing
+
+logger = logging.getLogger(__name__)
+
+# Shapes beyond this number are aggregated under OTHER_STATEMENT.
+MAX_TRACKED_STATEMENTS = 1_000
+OTHER_STATEMENT = "<other>"
+
+_WHITESPACE = re.compile(r"\s+")
+_STRINGS = re.compile(r"'(?:[^']|'')*'")
+_PARAMS = re.compile(r"\$\d+|%\(\w+\)s|%s")
+_NUMBERS = re.compile(r"\b\d+(?:\.\d+)?\b")
+_IN_LISTS = re.compile(r"\(\s*\?(?:::\w+)?(?:\s*,\s*\?(?:::\w+)?)+\s*\)")
+
+statement_duration = registry.register(
+    Histogram(
+        "db_statement_duration_seconds",
+        "SQL statement latency by statement fingerprint, see /api/debug/queries.",
+        ("statement",),
+    ),
+)
+
+
+@dataclass(slots=True)
+class StatementStats:
+    """Aggregated timings of one statement shape."""
+
+    statement: str
+    fingerprint: str
+    count: int = 0
+    total: float = 0.0
+    max: float = 0.0
+
+    @property
+    def mean(self) -> float:
+        """Average duration in seconds."""
+        return self.total / self.count if self.count else 0.0
+
+
+_stats: dict[str, StatementStats] = {}
+
+
+@functools.lru_cache(maxsize=2048)
+def normalize_statement(statement: str) -> str:
+    """
+    Reduce a statement to its shape.
+
+    Literals and bound parameters become ``?`` and IN-lists collapse
+    to a single ``(?, ...)`` so that statements differing only in
+    values share one shape.
+
+    :param statement: SQL text.
+    :return: normalized SQL.
+    """
+    shape = _WHITESPACE.sub(" ", statement).strip()
+    shape = _STRINGS.sub("?", shape)
+    shape = _PARAMS.sub("?", shape)
+    shape = _NUMBERS.sub("?", shape)
+    return _IN_LISTS.sub("(?, ...)", shape)
+
+
+def fingerprint(shape: str) -> str:
+    """
+    Get a short stable identifier of a statement shape.
+
+    :param shape: normalized SQL.
+    :return: 12 hex characters.
+    """
+    return hashlib.sha1(shape.encode(), usedforsecurity=False).hexdigest()[:12]
+
+
+def redact_parameters(parameters: Any) -> Any:
+    """
+    Replace bound parameter values with their type names.
+
+    :param parameters: DBAPI parameters (sequence, mapping or list of them).
+    :return: the same structure without values.
+    """
+    if isinstance(parameters, dict):
+        return {key: redact_parameters(value) for key, value in parameters.items()}
+    if isinstance(parameters, list | tuple):
+        return type(parameters)(redact_parameters(value) for value in parameters)
+    if parameters is None:
+        return None
+    return f"<{type(parameters).__name__}>"
+
+
+def record_statement(statement: str, duration: float, parameters: Any = None) -> StatementStats:
+    """
+    Record one executed statement.
+
+    :param statement: SQL text as sent to the driver.
+    :param duration: execution time in seconds.
+    :param parameters: bound parameters, only used for the slow query log.
+    :return: stats of the statement shape.
+    """
+    shape = normalize_statement(statement)
+    stats = _stats.get(shape)
+    if stats is None:
+        if len(_stats) >= MAX_TRACKED_STATEMENTS:
+            shape = OTHER_STATEMENT
+            stats = _stats.get(shape)
+        if stats is None:
+            stats = _stats[shape] = StatementStats(statement=shape, fingerprint=fingerprint(shape))
+
+    stats.count += 1
+    stats.total += duration
+    stats.max = max(stats.max, duration)
+    statement_duration.observe(duration, stats.fingerprint)
+
+    if duration * 1000 >= settings.db_slow_query_ms:
+        logger.warning(
+            "Slow query took %.1f ms: %s; parameters: %s",
+            duration * 1000,
+            shape,
+            redact_parameters(parameters),
+        )
+    return stats
+
+
+def slowest_statements(limit: int, order_by: str = "max") -> list[StatementStats]:
+    """
+    Get the statement shapes with the highest latency.
+
+    :param limit: number of shapes to return.
+    :param order_by: ``max``, ``mean``, ``total`` or ``count``.
+    :return: statement stats, slowest first.
+    """
+    return sorted(_stats.values(), key=lambda stats: getattr(stats, order_by), reverse=True)[:limit]
+
+
+def reset_statistics() -> None:
+    """Forget all recorded statements."""
+    _stats.clear()
+
+
+def _before_cursor_execute(
+    conn: Connection,
+    cursor: Any,
+    statement: str,
+    parameters: Any,
+    context: Any,
+    executemany: bool,
+) -> None:
+    conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(
+    conn: Connection,
+    cursor: Any,
+    statement: str,
+    parameters: Any,
+    context: Any,
+    executemany: bool,
+) -> None:
+    duration = time.perf_counter() - conn.info["query_start_time"].pop()
+    record_statement(statement, duration, parameters)
+    timing = current_timing()
+    if timing is not None:
+        timing.add_db(duration)
+
+
+def _handle_error(context: Any) -> None:
+    # A failed statement never reaches after_cursor_execute.
+    conn = context.connection
+    if conn is not None and conn.info.get("query_start_time"):
+        conn.info["query_start_time"].pop()
+
+
+def instrument_engine(engine: AsyncEngine | Engine) -> None:
+    """
+    Time every statement executed by an engine.
+
+    :param engine: engine to instrument.
+    """
+    sync_engine = engine.sync_engine if isinstance(engine, AsyncEngine) else engine
+    if event.contains(sync_engine, "before_cursor_execute", _before_cursor_execute):
+        return
+    event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(sync_engine, "handle_error", _handle_error)
@@ -0,0 +1,72 @@
+"""Leader election between the workers for one-off startup tasks."""
+
+import asyncio
+import hashlib
+import logging
+from collections.abc import Awaitable, Callable, Sequence
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+logger = logging.getLogger(__name__)
+
+type StartupTask = Callable[[], Awaitable[object]]
+
+STARTUP_LOCK = "operaclone2.startup"
+
+
+def lock_key(name: str) -> int:
+    """
+    Get the advisory lock key of a name.
+
+    :param name: lock name.
+    :return: signed 64 bit key, the same in every process.
+    """
+    return int.from_bytes(hashlib.sha256(name.encode()).digest()[:8], signed=True)
+
+
+async def run_startup_tasks(
+    engine: AsyncEngine,
+    tasks: Sequence[StartupTask],
+    timeout: float,
+) -> bool:
+    """
+    Run startup tasks in one worker while the others wait for it.
+
+    The worker that gets ``pg_try_advisory_lock`` first is the leader
+    and runs the tasks. The others block on a shared lock on the same
+    key, which is granted when the leader releases its lock, and then
+    start without running the tasks. A worker that only starts once the
+    leader is done becomes leader too, so tasks must be idempotent and
+    cheap to repeat.
+
+    :param engine: database engine.
+    :param tasks: tasks to run in order.
+    :param timeout: seconds to wait for the leader before starting anyway.
+    :return: whether this worker ran the tasks.
+    """
+    key = lock_key(STARTUP_LOCK)
+    async with engine.connect() as conn:
+        if await conn.scalar(select(func.pg_try_advisory_lock(key))):
+            logger.info("Startup leader, running %d tasks.", len(tasks))
+            try:
+                for task in tasks:
+                    await task()
+            finally:
+                # Session level locks survive the rollback of a pooled connection.
+                await conn.scalar(select(func.pg_advisory_unlock(key)))
+            return True
+
+        logger.info("Waiting for the startup leader.")
+        try:
+            await asyncio.wait_for(
+                conn.execute(select(func.pg_advisory_lock_shared(key))),
+                timeout,
+            )
+        except TimeoutError:
+            logger.warning("No startup leader finished within %.0f s, starting anyway.", timeout)
+            # The lock may still be granted later, never pool this connection.
+            await conn.invalidate()
+            return False
+        await conn.scalar(select(func.pg_advisory_unlock_shared(key)))
+    return False
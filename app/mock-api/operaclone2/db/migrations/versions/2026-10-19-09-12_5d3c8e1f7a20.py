@@ -0,0 +1,49 @@
+"""add_idempotency_keys.
+
+Revision ID: 5d3c8e1f7a20
+Revises: af7f1aba62d0
+Create Date: 2026-10-19 09:12:41.208113
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "5d3c8e1f7a20"
+down_revision = "af7f1aba62d0"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Run the migration."""
+    op.create_table(
+        "idempotency_keys",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("idempotency_key", sa.String(length=255), nullable=False),
+        sa.Column("request_hash", sa.String(length=64), nullable=False),
+        sa.Column("response_body", sa.JSON(), nullable=False),
+        sa.Column("create_date_time", sa.DateTime(), nullable=False),
+        sa.Column("expire_date_time", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        op.f("ix_idempotency_keys_idempotency_key"),
+        "idempotency_keys",
+        ["idempotency_key"],
+        unique=True,
+    )
+    op.create_index(
+        op.f("ix_idempotency_keys_expire_date_time"),
+        "idempotency_keys",
+        ["expire_date_time"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Undo the migration."""
+    op.drop_index(op.f("ix_idempotency_keys_expire_date_time"), table_name="idempotency_keys")
+    op.drop_index(op.f("ix_idempotency_keys_idempotency_key"), table_name="idempotency_keys")
+    op.drop_table("idempotency_keys")
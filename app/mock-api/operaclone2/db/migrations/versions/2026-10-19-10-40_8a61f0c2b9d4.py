@@ -0,0 +1,36 @@
+"""add_reservation_id_sequences.
+
+Revision ID: 8a61f0c2b9d4
+Revises: 5d3c8e1f7a20
+Create Date: 2026-10-19 10:40:17.553902
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "8a61f0c2b9d4"
+down_revision = "5d3c8e1f7a20"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Run the migration."""
+    op.execute(
+        sa.schema.CreateSequence(
+            sa.Sequence("reservation_id_seq", start=1_000_000, increment=100),
+        ),
+    )
+    op.execute(
+        sa.schema.CreateSequence(
+            sa.Sequence("confirmation_number_seq", start=100_000_000, increment=100),
+        ),
+    )
+
+
+def downgrade() -> None:
+    """Undo the migration."""
+    op.execute(sa.schema.DropSequence(sa.Sequence("confirmation_number_seq")))
+    op.execute(sa.schema.DropSequence(sa.Sequence("reservation_id_seq")))
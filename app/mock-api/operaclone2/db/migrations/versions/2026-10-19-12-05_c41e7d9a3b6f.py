@@ -0,0 +1,45 @@
+"""add_app_metadata.
+
+Revision ID: c41e7d9a3b6f
+Revises: 8a61f0c2b9d4
+Create Date: 2026-10-19 12:05:33.071846
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "c41e7d9a3b6f"
+down_revision = "8a61f0c2b9d4"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Run the migration."""
+    op.create_table(
+        "app_metadata",
+        sa.Column("key", sa.String(length=100), nullable=False),
+        sa.Column("value", sa.String(length=255), nullable=False),
+        sa.Column("update_date_time", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("key"),
+    )
+    # Keep the oldest row of duplicated room types before enforcing uniqueness.
+    op.execute(
+        "DELETE FROM room_types AS duplicate USING room_types AS original "
+        "WHERE duplicate.hotel_id_fk = original.hotel_id_fk "
+        "AND duplicate.room_type = original.room_type "
+        "AND duplicate.id > original.id",
+    )
+    op.create_unique_constraint(
+        "uq_room_types_hotel_id_fk_room_type",
+        "room_types",
+        ["hotel_id_fk", "room_type"],
+    )
+
+
+def downgrade() -> None:
+    """Undo the migration."""
+    op.drop_constraint("uq_room_types_hotel_id_fk_room_type", "room_types", type_="unique")
+    op.drop_table("app_metadata")
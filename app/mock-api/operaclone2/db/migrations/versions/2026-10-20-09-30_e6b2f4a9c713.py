@@ -0,0 +1,28 @@
+"""claim_idempotency_keys.
+
+Revision ID: e6b2f4a9c713
+Revises: c41e7d9a3b6f
+Create Date: 2026-10-20 09:30:12.554208
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "e6b2f4a9c713"
+down_revision = "c41e7d9a3b6f"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Run the migration."""
+    # Keys are claimed before their response exists.
+    op.alter_column("idempotency_keys", "response_body", existing_type=sa.JSON(), nullable=True)
+
+
+def downgrade() -> None:
+    """Undo the migration."""
+    op.execute("DELETE FROM idempotency_keys WHERE response_body IS NULL")
+    op.alter_column("idempotency_keys", "response_body", existing_type=sa.JSON(), nullable=False)
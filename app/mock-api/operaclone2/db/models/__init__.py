@@ -3,8 +3,10 @@
 import pkgutil
 from pathlib import Path
 
+from operaclone2.db.models.app_metadata import AppMetadataModel as AppMetadataModel
 from operaclone2.db.models.dummy_model import DummyModel as DummyModel
 from operaclone2.db.models.hotel import Hotel as Hotel
+from operaclone2.db.models.idempotency_key import IdempotencyKeyModel as IdempotencyKeyModel
 from operaclone2.db.models.reservation import ReservationModel as ReservationModel
 from operaclone2.db.models.room_type import RoomType as RoomType
 
@@ -0,0 +1,17 @@
+from datetime import datetime
+
+from sqlalchemy import DateTime, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from operaclone2.db.base import Base
+
+
+class AppMetadataModel(Base):
+    """Key-value state of the application kept next to its data, e.g. the seed fingerprint."""
+
+    __tablename__ = "app_metadata"
+
+    key: Mapped[str] = mapped_column(String(100), primary_key=True)
+    value: Mapped[str] = mapped_column(String(255))
+
+    update_date_time: Mapped[datetime] = mapped_column(DateTime, default=datetime.now)
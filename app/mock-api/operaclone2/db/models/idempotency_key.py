@@ -0,0 +1,23 @@
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import JSON, DateTime, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from operaclone2.db.base import Base
+
+
+class IdempotencyKeyModel(Base):
+    """Stored response of a write request sent with an ``Idempotency-Key`` header."""
+
+    __tablename__ = "idempotency_keys"
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    idempotency_key: Mapped[str] = mapped_column(String(255), unique=True, index=True)
+    # SHA-256 of the route and request body, used to detect key reuse
+    request_hash: Mapped[str] = mapped_column(String(64))
+    # NULL while the request that claimed the key is running
+    response_body: Mapped[dict[str, Any] | None] = mapped_column(JSON, nullable=True)
+
+    create_date_time: Mapped[datetime] = mapped_column(DateTime, default=datetime.now)
+    expire_date_time: Mapped[datetime] = mapped_column(DateTime, index=True)
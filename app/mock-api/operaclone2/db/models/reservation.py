@@ -1,10 +1,26 @@
 from datetime import date, datetime
 from typing import Any
 
-from sqlalchemy import JSON, DateTime, String
+from sqlalchemy import JSON, DateTime, Sequence, String
 from sqlalchemy.orm import Mapped, mapped_column
 
 from operaclone2.db.base import Base
+from operaclone2.db.meta import meta
+
+# Both sequences hand out blocks of IDs, see BlockIdAllocator.
+# Start values are above the range of the legacy random 6/8 digit numbers.
+reservation_id_seq = Sequence(
+    "reservation_id_seq",
+    start=1_000_000,
+    increment=100,
+    metadata=meta,
+)
+confirmation_number_seq = Sequence(
+    "confirmation_number_seq",
+    start=100_000_000,
+    increment=100,
+    metadata=meta,
+)
 
 
 class ReservationModel(Base):
@@ -1,6 +1,6 @@
 from typing import Any
 
-from sqlalchemy import Boolean, ForeignKey, Integer, String
+from sqlalchemy import Boolean, ForeignKey, Integer, String, UniqueConstraint
 from sqlalchemy.dialects import postgresql
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -13,6 +13,12 @@ class RoomType(Base):
 
     __tablename__ = "room_types"
 
+    # Room type codes are unique per hotel, the seed upserts on this constraint.
+    HOTEL_ROOM_TYPE_CONSTRAINT = "uq_room_types_hotel_id_fk_room_type"
+    __table_args__ = (
+        UniqueConstraint("hotel_id_fk", "room_type", name=HOTEL_ROOM_TYPE_CONSTRAINT),
+    )
+
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
 
     # Foreign Key to Hotel
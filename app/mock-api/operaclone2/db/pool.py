@@ -0,0 +1,31 @@
+import time
+
+from sqlalchemy.pool import AsyncAdaptedQueuePool, PoolProxiedConnection
+
+from operaclone2.admission import admission_controller
+from operaclone2.metrics import Histogram, registry
+
+pool_wait = registry.register(
+    Histogram(
+        "db_pool_wait_seconds",
+        "Time spent getting a connection from the pool, including new connections.",
+    ),
+)
+
+
+class WaitTimedQueuePool(AsyncAdaptedQueuePool):
+    """Queue pool recording how long checkouts take, for admission control."""
+
+    def connect(self) -> PoolProxiedConnection:
+        """
+        Check out a connection.
+
+        :return: pooled connection.
+        """
+        start = time.perf_counter()
+        try:
+            return super().connect()
+        finally:
+            wait = time.perf_counter() - start
+            pool_wait.observe(wait)
+            admission_controller.pool_wait.add(wait)
@@ -0,0 +1,188 @@
+import asyncio
+import time
+from collections import deque
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+
+from operaclone2.admission import admission_controller
+from operaclone2.channels import channel_label
+from operaclone2.metrics import Histogram, LabelValues, registry
+
+scheduler_wait = registry.register(
+    Histogram(
+        "db_scheduler_wait_seconds",
+        "Time a request waited for a database session, by channel.",
+        ("channel",),
+    ),
+)
+
+
+@dataclass(slots=True)
+class ChannelQueue:
+    """Sessions held and awaited by one channel."""
+
+    weight: float
+    limit: int
+    # Grants move it by 1 / weight, the lowest waiting channel goes first.
+    virtual_time: float
+    active: int = 0
+    waiters: deque[asyncio.Future[None]] = field(default_factory=deque)
+
+
+class FairScheduler:
+    """
+    Weighted fair queuing of database sessions between channels.
+
+    At most ``capacity`` sessions are held at once, and at most the limit
+    of its channel by one channel. When a session is released, the next
+    one goes to the waiting channel with the lowest virtual time, which
+    grows by ``1 / weight`` with every grant: under contention a channel
+    of weight 2 gets twice the sessions of a channel of weight 1, and a
+    channel queueing a bulk sync cannot starve the others. A channel
+    coming back from idle starts at the current virtual time, so idling
+    earns no credit. Queues are dropped when idle. Metrics label the
+    channels with a weight or limit by name, all others as ``other``.
+
+    Requests queue here rather than in the connection pool, so the time
+    they wait for a slot feeds the pool wait of admission control.
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        weights: dict[str, float],
+        limits: dict[str, int],
+        default_weight: float = 1.0,
+        default_limit: int = 0,
+    ) -> None:
+        self.capacity = capacity
+        self.weights = weights
+        self.limits = limits
+        self.default_weight = default_weight
+        self.default_limit = default_limit
+        self.known_channels = weights.keys() | limits.keys()
+        self.active = 0
+        self.channels: dict[str, ChannelQueue] = {}
+        self._virtual_time = 0.0
+
+    def _queue(self, channel: str) -> ChannelQueue:
+        queue = self.channels.get(channel)
+        if queue is None:
+            limit = self.limits.get(channel, self.default_limit)
+            queue = self.channels[channel] = ChannelQueue(
+                weight=self.weights.get(channel, self.default_weight),
+                limit=limit if limit > 0 else self.capacity,
+                virtual_time=self._virtual_time,
+            )
+        return queue
+
+    def _grant(self, queue: ChannelQueue) -> None:
+        queue.active += 1
+        self.active += 1
+        self._virtual_time = queue.virtual_time
+        queue.virtual_time += 1 / queue.weight
+
+    def _dispatch(self) -> None:
+        while self.active < self.capacity:
+            ready = [
+                queue
+                for queue in self.channels.values()
+                if queue.waiters and queue.active < queue.limit
+            ]
+            if not ready:
+                return
+            queue = min(ready, key=lambda queue: queue.virtual_time)
+            waiter = queue.waiters.popleft()
+            if waiter.done():
+                # Cancelled while waiting, the waiter cleans up after itself.
+                continue
+            self._grant(queue)
+            waiter.set_result(None)
+
+    def try_acquire(self, channel: str) -> bool:
+        """
+        Take a session slot if one is free right away.
+
+        :param channel: ``x-channelCode`` of the request.
+        :return: whether a slot was granted, to give back with ``release``.
+        """
+        queue = self._queue(channel)
+        if queue.waiters or self.active >= self.capacity or queue.active >= queue.limit:
+            self._drop_if_idle(channel, queue)
+            return False
+        self._grant(queue)
+        return True
+
+    async def acquire(self, channel: str) -> None:
+        """
+        Wait for a session slot.
+
+        :param channel: ``x-channelCode`` of the request.
+        """
+        if self.try_acquire(channel):
+            self._waited(channel, 0.0)
+            return
+
+        queue = self._queue(channel)
+        waiter = asyncio.get_running_loop().create_future()
+        queue.waiters.append(waiter)
+        start = time.perf_counter()
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.cancelled():
+                if waiter in queue.waiters:
+                    queue.waiters.remove(waiter)
+                self._drop_if_idle(channel, queue)
+            else:
+                # Granted and cancelled at the same time.
+                self.release(channel)
+            raise
+        self._waited(channel, time.perf_counter() - start)
+
+    def _waited(self, channel: str, wait: float) -> None:
+        scheduler_wait.observe(wait, channel_label(channel, self.known_channels))
+        admission_controller.pool_wait.add(wait)
+
+    def release(self, channel: str) -> None:
+        """
+        Give a session slot back.
+
+        :param channel: channel passed to ``acquire``.
+        """
+        queue = self.channels[channel]
+        queue.active -= 1
+        self.active -= 1
+        self._drop_if_idle(channel, queue)
+        self._dispatch()
+
+    def _drop_if_idle(self, channel: str, queue: ChannelQueue) -> None:
+        if not queue.active and not queue.waiters and self.channels.get(channel) is queue:
+            del self.channels[channel]
+
+    @asynccontextmanager
+    async def slot(self, channel: str) -> AsyncIterator[None]:
+        """
+        Hold a session slot while in the block.
+
+        :param channel: ``x-channelCode`` of the request.
+        :yield: once the slot is granted.
+        """
+        await self.acquire(channel)
+        try:
+            yield
+        finally:
+            self.release(channel)
+
+    def queue_depths(self) -> list[tuple[LabelValues, float]]:
+        """
+        Get the number of requests waiting, by channel.
+
+        :return: samples for a gauge labelled by channel.
+        """
+        depths: dict[str, float] = {}
+        for channel, queue in self.channels.items():
+            label = channel_label(channel, self.known_channels)
+            depths[label] = depths.get(label, 0) + len(queue.waiters)
+        return [((label,), depth) for label, depth in depths.items()]
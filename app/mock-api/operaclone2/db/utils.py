@@ -1,9 +1,16 @@
+import logging
+from pathlib import Path
+
 from sqlalchemy import text
 from sqlalchemy.engine import make_url
-from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
 
 from operaclone2.settings import settings
 
+logger = logging.getLogger(__name__)
+
+MIGRATIONS_DIR = Path(__file__).parent / "migrations"
+
 
 async def create_database() -> None:
     """Create a database."""
@@ -42,3 +49,31 @@ async def drop_database() -> None:
         )
         await conn.execute(text(disc_users))
         await conn.execute(text(f'DROP DATABASE "{settings.db_base}"'))
+
+
+async def check_migrations(engine: AsyncEngine) -> bool:
+    """
+    Warn when the database schema is not at the latest migration.
+
+    :param engine: database engine.
+    :return: whether the database is up to date.
+    """
+    # Importing alembic takes longer than the check itself.
+    from alembic.runtime.migration import MigrationContext  # noqa: PLC0415
+    from alembic.script import ScriptDirectory  # noqa: PLC0415
+
+    heads = set(ScriptDirectory(str(MIGRATIONS_DIR)).get_heads())
+    async with engine.connect() as conn:
+        current = set(
+            await conn.run_sync(
+                lambda sync_conn: MigrationContext.configure(sync_conn).get_current_heads(),
+            ),
+        )
+    if current != heads:
+        logger.warning(
+            "Database is at revision %s, the latest is %s; run `alembic upgrade head`.",
+            ", ".join(sorted(current)) or "<none>",
+            ", ".join(sorted(heads)),
+        )
+        return False
+    return True
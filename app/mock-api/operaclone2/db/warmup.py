@@ -0,0 +1,87 @@
+"""Connection pool warmup at startup."""
+
+import asyncio
+import logging
+import time
+
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, AsyncSession
+from sqlalchemy.pool import QueuePool
+
+from operaclone2.db.dao.hotel_dao import HotelDAO
+from operaclone2.db.dao.reservation_dao import ReservationDAO
+from operaclone2.seed import hotel_seed_data
+
+logger = logging.getLogger(__name__)
+
+# Page size used by the list endpoints by default.
+WARMUP_PAGE_SIZE = 20
+
+
+async def prime_statements(conn: AsyncConnection) -> None:
+    """
+    Run the common read queries of the DAOs once on a connection.
+
+    asyncpg prepares and caches statements per connection, so this moves
+    the parse/plan round trips and type introspection of the first real
+    requests to startup. Results are discarded, nothing is written.
+
+    :param conn: connection to prime.
+    """
+    hotel = hotel_seed_data()
+    async with AsyncSession(bind=conn) as session:
+        hotels = HotelDAO(session)
+        await hotels.get_hotel_by_code(hotel["hotel_code"])
+        await hotels.get_hotels_by_codes([hotel["hotel_code"]])
+        await hotels.get_all_hotels(limit=WARMUP_PAGE_SIZE, offset=0)
+        await hotels.total_properties_count()
+        await hotels.get_room_types_by_hotel(hotel["hotel_code"], WARMUP_PAGE_SIZE, 0)
+
+        reservations = ReservationDAO(session)
+        await reservations.get_reservation_by_id("0")
+        await reservations.search_reservations(hotel_id=hotel["hotel_id"], limit=WARMUP_PAGE_SIZE)
+        await reservations.get_distribution_statistics(hotel["hotel_id"])
+
+
+async def _prime_and_hold(engine: AsyncEngine, barrier: asyncio.Barrier) -> None:
+    async with engine.connect() as conn:
+        await prime_statements(conn)
+        await barrier.wait()
+
+
+async def warm_up_pool(engine: AsyncEngine, connections: int) -> int:
+    """
+    Open pooled connections and prime them before the worker accepts requests.
+
+    The connections are opened concurrently and returned to the pool
+    once all of them are primed. Failures are logged and do not stop
+    the startup, a cold pool is only slower.
+
+    :param engine: database engine.
+    :param connections: number of connections, capped to the pool size.
+    :return: number of primed connections.
+    """
+    pool = engine.pool
+    if isinstance(pool, QueuePool):
+        connections = min(connections, pool.size())
+    if connections <= 0:
+        return 0
+
+    start = time.perf_counter()
+    # Every task keeps its connection until all are primed, so that they
+    # are distinct connections of the pool.
+    barrier = asyncio.Barrier(connections)
+    try:
+        async with asyncio.TaskGroup() as group:
+            for _ in range(connections):
+                group.create_task(_prime_and_hold(engine, barrier))
+    except* (SQLAlchemyError, OSError):
+        logger.warning("Connection pool warmup failed.", exc_info=True)
+        connections = 0
+    else:
+        logger.info(
+            "Warmed up %d connections in %.0f ms.",
+            connections,
+            (time.perf_counter() - start) * 1000,
+        )
+    return connections
@@ -0,0 +1,161 @@
+"""Per-request deadlines, enforced on the handler and on Postgres statements."""
+
+import time
+from contextvars import ContextVar, Token
+from typing import Any
+
+from sqlalchemy import event, text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.orm import Session
+from starlette.types import Scope
+
+from operaclone2.settings import settings
+
+# Clients may shorten the deadline of a request with this header.
+DEADLINE_HEADER = b"x-request-timeout-ms"
+# SQLSTATE of a statement cancelled by statement_timeout.
+QUERY_CANCELED = "57014"
+# SET LOCAL with a bound value, so every transaction reuses one prepared statement.
+SET_STATEMENT_TIMEOUT = text("SELECT set_config('statement_timeout', :timeout, true)")
+# Seconds a statement may outlive the deadline before the round trip of
+# SET_STATEMENT_TIMEOUT is worth it, see set_statement_timeout.
+STATEMENT_TIMEOUT_SLACK = 1.0
+
+_deadline: ContextVar[float | None] = ContextVar("deadline", default=None)
+
+
+def header_timeout(scope: Scope) -> float | None:
+    """
+    Get the timeout asked for in the ``x-request-timeout-ms`` header.
+
+    :param scope: ASGI scope.
+    :return: timeout in seconds, None if missing or invalid.
+    """
+    headers: list[tuple[bytes, bytes]] = scope["headers"]
+    for name, value in headers:
+        if name == DEADLINE_HEADER:
+            try:
+                timeout = float(value) / 1000
+            except ValueError:
+                return None
+            return timeout if timeout > 0 else None
+    return None
+
+
+def request_timeout(scope: Scope, route: str) -> float | None:
+    """
+    Get the time a request may take.
+
+    :param scope: ASGI scope.
+    :param route: path template of the route.
+    :return: the shortest of the route and header timeouts, None for no deadline.
+    """
+    timeouts = [
+        settings.route_timeouts.get(route, settings.request_timeout_seconds),
+        header_timeout(scope),
+    ]
+    return min((timeout for timeout in timeouts if timeout), default=None)
+
+
+def activate_deadline(timeout: float) -> Token[float | None]:
+    """
+    Set the deadline of the current context.
+
+    :param timeout: seconds from now.
+    :return: token for ``deactivate_deadline``.
+    """
+    return _deadline.set(time.monotonic() + timeout)
+
+
+def deactivate_deadline(token: Token[float | None]) -> None:
+    """
+    Restore the deadline that was active before ``activate_deadline``.
+
+    :param token: token returned by ``activate_deadline``.
+    """
+    _deadline.reset(token)
+
+
+def remaining_time() -> float | None:
+    """
+    Get the time left before the deadline of the current context.
+
+    :return: seconds, None without deadline.
+    """
+    deadline = _deadline.get()
+    return None if deadline is None else deadline - time.monotonic()
+
+
+def connection_statement_timeout() -> float | None:
+    """
+    Get the statement_timeout every pooled connection starts with.
+
+    It is the longest deadline a request can get, so only requests with a
+    shorter deadline need a statement_timeout of their own.
+
+    :return: seconds, None when some routes have no deadline.
+    """
+    timeouts = [settings.request_timeout_seconds, *settings.route_timeouts.values()]
+    if not all(timeouts):
+        return None
+    return max(timeouts)
+
+
+def connect_args() -> dict[str, Any]:
+    """
+    Get the asyncpg arguments applying ``connection_statement_timeout``.
+
+    :return: keyword arguments for ``create_async_engine(connect_args=...)``.
+    """
+    timeout = connection_statement_timeout()
+    if timeout is None:
+        return {}
+    return {"server_settings": {"statement_timeout": str(int(timeout * 1000))}}
+
+
+def is_query_canceled(exc: DBAPIError) -> bool:
+    """
+    Check whether Postgres cancelled a statement, e.g. on statement_timeout.
+
+    :param exc: database error.
+    :return: whether its SQLSTATE is query_canceled.
+    """
+    return getattr(exc.orig, "sqlstate", None) == QUERY_CANCELED
+
+
+class DeadlineSession(Session):
+    """
+    Session whose transactions stop at the deadline of the request.
+
+    Connections start with ``connection_statement_timeout``, and every
+    transaction begun under a deadline tighter than that starts with a
+    local ``statement_timeout``, so Postgres cancels the statements of
+    abandoned requests instead of running them to completion.
+    """
+
+
+@event.listens_for(DeadlineSession, "after_begin")
+def set_statement_timeout(session: Session, transaction: Any, connection: Any) -> None:
+    """
+    Limit the statements of a new transaction to the time left.
+
+    Most requests start well within the connection default, and their
+    transactions begin without a round trip. Work without a deadline,
+    e.g. seeding, lifts the default instead.
+
+    :param session: session beginning a transaction.
+    :param transaction: new session transaction.
+    :param connection: connection of the transaction.
+    """
+    remaining = remaining_time()
+    default = connection_statement_timeout()
+    if remaining is None:
+        if default is None:
+            return
+        # Zero disables statement_timeout.
+        timeout_ms = 0
+    elif default is not None and remaining >= default - STATEMENT_TIMEOUT_SLACK:
+        return
+    else:
+        timeout_ms = max(int(remaining * 1000), 1)
+    connection.execute(SET_STATEMENT_TIMEOUT, {"timeout": str(timeout_ms)})
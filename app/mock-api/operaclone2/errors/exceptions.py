@@ -4,3 +4,25 @@ class HotelNotFoundError(Exception):
     def __init__(self, message: str = "Hotel not found") -> None:
         self.message = message
         super().__init__(self.message)
+
+
+class IdempotencyKeyConflictError(Exception):
+    """Exception raised when an idempotency key is reused with a different request."""
+
+    def __init__(
+        self,
+        message: str = "Idempotency key was already used with a different request",
+    ) -> None:
+        self.message = message
+        super().__init__(self.message)
+
+
+class IdempotencyKeyInProgressError(Exception):
+    """Exception raised when the request holding an idempotency key has not finished yet."""
+
+    def __init__(
+        self,
+        message: str = "A request with this idempotency key is still in progress",
+    ) -> None:
+        self.message = message
+        super().__init__(self.message)
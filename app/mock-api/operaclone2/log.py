@@ -1,10 +1,30 @@
 import logging
+import random
 import sys
+import threading
+import traceback
+from typing import TYPE_CHECKING
 
+import ujson
 from loguru import logger
 
 from operaclone2.settings import settings
 
+if TYPE_CHECKING:
+    from loguru import Record
+
+LOG_FORMAT = (
+    "<green>{time:YYYY-MM-DD HH:mm:ss.SSS}</green> | "
+    "<level>{level: <8}</level> | "
+    "<magenta>{extra[request_id]}</magenta> | "
+    "<cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - "
+    "<level>{message}</level>"
+)
+
+
+# Record being passed to loguru by InterceptHandler in this thread.
+_intercepted = threading.local()
+
 
 class InterceptHandler(logging.Handler):
     """
@@ -13,6 +33,9 @@ class InterceptHandler(logging.Handler):
     This handler intercepts all log requests and
     passes them to loguru.
 
+    The caller is taken from the ``LogRecord`` by ``stdlib_caller``
+    instead of walking the stack past the ``logging`` frames.
+
     For more info see:
     https://loguru.readthedocs.io/en/stable/overview.html#entirely-compatible-with-standard-logging
     """
@@ -28,23 +51,103 @@ class InterceptHandler(logging.Handler):
         except ValueError:
             level = record.levelno
 
-        # Find caller from where originated the logged message
-        frame, depth = logging.currentframe(), 2
-        while frame.f_code.co_filename == logging.__file__:
-            frame = frame.f_back  # type: ignore
-            depth += 1
+        _intercepted.record = record
+        try:
+            logger.opt(exception=record.exc_info).log(level, record.getMessage())
+        finally:
+            _intercepted.record = None
+
 
-        logger.opt(depth=depth, exception=record.exc_info).log(
-            level,
-            record.getMessage(),
-        )
+class SamplingFilter(logging.Filter):
+    """
+    Keeps a fraction of the records below WARNING of some loggers.
+
+    Rates apply to a logger and its children, the most specific logger
+    name wins: ``{"uvicorn.access": 0.1}`` keeps one access log in ten.
+    """
+
+    def __init__(self, rates: dict[str, float]) -> None:
+        super().__init__()
+        self.rates = rates
+        self._resolved: dict[str, float] = {}
+
+    def rate(self, name: str) -> float:
+        """
+        Get the sampling rate of a logger.
+
+        :param name: logger name.
+        :return: fraction of records to keep.
+        """
+        rate = self._resolved.get(name)
+        if rate is None:
+            prefixes = [
+                prefix for prefix in self.rates if name == prefix or name.startswith(f"{prefix}.")
+            ]
+            rate = self.rates[max(prefixes, key=len)] if prefixes else 1.0
+            self._resolved[name] = rate
+        return rate
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """
+        Decide whether to keep a record.
+
+        :param record: record to log.
+        :return: whether to keep it.
+        """
+        if record.levelno >= logging.WARNING:
+            return True
+        rate = self.rate(record.name)
+        return rate >= 1 or random.random() < rate  # noqa: S311
+
+
+def stdlib_caller(record: "Record") -> None:
+    """
+    Report the caller of an intercepted record from its ``LogRecord``.
+
+    :param record: loguru record.
+    """
+    log_record = getattr(_intercepted, "record", None)
+    if log_record is not None:
+        record["name"] = log_record.name
+        record["module"] = log_record.module
+        record["function"] = log_record.funcName
+        record["line"] = log_record.lineno
+
+
+def json_format(record: "Record") -> str:
+    """
+    Render a record as one line of JSON.
+
+    :param record: loguru record.
+    :return: format string of loguru.
+    """
+    payload = {
+        "time": record["time"].isoformat(),
+        "level": record["level"].name,
+        "logger": record["name"],
+        "function": record["function"],
+        "line": record["line"],
+        "message": record["message"],
+        **record["extra"],
+    }
+    if record["exception"] is not None:
+        payload["exception"] = "".join(traceback.format_exception(*record["exception"]))
+    record["extra"]["json"] = ujson.dumps(payload, ensure_ascii=False, default=str)
+    return "{extra[json]}\n"
 
 
 def configure_logging() -> None:  # pragma: no cover
     """Configures logging."""
     intercept_handler = InterceptHandler()
+    if settings.log_sampling:
+        intercept_handler.addFilter(SamplingFilter(settings.log_sampling))
 
-    logging.basicConfig(handlers=[intercept_handler], level=logging.NOTSET)
+    # Records below the log level are dropped before a LogRecord is built.
+    logging.basicConfig(handlers=[intercept_handler], level=settings.log_level.value)
+    # loguru resolves the thread and process itself.
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
 
     for logger_name in logging.root.manager.loggerDict:
         if logger_name.startswith("uvicorn."):
@@ -56,7 +159,13 @@ def configure_logging() -> None:  # pragma: no cover
 
     # set logs output, level and format
     logger.remove()
+    # Records outside of a request have no request id.
+    logger.configure(extra={"request_id": "-"}, patcher=stdlib_caller)
     logger.add(
         sys.stdout,
         level=settings.log_level.value,
+        format=json_format if settings.log_json else LOG_FORMAT,
+        colorize=False if settings.log_json else None,
+        # Writes happen in a background thread, never in the event loop.
+        enqueue=settings.log_enqueue,
     )
@@ -0,0 +1,139 @@
+"""Event loop lag measurement and detection of blocking calls."""
+
+import asyncio
+import logging
+import sys
+import threading
+import time
+import traceback
+from contextvars import ContextVar, Token
+
+from starlette.types import Scope
+
+from operaclone2.metrics import Counter, Histogram, registry
+
+logger = logging.getLogger(__name__)
+
+# Seconds between two lag probes.
+PROBE_INTERVAL = 0.05
+# Frames of the blocking stack shown in the warning.
+STACK_LIMIT = 8
+# Route label of blocking code that runs outside of a request.
+NO_ROUTE = "<none>"
+
+event_loop_lag = registry.register(
+    Histogram(
+        "event_loop_lag_seconds",
+        "Delay of a timer callback scheduled on the event loop.",
+    ),
+)
+event_loop_blocked = registry.register(
+    Counter(
+        "event_loop_blocked",
+        "Times the event loop was blocked beyond the threshold, by the running route.",
+        ("route",),
+    ),
+)
+
+_request_scope: ContextVar[Scope | None] = ContextVar("request_scope", default=None)
+
+
+def activate_request_scope(scope: Scope) -> Token[Scope | None]:
+    """
+    Attribute code running in the current context to a request.
+
+    :param scope: ASGI scope of the request.
+    :return: token for ``deactivate_request_scope``.
+    """
+    return _request_scope.set(scope)
+
+
+def deactivate_request_scope(token: Token[Scope | None]) -> None:
+    """
+    End the attribution started by ``activate_request_scope``.
+
+    :param token: token returned on activation.
+    """
+    _request_scope.reset(token)
+
+
+def running_route(loop: asyncio.AbstractEventLoop) -> str:
+    """
+    Get the route of the task running on a loop, from any thread.
+
+    :param loop: event loop.
+    :return: route template, ``NO_ROUTE`` outside of a request.
+    """
+    task = asyncio.current_task(loop)
+    scope = task.get_context().get(_request_scope) if task is not None else None
+    route = scope.get("route") if scope is not None else None
+    return getattr(route, "path", None) or NO_ROUTE
+
+
+class LoopMonitor:
+    """
+    Measures the lag of an event loop and reports what blocks it.
+
+    A task on the loop sleeps ``PROBE_INTERVAL`` in a loop and records
+    how late it wakes up. A watchdog thread checks the time of the last
+    wake up: when the loop is stuck for longer than ``threshold``, it
+    logs the stack of the loop thread and the route of the running task
+    while the blocking call is still in progress.
+    """
+
+    def __init__(self, threshold: float) -> None:
+        self.threshold = threshold
+        self._heartbeat = time.monotonic()
+        self._stop = threading.Event()
+        self._probe: asyncio.Task[None] | None = None
+        self._watchdog: threading.Thread | None = None
+
+    async def _run_probe(self, loop: asyncio.AbstractEventLoop) -> None:
+        while True:
+            expected = loop.time() + PROBE_INTERVAL
+            await asyncio.sleep(PROBE_INTERVAL)
+            event_loop_lag.observe(max(loop.time() - expected, 0.0))
+            self._heartbeat = time.monotonic()
+
+    def _run_watchdog(self, loop: asyncio.AbstractEventLoop, thread_id: int) -> None:
+        reported = 0.0
+        while not self._stop.wait(self.threshold / 4):
+            heartbeat = self._heartbeat
+            blocked = time.monotonic() - heartbeat - PROBE_INTERVAL
+            if blocked < self.threshold or heartbeat == reported:
+                continue
+            reported = heartbeat
+            frame = sys._current_frames().get(thread_id)  # noqa: SLF001
+            stack = "".join(traceback.format_stack(frame, limit=STACK_LIMIT)) if frame else ""
+            route = running_route(loop)
+            event_loop_blocked.inc(route)
+            logger.warning(
+                "Event loop blocked for over %.0f ms by %s, at:\n%s",
+                blocked * 1000,
+                route,
+                stack,
+            )
+
+    def start(self) -> None:
+        """Start monitoring the running loop."""
+        loop = asyncio.get_running_loop()
+        self._heartbeat = time.monotonic()
+        # Cleared so a monitor can be started again after ``stop``.
+        self._stop.clear()
+        self._probe = loop.create_task(self._run_probe(loop), name="loop-monitor")
+        self._watchdog = threading.Thread(
+            target=self._run_watchdog,
+            args=(loop, threading.get_ident()),
+            name="loop-watchdog",
+            daemon=True,
+        )
+        self._watchdog.start()
+
+    async def stop(self) -> None:
+        """Stop monitoring."""
+        self._stop.set()
+        if self._probe is not None:
+            self._probe.cancel()
+            await asyncio.gather(self._probe, return_exceptions=True)
+        if self._watchdog is not None:
+            self._watchdog.join()
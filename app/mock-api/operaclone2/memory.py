@@ -0,0 +1,194 @@
+"""Allocation tracking with ``tracemalloc``, see ``/api/debug/memory``."""
+
+import tracemalloc
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Literal
+
+PACKAGE_DIR = Path(__file__).resolve().parent
+# Allocations of a request are only sampled for one request in this many.
+ROUTE_SAMPLE_RATE = 10
+# Allocations without any known file are reported under this name.
+UNKNOWN = "<unknown>"
+
+type GroupBy = Literal["module", "line"]
+
+_IGNORED = (
+    tracemalloc.Filter(inclusive=False, filename_pattern=tracemalloc.__file__),
+    tracemalloc.Filter(inclusive=False, filename_pattern="<frozen importlib._bootstrap*>"),
+    tracemalloc.Filter(inclusive=False, filename_pattern="<unknown>"),
+)
+
+
+@dataclass(slots=True)
+class AllocationSite:
+    """Memory allocated from one place and still alive."""
+
+    location: str
+    size: int = 0
+    count: int = 0
+    size_diff: int = 0
+    count_diff: int = 0
+
+
+@dataclass(slots=True)
+class RoutePeak:
+    """Peak memory allocated while serving sampled requests of a route."""
+
+    route: str
+    samples: int = 0
+    total: int = 0
+    max: int = 0
+
+    @property
+    def mean(self) -> float:
+        """Average peak in bytes."""
+        return self.total / self.samples if self.samples else 0.0
+
+
+def module_of(filename: str) -> str:
+    """
+    Get the module or distribution a source file belongs to.
+
+    :param filename: source file of a frame.
+    :return: dotted module for application files, top-level package otherwise.
+    """
+    path = Path(filename)
+    if path.is_relative_to(PACKAGE_DIR):
+        parts = path.relative_to(PACKAGE_DIR).with_suffix("").parts
+        return ".".join((PACKAGE_DIR.name, *parts)).removesuffix(".__init__")
+    if "site-packages" in path.parts:
+        index = path.parts.index("site-packages")
+        return path.parts[index + 1].removesuffix(".py") if index + 1 < len(path.parts) else UNKNOWN
+    return path.stem or UNKNOWN
+
+
+def attribute(traceback: tracemalloc.Traceback, group_by: GroupBy) -> str:
+    """
+    Get the place an allocation is charged to.
+
+    By module, an allocation is charged to the innermost application
+    module on its traceback, so memory allocated by SQLAlchemy or
+    Pydantic on behalf of a service counts for that service.
+
+    :param traceback: traceback of the allocation, oldest frame first.
+    :param group_by: ``module`` or ``line``.
+    :return: module name, or ``file:line`` of the allocating frame.
+    """
+    if not traceback:
+        return UNKNOWN
+    if group_by == "line":
+        frame = traceback[-1]
+        return f"{frame.filename}:{frame.lineno}"
+    for frame in reversed(traceback):
+        if Path(frame.filename).is_relative_to(PACKAGE_DIR):
+            return module_of(frame.filename)
+    return module_of(traceback[-1].filename)
+
+
+def take_snapshot() -> tracemalloc.Snapshot:
+    """
+    Snapshot the live allocations, without those of the import system.
+
+    :return: snapshot.
+    """
+    return tracemalloc.take_snapshot().filter_traces(_IGNORED)
+
+
+class MemoryTracker:
+    """Snapshots and per-route peaks of one worker."""
+
+    def __init__(self) -> None:
+        self.baseline: tracemalloc.Snapshot | None = None
+        self.route_peaks: dict[str, RoutePeak] = {}
+        self._requests = 0
+        self._sampling = False
+
+    def start(self, frames: int) -> None:
+        """
+        Start tracing allocations and take the baseline snapshot.
+
+        :param frames: frames stored per allocation.
+        """
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+        self.route_peaks.clear()
+        tracemalloc.start(frames)
+        self.baseline = take_snapshot()
+
+    def stop(self) -> None:
+        """Stop tracing and free the snapshots."""
+        tracemalloc.stop()
+        self.baseline = None
+        self.route_peaks.clear()
+
+    def reset_baseline(self) -> None:
+        """Compare later reports with the allocations alive now."""
+        self.baseline = take_snapshot()
+
+    def report(self, group_by: GroupBy, limit: int) -> list[AllocationSite]:
+        """
+        Get the places holding the most memory, with their growth since the baseline.
+
+        :param group_by: ``module`` or ``line``.
+        :param limit: number of places.
+        :return: places by size, largest first.
+        """
+        snapshot = take_snapshot()
+        sites: dict[str, AllocationSite] = {}
+        for stat in snapshot.compare_to(self.baseline or snapshot, "traceback"):
+            location = attribute(stat.traceback, group_by)
+            site = sites.get(location)
+            if site is None:
+                site = sites[location] = AllocationSite(location)
+            site.size += stat.size
+            site.count += stat.count
+            site.size_diff += stat.size_diff
+            site.count_diff += stat.count_diff
+        return sorted(sites.values(), key=lambda site: site.size, reverse=True)[:limit]
+
+    def largest_route_peaks(self) -> list[RoutePeak]:
+        """
+        Get the sampled peak allocation of every route.
+
+        :return: routes by largest peak first.
+        """
+        return sorted(self.route_peaks.values(), key=lambda peak: peak.max, reverse=True)
+
+    def begin_route_sample(self) -> int | None:
+        """
+        Start measuring the peak allocation of a request, if it is sampled.
+
+        Only one request is measured at a time, since the peak is global.
+
+        :return: traced memory at the start, None if the request is not sampled.
+        """
+        if not tracemalloc.is_tracing() or self._sampling:
+            return None
+        self._requests += 1
+        if self._requests % ROUTE_SAMPLE_RATE:
+            return None
+        self._sampling = True
+        tracemalloc.reset_peak()
+        return tracemalloc.get_traced_memory()[0]
+
+    def end_route_sample(self, route: str, start: int) -> None:
+        """
+        Record the peak allocation of a sampled request.
+
+        :param route: route template.
+        :param start: value returned by ``begin_route_sample``.
+        """
+        self._sampling = False
+        if not tracemalloc.is_tracing():
+            return
+        peak = max(tracemalloc.get_traced_memory()[1] - start, 0)
+        stats = self.route_peaks.get(route)
+        if stats is None:
+            stats = self.route_peaks[route] = RoutePeak(route)
+        stats.samples += 1
+        stats.total += peak
+        stats.max = max(stats.max, peak)
+
+
+memory_tracker = MemoryTracker()
@@ -0,0 +1,297 @@
+"""
+In-process metrics in the Prometheus text exposition format.
+
+Metrics live in the memory of the worker process that records them, so
+with several uvicorn workers every scrape only sees the worker that
+served it.
+"""
+
+import bisect
+import math
+from collections.abc import Callable, Iterable, Sequence
+
+type LabelValues = tuple[str, ...]
+type Sample = tuple[str, dict[str, str], float]
+
+DEFAULT_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+DEFAULT_SIZE_BUCKETS = (100.0, 1_000.0, 10_000.0, 100_000.0, 1_000_000.0, 10_000_000.0)
+
+
+class Metric:
+    """Base class for a named metric family."""
+
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+
+    def _labels(self, values: LabelValues) -> dict[str, str]:
+        if len(values) != len(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {values}")
+        return dict(zip(self.labelnames, values, strict=True))
+
+    def samples(self) -> Iterable[Sample]:
+        """
+        Get current samples of the metric.
+
+        :return: tuples of (sample name, labels, value).
+        """
+        return ()
+
+
+class Counter(Metric):
+    """Monotonically increasing value."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[LabelValues, float] = {}
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        """
+        Increase the counter.
+
+        :param labels: label values, in the order of ``labelnames``.
+        :param amount: non-negative increment.
+        """
+        self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def samples(self) -> Iterable[Sample]:
+        """
+        Get current samples of the metric.
+
+        :return: tuples of (sample name, labels, value).
+        """
+        for labels, value in self._values.items():
+            yield f"{self.name}_total", self._labels(labels), value
+
+
+class Gauge(Metric):
+    """Value that can go up and down."""
+
+    kind = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[LabelValues, float] = {}
+
+    def set(self, value: float, *labels: str) -> None:
+        """
+        Set the gauge.
+
+        :param value: new value.
+        :param labels: label values, in the order of ``labelnames``.
+        """
+        self._values[labels] = value
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        """
+        Increase the gauge.
+
+        :param labels: label values, in the order of ``labelnames``.
+        :param amount: increment, may be negative.
+        """
+        self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def dec(self, *labels: str, amount: float = 1.0) -> None:
+        """
+        Decrease the gauge.
+
+        :param labels: label values, in the order of ``labelnames``.
+        :param amount: decrement.
+        """
+        self.inc(*labels, amount=-amount)
+
+    def samples(self) -> Iterable[Sample]:
+        """
+        Get current samples of the metric.
+
+        :return: tuples of (sample name, labels, value).
+        """
+        for labels, value in self._values.items():
+            yield self.name, self._labels(labels), value
+
+
+class Histogram(Metric):
+    """Distribution of observed values in cumulative buckets."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # Per label set: bucket counts (last one is +Inf), sum of observations.
+        self._values: dict[LabelValues, tuple[list[int], list[float]]] = {}
+
+    def observe(self, value: float, *labels: str) -> None:
+        """
+        Record an observation.
+
+        :param value: observed value.
+        :param labels: label values, in the order of ``labelnames``.
+        """
+        state = self._values.get(labels)
+        if state is None:
+            state = self._values[labels] = ([0] * (len(self.buckets) + 1), [0.0])
+        counts, total = state
+        counts[bisect.bisect_left(self.buckets, value)] += 1
+        total[0] += value
+
+    def snapshot(self, *labels: str) -> tuple[list[int], float]:
+        """
+        Get non-cumulative bucket counts and sum for one label set.
+
+        :param labels: label values, in the order of ``labelnames``.
+        :return: bucket counts (last one is +Inf) and sum of observations.
+        """
+        state = self._values.get(labels)
+        if state is None:
+            return [0] * (len(self.buckets) + 1), 0.0
+        return list(state[0]), state[1][0]
+
+    def samples(self) -> Iterable[Sample]:
+        """
+        Get current samples of the metric.
+
+        :return: tuples of (sample name, labels, value).
+        """
+        bounds = [*self.buckets, math.inf]
+        for labels, (counts, total) in self._values.items():
+            label_dict = self._labels(labels)
+            cumulative = 0
+            for bound, count in zip(bounds, counts, strict=True):
+                cumulative += count
+                yield f"{self.name}_bucket", {**label_dict, "le": _format_value(bound)}, cumulative
+            yield f"{self.name}_sum", label_dict, total[0]
+            yield f"{self.name}_count", label_dict, cumulative
+
+
+class CallbackMetric(Metric):
+    """Metric whose values are read from a callback at scrape time."""
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        kind: str,
+        callback: Callable[[], Iterable[tuple[LabelValues, float]]],
+        labelnames: Sequence[str] = (),
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self.kind = kind
+        self.callback = callback
+
+    def samples(self) -> Iterable[Sample]:
+        """
+        Get current samples of the metric.
+
+        :return: tuples of (sample name, labels, value).
+        """
+        suffix = "_total" if self.kind == "counter" else ""
+        for labels, value in self.callback():
+            yield f"{self.name}{suffix}", self._labels(labels), value
+
+
+class MetricsRegistry:
+    """Collection of metrics rendered together."""
+
+    def __init__(self) -> None:
+        self._metrics: dict[str, Metric] = {}
+
+    def register[MetricT: Metric](self, metric: MetricT) -> MetricT:
+        """
+        Add a metric, replacing a previous one with the same name.
+
+        :param metric: metric to add.
+        :return: the same metric.
+        """
+        self._metrics[metric.name] = metric
+        return metric
+
+    def get(self, name: str) -> Metric | None:
+        """
+        Get a metric by name.
+
+        :param name: metric name.
+        :return: metric or None.
+        """
+        return self._metrics.get(name)
+
+    def render(self) -> str:
+        """
+        Render all metrics in the text exposition format.
+
+        :return: exposition text.
+        """
+        lines: list[str] = []
+        for metric in self._metrics.values():
+            lines.append(f"# HELP {metric.name} {_escape(metric.documentation)}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            for sample_name, labels, value in metric.samples():
+                lines.append(f"{sample_name}{_format_labels(labels)} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n")
+
+
+def _escape_label(value: str) -> str:
+    return _escape(value).replace('"', '\\"')
+
+
+def _format_labels(labels: dict[str, str]) -> str:
+    if not labels:
+        return ""
+    pairs = ",".join(f'{key}="{_escape_label(value)}"' for key, value in labels.items())
+    return "{" + pairs + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if value == -math.inf:
+        return "-Inf"
+    if math.isnan(value):
+        return "NaN"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+registry = MetricsRegistry()
+
+http_requests = registry.register(
+    Counter(
+        "http_requests",
+        "Number of HTTP requests.",
+        ("route", "method", "channel", "status"),
+    ),
+)
+http_request_duration = registry.register(
+    Histogram(
+        "http_request_duration_seconds",
+        "HTTP request latency.",
+        ("route", "method", "channel"),
+    ),
+)
+http_response_size = registry.register(
+    Histogram(
+        "http_response_size_bytes",
+        "HTTP response body size.",
+        ("route", "method", "channel"),
+        buckets=DEFAULT_SIZE_BUCKETS,
+    ),
+)
+http_requests_in_flight = registry.register(
+    Gauge("http_requests_in_flight", "HTTP requests currently being served."),
+)
@@ -0,0 +1,127 @@
+"""Profiles of single requests, written to ``PROFILE_DIR``."""
+
+import cProfile
+import json
+import sys
+import threading
+import uuid
+from collections import Counter
+from pathlib import Path
+from types import FrameType
+from typing import Literal
+
+from operaclone2.settings import TEMP_DIR
+
+PROFILE_DIR = TEMP_DIR / "operaclone2-profiles"
+# The oldest profiles are deleted beyond this number.
+MAX_PROFILES = 200
+# Seconds between two stack samples.
+SAMPLE_INTERVAL = 0.001
+
+PROFILE_ID_PATTERN = r"^[a-f0-9]{32}$"
+
+# "json" holds the metadata of the profiled request.
+type ProfileFormat = Literal["pstats", "collapsed", "json"]
+
+
+def profile_id() -> str:
+    """
+    Generate the id of a new profile.
+
+    Ids are generated by the server, never taken from the request, so
+    profiles cannot overwrite each other and clients do not pick file names.
+
+    :return: id matching ``PROFILE_ID_PATTERN``.
+    """
+    return uuid.uuid4().hex
+
+
+def profile_path(profile: str, fmt: ProfileFormat) -> Path:
+    """
+    Get the file of a profile.
+
+    :param profile: profile id.
+    :param fmt: file format.
+    :return: path in ``PROFILE_DIR``.
+    """
+    return PROFILE_DIR / f"{profile}.{fmt}"
+
+
+def _stack(frame: FrameType | None) -> str:
+    names = []
+    while frame is not None:
+        names.append(f"{frame.f_globals.get('__name__', '?')}:{frame.f_code.co_qualname}")
+        frame = frame.f_back
+    return ";".join(reversed(names))
+
+
+class StackSampler:
+    """
+    Samples the stack of one thread from a background thread.
+
+    The samples of the event loop thread follow the ``await`` chain of
+    the running coroutine, so they can be rendered as a flame graph.
+    """
+
+    def __init__(self, thread_id: int, interval: float = SAMPLE_INTERVAL) -> None:
+        self.thread_id = thread_id
+        self.interval = interval
+        self.samples: Counter[str] = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)  # noqa: SLF001
+            if frame is not None:
+                self.samples[_stack(frame)] += 1
+
+    def start(self) -> None:
+        """Start sampling."""
+        self._thread.start()
+
+    def stop(self) -> Counter[str]:
+        """
+        Stop sampling.
+
+        :return: number of samples by stack.
+        """
+        self._stop.set()
+        self._thread.join()
+        return self.samples
+
+
+def collapse(samples: Counter[str]) -> str:
+    """
+    Render samples in the collapsed stack format of ``flamegraph.pl``.
+
+    :param samples: number of samples by stack.
+    :return: one ``frame;frame;frame count`` line per stack.
+    """
+    return "".join(f"{stack} {count}\n" for stack, count in samples.most_common())
+
+
+def save_profile(
+    profile: str,
+    profiler: cProfile.Profile,
+    samples: Counter[str],
+    metadata: dict[str, str],
+) -> None:
+    """
+    Write a profile and delete the oldest ones.
+
+    :param profile: profile id.
+    :param profiler: finished profiler.
+    :param samples: stack samples of the same request.
+    :param metadata: description of the request, e.g. its request id.
+    """
+    PROFILE_DIR.mkdir(parents=True, exist_ok=True)
+    profiler.dump_stats(profile_path(profile, "pstats"))
+    profile_path(profile, "collapsed").write_text(collapse(samples))
+    profile_path(profile, "json").write_text(json.dumps(metadata))
+
+    files = sorted(PROFILE_DIR.glob("*.pstats"), key=lambda path: path.stat().st_mtime)
+    for stale in files[:-MAX_PROFILES]:
+        stale.unlink(missing_ok=True)
+        stale.with_suffix(".collapsed").unlink(missing_ok=True)
+        stale.with_suffix(".json").unlink(missing_ok=True)
@@ -0,0 +1,144 @@
+"""Readiness of a worker to serve traffic, see ``/api/ready``."""
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+
+from sqlalchemy import select, text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+from sqlalchemy.pool import QueuePool
+
+from operaclone2.db.models.app_metadata import AppMetadataModel
+from operaclone2.db.warmup import warm_up_pool
+from operaclone2.seed import SEED_FINGERPRINT_KEY, expected_seed_fingerprint
+from operaclone2.services.single_flight import get_single_flight
+
+_probes = get_single_flight("readiness")
+
+
+@dataclass(slots=True)
+class CheckResult:
+    """Outcome of one readiness check."""
+
+    ok: bool
+    detail: str
+
+
+@dataclass(slots=True)
+class Readiness:
+    """Outcome of all readiness checks."""
+
+    checks: dict[str, CheckResult]
+    # time.monotonic() value when the checks ran.
+    checked_at: float = field(default_factory=time.monotonic)
+
+    @property
+    def ready(self) -> bool:
+        """Whether every check passed."""
+        return all(check.ok for check in self.checks.values())
+
+
+def pool_usage(engine: AsyncEngine) -> tuple[int, int | None]:
+    """
+    Get the connections checked out of the pool of an engine.
+
+    :param engine: database engine.
+    :return: checked out connections and pool capacity, None when unbounded.
+    """
+    pool = engine.pool
+    if not isinstance(pool, QueuePool):
+        return 0, None
+    max_overflow = pool._max_overflow  # noqa: SLF001
+    capacity = pool.size() + max_overflow if max_overflow >= 0 else None
+    return pool.checkedout(), capacity
+
+
+class ReadinessProbe:
+    """
+    Checks whether a worker can serve requests, caching the outcome.
+
+    A worker is ready when its pool has a free connection, the database
+    answers within ``timeout``, its pool was warmed up and the seed data
+    is applied. The outcome is reused for ``cache_seconds`` and
+    concurrent probes share one check, so probing adds at most one
+    database round trip per interval. Warm-up and seed state never go
+    back once reached, a failed warm-up is retried by the next check.
+    """
+
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        *,
+        cache_seconds: float,
+        timeout: float,
+        warmup_connections: int,
+        warmed_up: bool,
+        seed_required: bool,
+    ) -> None:
+        self.engine = engine
+        self.cache_seconds = cache_seconds
+        self.timeout = timeout
+        self.warmup_connections = warmup_connections
+        self.warmed_up = warmed_up or warmup_connections <= 0
+        self.seeded = not seed_required
+        self._last: Readiness | None = None
+
+    async def check(self) -> Readiness:
+        """
+        Get the readiness of the worker, from cache when recent enough.
+
+        :return: outcome of the checks.
+        """
+        last = self._last
+        if last is not None and time.monotonic() - last.checked_at < self.cache_seconds:
+            return last
+        return await _probes.do(id(self), self._run_checks)
+
+    async def _run_checks(self) -> Readiness:
+        checked_out, capacity = pool_usage(self.engine)
+        checks = {
+            "pool": CheckResult(
+                ok=capacity is None or checked_out < capacity,
+                detail=f"{checked_out}/{capacity or 'unbounded'} connections checked out",
+            ),
+        }
+        if not checks["pool"].ok:
+            # Connecting would wait for a connection to be returned.
+            checks["database"] = CheckResult(ok=False, detail="skipped, pool exhausted")
+        else:
+            checks["database"] = await self._check_database()
+        if checks["database"].ok and not self.warmed_up:
+            self.warmed_up = await warm_up_pool(self.engine, self.warmup_connections) > 0
+        checks["warmup"] = CheckResult(
+            ok=self.warmed_up,
+            detail="pool primed" if self.warmed_up else "pool not primed",
+        )
+        checks["seed"] = CheckResult(
+            ok=self.seeded,
+            detail="seed applied" if self.seeded else "seed not applied",
+        )
+        self._last = readiness = Readiness(checks)
+        return readiness
+
+    async def _check_database(self) -> CheckResult:
+        start = time.perf_counter()
+        try:
+            async with asyncio.timeout(self.timeout), self.engine.connect() as conn:
+                if self.seeded:
+                    await conn.execute(text("SELECT 1"))
+                else:
+                    self.seeded = await _seed_applied(conn)
+        except TimeoutError:
+            return CheckResult(ok=False, detail=f"no answer within {self.timeout:.1f} s")
+        except (SQLAlchemyError, OSError) as exc:
+            return CheckResult(ok=False, detail=type(exc).__name__)
+        elapsed = time.perf_counter() - start
+        return CheckResult(ok=True, detail=f"answered in {elapsed * 1000:.0f} ms")
+
+
+async def _seed_applied(conn: AsyncConnection) -> bool:
+    stored = await conn.scalar(
+        select(AppMetadataModel.value).where(AppMetadataModel.key == SEED_FINGERPRINT_KEY),
+    )
+    return stored == expected_seed_fingerprint()
@@ -1,123 +1,340 @@
 import asyncio
+import functools
+import hashlib
+import json
 import logging
+from datetime import datetime
 from typing import Any
 
-from sqlalchemy import select
-from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
+from operaclone2.db.models.app_metadata import AppMetadataModel
 from operaclone2.db.models.hotel import Hotel
 from operaclone2.db.models.room_type import RoomType
 from operaclone2.settings import settings
 
 logger = logging.getLogger(__name__)
 
+SEED_HOTEL_ID = 1
+# Key of the seed fingerprint in the app_metadata table.
+SEED_FINGERPRINT_KEY = "seed_fingerprint"
+
+
+def hotel_seed_data() -> dict[str, Any]:
+    """
+    Get the seeded hotel.
+
+    :return: column values of the hotel.
+    """
+    return {
+        "id": SEED_HOTEL_ID,
+        "hotel_id": "MOVENPICK_ELGOUNA",
+        "hotel_code": "MOV_EG_001",
+        "enterprise_id": "ACCOR",
+        "chain_code": "MOVENPICK",
+        "cluster_code": "ELGOUNA",
+        "hotel_name": "Mövenpick Resort & Spa El Gouna",
+        "hotel_description": (
+            "The 5 star Mövenpick Resort & Spa El Gouna is nestled on a peninsula, "
+            "with its own exclusive beachfront. It offers spectacular views of the "
+            "Red Sea, the tranquil lagoons and the lush gardens. The resort is fully "
+            "wheelchair accessible and environmentally friendly."
+        ),
+        "city_name": "El Gouna",
+        "country_code": "EG",
+        "state_prov": "Red Sea",
+        "postal_code": "84511",
+        "address_lines": ["P.O. Box 72", "Hill Villas Rd", "El Gouna", "Hurghada", "Egypt"],
+        "latitude": 27.3969,
+        "longitude": 33.6766,
+        "currency_code": "EGP",
+        "primary_language": "en",
+        "total_number_of_rooms": 420,
+        "time_zone_name": "Africa/Cairo",
+        "time_zone_offset": "UTC+02:00",
+        "check_in_time": "15:00",
+        "check_out_time": "12:00",
+        "property_amenities": [
+            {"description": "Private Beach", "hotelAmenity": "BEACH"},
+            {"description": "Raa SPA", "hotelAmenity": "SPA"},
+            {"description": "Lagoon-style pool", "hotelAmenity": "POOL"},
+            {"description": "Free WiFi", "hotelAmenity": "WIFI"},
+            {"description": "Golf Course nearby", "hotelAmenity": "GOLF"},
+            {"description": "Conference space (450 sq m)", "hotelAmenity": "CONFERENCE"},
+        ],
+        "communications": {
+            "email": [
+                {
+                    "type": "General",
+                    "check": "2026-01-22",
+                    "address": "resort.elgouna@movenpick.com",
+                }
+            ],
+            "phone": [{"type": "Front Desk", "check": "2026-01-22", "number": "+20 65 3544501"}],
+        },
+    }
+
+
+def room_type_seed_data() -> list[dict[str, Any]]:
+    """
+    Get the room types of the seeded hotel.
+
+    :return: column values of every room type.
+    """
+    rooms_to_seed = []
+
+    # --- Classic King ---
+    room_code_kng = "CLS_KNG"
+
+    amenities_data_kng = {
+        "Food And Beverage": [
+            "Bottled water",
+            "Coffee/tea making facilities",
+            "Kettle",
+            "Mini-refrigerator",
+            "Free in Room Mineral Water",
+            "Mini Bar",
+        ],
+        "Bathroom": [
+            "Accessible bathroom",
+            "Bathroom products",
+            "Flexible showerhead",
+            "Hair dryer in bathroom",
+            "Make-up/magnifying mirror",
+            "Mirror",
+            "Telephone in bathroom",
+            "Towel rack",
+        ],
+        "Media And Technology": [
+            "Wireless internet in your room",
+            "High speed internet",
+            "Direct dial telephone",
+            "Children's TV Channels",
+            "Music TV channels",
+            "Satellite/cable colour TV",
+        ],
+        "Service And Equipment": [
+            "Audible smoke alarms in rooms",
+            "Dead bolt in rooms",
+            "Emergency info in rooms",
+            "Keycard-operated door locks",
+            "Safe deposit box in room",
+            "Security Peephole",
+            "Smoke alarm in room",
+        ],
+        "Comfort Features": ["Blackout curtain", "Hair dryer", "Slippers"],
+        "Electric Facilities": ["220/240 V AC"],
+        "Room Services": ["Operator wake up call"],
+        "Temperature Air Control": [
+            "Air Conditioning",
+            "Individual heating and air conditioning adjustment",
+        ],
+        "Working Area": ["Business Desk"],
+    }
+
+    room_amenities_kng = []
+    for category, items in amenities_data_kng.items():
+        for item in items:
+            room_amenities_kng.append(
+                {
+                    "description": item,
+                    "category": category,
+                    "roomAmenity": item.upper().replace(" ", "_").replace("/", "_")[:20],
+                }
+            )
 
-async def seed_hotel(session_factory=None) -> None:
-    """Seed hotel data into the database."""
-    should_dispose = False
-    engine = None
-    if session_factory is None:
-        engine = create_async_engine(str(settings.db_url), echo=True)
-        session_factory = async_sessionmaker(engine, expire_on_commit=False)
-        should_dispose = True
-
-    async with session_factory() as session:
-        # Check if exists
-        query = select(Hotel).where(Hotel.id == 1)
-        result = await session.execute(query)
-        existing_hotel = result.scalar_one_or_none()
-
-        hotel_data = {
-            "id": 1,
-            "hotel_id": "MOVENPICK_ELGOUNA",
-            "hotel_code": "MOV_EG_001",
-            "enterprise_id": "ACCOR",
-            "chain_code": "MOVENPICK",
-            "cluster_code": "ELGOUNA",
-            "hotel_name": "Mövenpick Resort & Spa El Gouna",
-            "hotel_description": (
-                "The 5 star Mövenpick Resort & Spa El Gouna is nestled on a peninsula, "
-                "with its own exclusive beachfront. It offers spectacular views of the "
-                "Red Sea, the tranquil lagoons and the lush gardens. The resort is fully "
-                "wheelchair accessible and environmentally friendly."
-            ),
-            "city_name": "El Gouna",
-            "country_code": "EG",
-            "state_prov": "Red Sea",
-            "postal_code": "84511",
-            "address_lines": ["P.O. Box 72", "Hill Villas Rd", "El Gouna", "Hurghada", "Egypt"],
-            "latitude": 27.3969,
-            "longitude": 33.6766,
-            "currency_code": "EGP",
-            "primary_language": "en",
-            "total_number_of_rooms": 420,
-            "time_zone_name": "Africa/Cairo",
-            "time_zone_offset": "UTC+02:00",
-            "check_in_time": "15:00",
-            "check_out_time": "12:00",
-            "property_amenities": [
-                {"description": "Private Beach", "hotelAmenity": "BEACH"},
-                {"description": "Raa SPA", "hotelAmenity": "SPA"},
-                {"description": "Lagoon-style pool", "hotelAmenity": "POOL"},
-                {"description": "Free WiFi", "hotelAmenity": "WIFI"},
-                {"description": "Golf Course nearby", "hotelAmenity": "GOLF"},
-                {"description": "Conference space (450 sq m)", "hotelAmenity": "CONFERENCE"},
-            ],
-            "communications": {
-                "email": [
-                    {
-                        "type": "General",
-                        "check": "2026-01-22",
-                        "address": "resort.elgouna@movenpick.com",
-                    }
-                ],
-                "phone": [
-                    {"type": "Front Desk", "check": "2026-01-22", "number": "+20 65 3544501"}
-                ],
+    rooms_to_seed.append(
+        {
+            "hotel_id_fk": SEED_HOTEL_ID,
+            "hotel_room_type": "KNG_GV",
+            "room_type": room_code_kng,
+            "room_name": "Classic King",
+            "room_category": "Standard",
+            "description": [
+                (
+                    "Classic Garden View Rooms accommodate a maximum of two adults "
+                    "and one child. Accessible rooms are available."
+                ),
+                "40m²",
+                "Terrace",
+                "Walk-in shower",
+            ],
+            "room_view_type": "Garden View",
+            "room_primary_bed_type": "King",
+            "non_smoking_ind": True,
+            "occupancy": {
+                "maxOccupancy": 4,
+                "adults": 2,
+                "children": 1,
+                "maxAdults": 2,
+                "maxChildren": 1,
             },
+            "room_amenities": room_amenities_kng,
+            "number_of_units": 10,
         }
+    )
+
+    # --- Classic Twin ---
+    room_code_twn = "CLS_TWN"
+
+    amenities_data_twn = {
+        "Food And Beverage": [
+            "Bottled water",
+            "Coffee/tea making facilities",
+            "Kettle",
+            "Mini-refrigerator",
+            "Free in Room Mineral Water",
+            "Mini Bar",
+        ],
+        "Bathroom": [
+            "Accessible bathroom",
+            "Bathroom products",
+            "Flexible showerhead",
+            "Hair dryer in bathroom",
+            "Make-up/magnifying mirror",
+            "Mirror",
+            "Telephone in bathroom",
+            "Towel rack",
+        ],
+        "Media And Technology": [
+            "Wireless internet in your room",
+            "High speed internet",
+            "Direct dial telephone",
+            "Children's TV Channels",
+            "Music TV channels",
+            "Satellite/cable colour TV",
+        ],
+        "Service And Equipment": [
+            "Audible smoke alarms in rooms",
+            "Dead bolt in rooms",
+            "Emergency info in rooms",
+            "Keycard-operated door locks",
+            "Safe deposit box in room",
+            "Security Peephole",
+            "Smoke alarm in room",
+        ],
+        "Electric Facilities": ["220/240 V AC"],
+        "Room Services": ["Operator wake up call"],
+        "Temperature Air Control": [
+            "Air Conditioning",
+            "Individual heating and air conditioning adjustment",
+        ],
+        "Working Area": ["Business Desk"],
+    }
+
+    room_amenities_twn = []
+    for category, items in amenities_data_twn.items():
+        for item in items:
+            room_amenities_twn.append(
+                {
+                    "description": item,
+                    "category": category,
+                    "roomAmenity": item.upper().replace(" ", "_").replace("/", "_")[:20],
+                }
+            )
 
-        if existing_hotel:
-            logger.info("Updating existing hotel %s", hotel_data["id"])
-            for key, value in hotel_data.items():
-                setattr(existing_hotel, key, value)
-        else:
-            logger.info("Creating new hotel %s", hotel_data["id"])
-            hotel = Hotel(**hotel_data)
-            session.add(hotel)
-
-        await session.commit()
-
-    if should_dispose and engine:
-        await engine.dispose()
-    logger.info("Seed hotel completed successfully.")
-
-
-async def seed_room(session_factory=None) -> None:
-    """Seed room type data into the database."""
-    should_dispose = False
-    engine = None
-    if session_factory is None:
-        engine = create_async_engine(str(settings.db_url), echo=True)
-        session_factory = async_sessionmaker(engine, expire_on_commit=False)
-        should_dispose = True
-
-    async with session_factory() as session:
-        # Find hotel id 1
-        query = select(Hotel).where(Hotel.id == 1)
-        result = await session.execute(query)
-        hotel = result.scalar_one_or_none()
-
-        if not hotel:
-            logger.warning("Hotel with ID 1 not found. Cannot create room.")
-            return
-
-        rooms_to_seed = []
+    rooms_to_seed.append(
+        {
+            "hotel_id_fk": SEED_HOTEL_ID,
+            "hotel_room_type": "TWN_GV",
+            "room_type": room_code_twn,
+            "room_name": "Classic Twin",
+            "room_category": "Standard",
+            "description": [
+                (
+                    "In the bright and modern interiors of our Classic Garden View Rooms, "
+                    "you can relax in a comfortable 40 sqm space with your choice of a "
+                    "king-size bed or two single beds. Enjoy beautiful views over the "
+                    "gardens from your terrace, which provides easy access t"
+                ),
+                "40m²",
+                "Terrace",
+                "Walk-in shower",
+            ],
+            "room_view_type": "Garden View",
+            "room_primary_bed_type": "Twin",
+            "non_smoking_ind": True,
+            "occupancy": {
+                "maxOccupancy": 4,
+                "adults": 2,
+                "children": 1,
+                "maxAdults": 2,
+                "maxChildren": 1,  # Assuming same as king based on request (4 pers max)
+            },
+            "room_amenities": room_amenities_twn,
+            "number_of_units": 10,
+        }
+    )
+
+    # --- Helper for adding amenities ---
+    def add_room_seed(
+        code: str,
+        name: str,
+        category: str,
+        desc: list[str],
+        view: str,
+        bed: str,
+        occupancy: dict[str, Any],
+        hotel_room_type: str,
+        amenities: dict[str, list[str]],
+        size_sqm: int = 40,
+        price: float | None = None,
+    ) -> None:
+        # Basic amenities construction
+        r_amenities = []
+        for category_name, items in amenities.items():
+            for item in items:
+                r_amenities.append(
+                    {
+                        "description": item,
+                        "category": category_name,
+                        "roomAmenity": item.upper()
+                        .replace(" ", "_")
+                        .replace("/", "_")
+                        .replace("-", "_")[:20],
+                    }
+                )
 
-        # --- Classic King ---
-        room_code_kng = "CLS_KNG"
+        rooms_to_seed.append(
+            {
+                "hotel_id_fk": SEED_HOTEL_ID,
+                "hotel_room_type": hotel_room_type,
+                "room_type": code,
+                "room_name": name,
+                "room_category": category,
+                "description": desc,
+                "room_view_type": view,
+                "room_primary_bed_type": bed,
+                "non_smoking_ind": True,
+                "occupancy": occupancy,
+                "room_amenities": r_amenities,
+                "number_of_units": 10,
+            }
+        )
 
-        amenities_data_kng = {
+    # 1. Deluxe King Lagoon View
+    add_room_seed(
+        "DLX_KNG_LV",
+        "Deluxe King Lagoon View",
+        "Deluxe",
+        [
+            (
+                "Deluxe Lagoon View Rooms offer a comfortable space of 40 sqm with a "
+                "stunning, modern design in which your choice of a king bed or twin beds "
+                "is centred, facing the lagoon. A shower and hairdryer are available in "
+                "the bathroom. F"
+            ),
+            "40m²",
+            "Balcony or Terrace",
+            "Walk-in shower",
+            "High floor",
+        ],
+        "Lagoon View",
+        "King",
+        {"maxOccupancy": 4, "adults": 2, "children": 1, "maxAdults": 2, "maxChildren": 1},
+        "DLX_LG_KNG",
+        {
             "Food And Beverage": [
                 "Bottled water",
                 "Coffee/tea making facilities",
@@ -161,54 +378,31 @@ async def seed_room(session_factory=None) -> None:
                 "Individual heating and air conditioning adjustment",
             ],
             "Working Area": ["Business Desk"],
-        }
-
-        room_amenities_kng = []
-        for category, items in amenities_data_kng.items():
-            for item in items:
-                room_amenities_kng.append(
-                    {
-                        "description": item,
-                        "category": category,
-                        "roomAmenity": item.upper().replace(" ", "_").replace("/", "_")[:20],
-                    }
-                )
-
-        rooms_to_seed.append(
-            {
-                "hotel_id_fk": hotel.id,
-                "hotel_room_type": "KNG_GV",
-                "room_type": room_code_kng,
-                "room_name": "Classic King",
-                "room_category": "Standard",
-                "description": [
-                    (
-                        "Classic Garden View Rooms accommodate a maximum of two adults "
-                        "and one child. Accessible rooms are available."
-                    ),
-                    "40m²",
-                    "Terrace",
-                    "Walk-in shower",
-                ],
-                "room_view_type": "Garden View",
-                "room_primary_bed_type": "King",
-                "non_smoking_ind": True,
-                "occupancy": {
-                    "maxOccupancy": 4,
-                    "adults": 2,
-                    "children": 1,
-                    "maxAdults": 2,
-                    "maxChildren": 1,
-                },
-                "room_amenities": room_amenities_kng,
-                "number_of_units": 10,
-            }
-        )
-
-        # --- Classic Twin ---
-        room_code_twn = "CLS_TWN"
-
-        amenities_data_twn = {
+        },
+    )
+
+    # 2. Deluxe Twin Lagoon View
+    add_room_seed(
+        "DLX_TWN_LV",
+        "Deluxe Twin Lagoon View",
+        "Deluxe",
+        [
+            (
+                "Deluxe Lagoon View Rooms offer a comfortable space of 40 sqm with a "
+                "stunning, modern design in which your choice of a king bed or twin beds "
+                "is centred, facing the lagoon. A shower and hairdryer are available in "
+                "the bathroom."
+            ),
+            "40m²",
+            "Balcony or Terrace",
+            "Walk-in shower",
+            "High floor",
+        ],
+        "Lagoon View",
+        "Twin",
+        {"maxOccupancy": 4, "adults": 2, "children": 1, "maxAdults": 2, "maxChildren": 1},
+        "DLX_LG_TWN",
+        {
             "Food And Beverage": [
                 "Bottled water",
                 "Coffee/tea making facilities",
@@ -244,6 +438,7 @@ async def seed_room(session_factory=None) -> None:
                 "Security Peephole",
                 "Smoke alarm in room",
             ],
+            "Comfort Features": ["Blackout curtain", "Hair dryer", "Slippers"],
             "Electric Facilities": ["220/240 V AC"],
             "Room Services": ["Operator wake up call"],
             "Temperature Air Control": [
@@ -251,611 +446,466 @@ async def seed_room(session_factory=None) -> None:
                 "Individual heating and air conditioning adjustment",
             ],
             "Working Area": ["Business Desk"],
-        }
+        },
+    )
+
+    # 3. Deluxe King Sea View
+    add_room_seed(
+        "DLX_KNG_SV",
+        "Deluxe King Sea View",
+        "Deluxe",
+        [
+            (
+                "Deluxe Sea View Rooms accommodate a maximum of two adults and one "
+                "child in the existing bedding."
+            ),
+            "40m²",
+            "Balcony or Terrace",
+            "Walk-in shower",
+            "High floor",
+        ],
+        "Ocean/Sea View",
+        "King",
+        {"maxOccupancy": 4, "adults": 2, "children": 1, "maxAdults": 2, "maxChildren": 1},
+        "DLX_SV_KNG",
+        {
+            "Food And Beverage": [
+                "Bottled water",
+                "Coffee/tea making facilities",
+                "Kettle",
+                "Mini-refrigerator",
+                "Free in Room Mineral Water",
+                "Mini Bar",
+            ],
+            "Bathroom": [
+                "Accessible bathroom",
+                "Bathroom products",
+                "Flexible showerhead",
+                "Hair dryer in bathroom",
+                "Make-up/magnifying mirror",
+                "Mirror",
+                "Telephone in bathroom",
+                "Towel rack",
+            ],
+            "Media And Technology": [
+                "Wireless internet in your room",
+                "High speed internet",
+                "Direct dial telephone",
+                "Children's TV Channels",
+                "Music TV channels",
+                "Satellite/cable colour TV",
+            ],
+            "Service And Equipment": [
+                "Audible smoke alarms in rooms",
+                "Dead bolt in rooms",
+                "Emergency info in rooms",
+                "Keycard-operated door locks",
+                "Safe deposit box in room",
+                "Security Peephole",
+                "Smoke alarm in room",
+            ],
+            # No Comfort Features requested for this specific room
+            "Electric Facilities": ["220/240 V AC"],
+            "Room Services": ["Operator wake up call"],
+            "Temperature Air Control": [
+                "Air Conditioning",
+                "Individual heating and air conditioning adjustment",
+            ],
+            "Working Area": ["Business Desk"],
+        },
+    )
+
+    # 4. Deluxe Twin Sea View
+    add_room_seed(
+        "DLX_TWN_SV",
+        "Deluxe Twin Sea View",
+        "Deluxe",
+        [
+            (
+                "Our Deluxe Sea View Rooms welcome you into a superior 40 sqm space "
+                "which offers exquisite comfort in a prime location. Enjoy breath-taking "
+                "views over the Red Sea from your balcony or terrace."
+            ),
+            "40m²",
+            "Balcony or Terrace",
+            "Walk-in shower",
+            "High floor",
+        ],
+        "Ocean/Sea View",
+        "Twin",
+        {"maxOccupancy": 4, "adults": 2, "children": 1, "maxAdults": 2, "maxChildren": 1},
+        "DLX_SV_TWN",
+        {
+            "Food And Beverage": [
+                "Bottled water",
+                "Coffee/tea making facilities",
+                "Kettle",
+                "Mini-refrigerator",
+                "Free in Room Mineral Water",
+                "Mini Bar",
+            ],
+            "Bathroom": [
+                "Accessible bathroom",
+                "Bathroom products",
+                "Flexible showerhead",
+                "Hair dryer in bathroom",
+                "Make-up/magnifying mirror",
+                "Mirror",
+                "Telephone in bathroom",
+                "Towel rack",
+            ],
+            "Media And Technology": [
+                "Wireless internet in your room",
+                "High speed internet",
+                "Direct dial telephone",
+                "Children's TV Channels",
+                "Music TV channels",
+                "Satellite/cable colour TV",
+            ],
+            "Service And Equipment": [
+                "Audible smoke alarms in rooms",
+                "Dead bolt in rooms",
+                "Emergency info in rooms",
+                "Keycard-operated door locks",
+                "Safe deposit box in room",
+                "Security Peephole",
+                "Smoke alarm in room",
+            ],
+            "Comfort Features": ["Blackout curtain", "Slippers"],
+            "Electric Facilities": ["220/240 V AC"],
+            "Room Services": ["Operator wake up call"],
+            "Temperature Air Control": [
+                "Air Conditioning",
+                "Individual heating and air conditioning adjustment",
+            ],
+            "Working Area": ["Business Desk"],
+        },
+    )
+
+    # 5. Family room lagoon view
+    add_room_seed(
+        "FAM_LG",
+        "Family room lagoon view",
+        "Family",
+        [
+            (
+                "More space, a cool design and great views make our Family Lagoon View "
+                "Rooms an excellent choice for families. The 50 sqm duplex rooms are "
+                "spread over two floors, with the lower area featuring a king-size bed, "
+                "while an elevated sleeping area"
+            ),
+            "50m²",
+            "Balcony or Duplex",
+            "Walk-in shower",
+            "High floor",
+        ],
+        "Lagoon View",
+        "King",
+        {
+            "maxOccupancy": 4,
+            "adults": 2,
+            "children": 2,
+            "maxAdults": 2,
+            "maxChildren": 2,
+        },  # Adjusted slightly for Family room intuition but staying close to 4 max
+        "FAM_LG",
+        {
+            "Food And Beverage": [
+                "Bottled water",
+                "Coffee/tea making facilities",
+                "Kettle",
+                "Mini-refrigerator",
+                "Free in Room Mineral Water",
+                "Mini Bar",
+            ],
+            "Bathroom": [
+                "Accessible bathroom",
+                "Bathroom products",
+                "Flexible showerhead",
+                "Hair dryer in bathroom",
+                "Make-up/magnifying mirror",
+                "Mirror",
+                "Telephone in bathroom",
+                "Towel rack",
+            ],
+            "Media And Technology": [
+                "Wireless internet in your room",
+                "High speed internet",
+                "Direct dial telephone",
+                "Children's TV Channels",
+                "Music TV channels",
+                "Satellite/cable colour TV",
+            ],
+            "Service And Equipment": [
+                "Audible smoke alarms in rooms",
+                "Dead bolt in rooms",
+                "Emergency info in rooms",
+                "Keycard-operated door locks",
+                "Safe deposit box in room",
+                "Security Peephole",
+                "Smoke alarm in room",
+            ],
+            "Comfort Features": ["Blackout curtain", "Hair dryer"],
+            "Electric Facilities": ["220/240 V AC"],
+            "Room Services": ["Operator wake up call"],
+            "Temperature Air Control": [
+                "Air Conditioning",
+                "Individual heating and air conditioning adjustment",
+            ],
+            "Working Area": ["Business Desk"],
+        },
+        size_sqm=50,
+    )
+
+    # 6. Deluxe Suite Sea View
+    add_room_seed(
+        "DLX_STE_SV",
+        "Deluxe Suite Sea View",
+        "Suite",
+        [
+            (
+                "Relax and unwind in our comfortable Deluxe Sea View Suites, which are "
+                "superb 72 sqm retreats in a great waterfront location, with lagoon or "
+                "sea views."
+            ),
+            "72m²",
+            "Balcony or Terrace",
+            "Bath",
+            "Separate tub and shower",
+            "High floor",
+        ],
+        "Ocean/Sea View",
+        "King",
+        {"maxOccupancy": 4, "adults": 2, "children": 2, "maxAdults": 2, "maxChildren": 2},
+        "DLX_SV_STE",
+        {
+            "Food And Beverage": [
+                "Bottled water",
+                "Coffee/tea making facilities",
+                "Kettle",
+                "Mini-refrigerator",
+                "Free in Room Mineral Water",
+                "Mini Bar",
+            ],
+            "Bathroom": [
+                "Bathroom products",
+                "Bidet",
+                "Flexible showerhead",
+                "Hair dryer in bathroom",
+                "Make-up/magnifying mirror",
+                "Mirror",
+                "Telephone in bathroom",
+                "Towel rack",
+            ],  # Note: "Accessible bathroom" removed per req
+            "Media And Technology": [
+                "Wireless internet in your room",
+                "High speed internet",
+                "Direct dial telephone",
+                "Children's TV Channels",
+                "Music TV channels",
+                "Satellite/cable colour TV",
+            ],
+            "Service And Equipment": [
+                "Audible smoke alarms in rooms",
+                "Dead bolt in rooms",
+                "Emergency info in rooms",
+                "Keycard-operated door locks",
+                "Safe deposit box in room",
+                "Security Peephole",
+                "Smoke alarm in room",
+            ],
+            "Comfort Features": ["Blackout curtain", "Hair dryer", "Turn Down Services"],
+            "Electric Facilities": ["220/240 V AC"],
+            "Room Services": ["Operator wake up call"],
+            "Temperature Air Control": [
+                "Air Conditioning",
+                "Individual heating and air conditioning adjustment",
+            ],
+            "Working Area": ["Business Desk"],
+        },
+        size_sqm=72,
+    )
+
+    # 7. Family Suite Sea view
+    add_room_seed(
+        "FAM_STE_SV",
+        "Family Suite Sea view",
+        "Suite",
+        [
+            (
+                "The Family Sea View Suite offers exquisite comfort and space for family "
+                "or friends. The 112 sqm space features a comfortable living room with "
+                "sofa corner and dining table, two separate ensuite bedrooms."
+            ),
+            "112m²",
+            "Terrace",
+            "Bath",
+            "Walk-in shower",
+        ],
+        "Ocean/Sea View",
+        "King",
+        {
+            "maxOccupancy": 3,
+            "adults": 3,
+            "children": 0,
+            "maxAdults": 3,
+            "maxChildren": 0,
+        },  # Request says 3 pers max
+        "FAM_SV_STE",
+        {
+            "Food And Beverage": [
+                "Bottled water",
+                "Coffee/tea making facilities",
+                "Kettle",
+                "Mini Bar",
+                "Mini bar with free soft drinks",
+                "Mini-refrigerator",
+                "Free in Room Mineral Water",
+            ],
+            "Bathroom": [
+                "Bathroom products",
+                "Bidet",
+                "Flexible showerhead",
+                "Hair dryer in bathroom",
+                "Make-up/magnifying mirror",
+                "Mirror",
+                "Telephone in bathroom",
+                "Towel rack",
+            ],
+            "Media And Technology": [
+                "Wireless internet in your room",
+                "High speed internet",
+                "Direct dial telephone",
+                "Children's TV Channels",
+                "Music TV channels",
+                "Satellite/cable colour TV",
+            ],
+            "Service And Equipment": [
+                "Audible smoke alarms in rooms",
+                "Dead bolt in rooms",
+                "Emergency info in rooms",
+                "Keycard-operated door locks",
+                "Safe deposit box in room",
+                "Security Peephole",
+                "Smoke alarm in room",
+            ],
+            # No Comfort Features
+            "Electric Facilities": ["220/240 V AC"],
+            "Room Services": ["Operator wake up call"],
+            "Temperature Air Control": [
+                "Air Conditioning",
+                "Individual heating and air conditioning adjustment",
+            ],
+            "Working Area": ["Business Desk"],
+        },
+        size_sqm=112,
+    )
 
-        room_amenities_twn = []
-        for category, items in amenities_data_twn.items():
-            for item in items:
-                room_amenities_twn.append(
-                    {
-                        "description": item,
-                        "category": category,
-                        "roomAmenity": item.upper().replace(" ", "_").replace("/", "_")[:20],
-                    }
-                )
+    return rooms_to_seed
 
-        rooms_to_seed.append(
-            {
-                "hotel_id_fk": hotel.id,
-                "hotel_room_type": "TWN_GV",
-                "room_type": room_code_twn,
-                "room_name": "Classic Twin",
-                "room_category": "Standard",
-                "description": [
-                    (
-                        "In the bright and modern interiors of our Classic Garden View Rooms, "
-                        "you can relax in a comfortable 40 sqm space with your choice of a "
-                        "king-size bed or two single beds. Enjoy beautiful views over the "
-                        "gardens from your terrace, which provides easy access t"
-                    ),
-                    "40m²",
-                    "Terrace",
-                    "Walk-in shower",
-                ],
-                "room_view_type": "Garden View",
-                "room_primary_bed_type": "Twin",
-                "non_smoking_ind": True,
-                "occupancy": {
-                    "maxOccupancy": 4,
-                    "adults": 2,
-                    "children": 1,
-                    "maxAdults": 2,
-                    "maxChildren": 1,  # Assuming same as king based on request (4 pers max)
-                },
-                "room_amenities": room_amenities_twn,
-                "number_of_units": 10,
-            }
-        )
 
-        # --- Helper for adding amenities ---
-        def add_room_seed(
-            code: str,
-            name: str,
-            category: str,
-            desc: list[str],
-            view: str,
-            bed: str,
-            occupancy: dict[str, Any],
-            hotel_room_type: str,
-            amenities: dict[str, list[str]],
-            size_sqm: int = 40,
-            price: float | None = None,
-        ) -> None:
-            # Basic amenities construction
-            r_amenities = []
-            for category_name, items in amenities.items():
-                for item in items:
-                    r_amenities.append(
-                        {
-                            "description": item,
-                            "category": category_name,
-                            "roomAmenity": item.upper()
-                            .replace(" ", "_")
-                            .replace("/", "_")
-                            .replace("-", "_")[:20],
-                        }
-                    )
-
-            rooms_to_seed.append(
-                {
-                    "hotel_id_fk": hotel.id,
-                    "hotel_room_type": hotel_room_type,
-                    "room_type": code,
-                    "room_name": name,
-                    "room_category": category,
-                    "description": desc,
-                    "room_view_type": view,
-                    "room_primary_bed_type": bed,
-                    "non_smoking_ind": True,
-                    "occupancy": occupancy,
-                    "room_amenities": r_amenities,
-                    "number_of_units": 10,
-                }
-            )
+def seed_fingerprint(hotel: dict[str, Any], room_types: list[dict[str, Any]]) -> str:
+    """
+    Get a content hash of the seed data.
 
-        # 1. Deluxe King Lagoon View
-        add_room_seed(
-            "DLX_KNG_LV",
-            "Deluxe King Lagoon View",
-            "Deluxe",
-            [
-                (
-                    "Deluxe Lagoon View Rooms offer a comfortable space of 40 sqm with a "
-                    "stunning, modern design in which your choice of a king bed or twin beds "
-                    "is centred, facing the lagoon. A shower and hairdryer are available in "
-                    "the bathroom. F"
-                ),
-                "40m²",
-                "Balcony or Terrace",
-                "Walk-in shower",
-                "High floor",
-            ],
-            "Lagoon View",
-            "King",
-            {"maxOccupancy": 4, "adults": 2, "children": 1, "maxAdults": 2, "maxChildren": 1},
-            "DLX_LG_KNG",
-            {
-                "Food And Beverage": [
-                    "Bottled water",
-                    "Coffee/tea making facilities",
-                    "Kettle",
-                    "Mini-refrigerator",
-                    "Free in Room Mineral Water",
-                    "Mini Bar",
-                ],
-                "Bathroom": [
-                    "Accessible bathroom",
-                    "Bathroom products",
-                    "Flexible showerhead",
-                    "Hair dryer in bathroom",
-                    "Make-up/magnifying mirror",
-                    "Mirror",
-                    "Telephone in bathroom",
-                    "Towel rack",
-                ],
-                "Media And Technology": [
-                    "Wireless internet in your room",
-                    "High speed internet",
-                    "Direct dial telephone",
-                    "Children's TV Channels",
-                    "Music TV channels",
-                    "Satellite/cable colour TV",
-                ],
-                "Service And Equipment": [
-                    "Audible smoke alarms in rooms",
-                    "Dead bolt in rooms",
-                    "Emergency info in rooms",
-                    "Keycard-operated door locks",
-                    "Safe deposit box in room",
-                    "Security Peephole",
-                    "Smoke alarm in room",
-                ],
-                "Comfort Features": ["Blackout curtain", "Hair dryer", "Slippers"],
-                "Electric Facilities": ["220/240 V AC"],
-                "Room Services": ["Operator wake up call"],
-                "Temperature Air Control": [
-                    "Air Conditioning",
-                    "Individual heating and air conditioning adjustment",
-                ],
-                "Working Area": ["Business Desk"],
-            },
-        )
+    :param hotel: column values of the hotel.
+    :param room_types: column values of the room types.
+    :return: SHA-256 hex digest, stable across processes.
+    """
+    payload = json.dumps(
+        {"hotel": hotel, "roomTypes": room_types},
+        sort_keys=True,
+        ensure_ascii=False,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
 
-        # 2. Deluxe Twin Lagoon View
-        add_room_seed(
-            "DLX_TWN_LV",
-            "Deluxe Twin Lagoon View",
-            "Deluxe",
-            [
-                (
-                    "Deluxe Lagoon View Rooms offer a comfortable space of 40 sqm with a "
-                    "stunning, modern design in which your choice of a king bed or twin beds "
-                    "is centred, facing the lagoon. A shower and hairdryer are available in "
-                    "the bathroom."
-                ),
-                "40m²",
-                "Balcony or Terrace",
-                "Walk-in shower",
-                "High floor",
-            ],
-            "Lagoon View",
-            "Twin",
-            {"maxOccupancy": 4, "adults": 2, "children": 1, "maxAdults": 2, "maxChildren": 1},
-            "DLX_LG_TWN",
-            {
-                "Food And Beverage": [
-                    "Bottled water",
-                    "Coffee/tea making facilities",
-                    "Kettle",
-                    "Mini-refrigerator",
-                    "Free in Room Mineral Water",
-                    "Mini Bar",
-                ],
-                "Bathroom": [
-                    "Accessible bathroom",
-                    "Bathroom products",
-                    "Flexible showerhead",
-                    "Hair dryer in bathroom",
-                    "Make-up/magnifying mirror",
-                    "Mirror",
-                    "Telephone in bathroom",
-                    "Towel rack",
-                ],
-                "Media And Technology": [
-                    "Wireless internet in your room",
-                    "High speed internet",
-                    "Direct dial telephone",
-                    "Children's TV Channels",
-                    "Music TV channels",
-                    "Satellite/cable colour TV",
-                ],
-                "Service And Equipment": [
-                    "Audible smoke alarms in rooms",
-                    "Dead bolt in rooms",
-                    "Emergency info in rooms",
-                    "Keycard-operated door locks",
-                    "Safe deposit box in room",
-                    "Security Peephole",
-                    "Smoke alarm in room",
-                ],
-                "Comfort Features": ["Blackout curtain", "Hair dryer", "Slippers"],
-                "Electric Facilities": ["220/240 V AC"],
-                "Room Services": ["Operator wake up call"],
-                "Temperature Air Control": [
-                    "Air Conditioning",
-                    "Individual heating and air conditioning adjustment",
-                ],
-                "Working Area": ["Business Desk"],
-            },
-        )
 
-        # 3. Deluxe King Sea View
-        add_room_seed(
-            "DLX_KNG_SV",
-            "Deluxe King Sea View",
-            "Deluxe",
-            [
-                (
-                    "Deluxe Sea View Rooms accommodate a maximum of two adults and one "
-                    "child in the existing bedding."
-                ),
-                "40m²",
-                "Balcony or Terrace",
-                "Walk-in shower",
-                "High floor",
-            ],
-            "Ocean/Sea View",
-            "King",
-            {"maxOccupancy": 4, "adults": 2, "children": 1, "maxAdults": 2, "maxChildren": 1},
-            "DLX_SV_KNG",
-            {
-                "Food And Beverage": [
-                    "Bottled water",
-                    "Coffee/tea making facilities",
-                    "Kettle",
-                    "Mini-refrigerator",
-                    "Free in Room Mineral Water",
-                    "Mini Bar",
-                ],
-                "Bathroom": [
-                    "Accessible bathroom",
-                    "Bathroom products",
-                    "Flexible showerhead",
-                    "Hair dryer in bathroom",
-                    "Make-up/magnifying mirror",
-                    "Mirror",
-                    "Telephone in bathroom",
-                    "Towel rack",
-                ],
-                "Media And Technology": [
-                    "Wireless internet in your room",
-                    "High speed internet",
-                    "Direct dial telephone",
-                    "Children's TV Channels",
-                    "Music TV channels",
-                    "Satellite/cable colour TV",
-                ],
-                "Service And Equipment": [
-                    "Audible smoke alarms in rooms",
-                    "Dead bolt in rooms",
-                    "Emergency info in rooms",
-                    "Keycard-operated door locks",
-                    "Safe deposit box in room",
-                    "Security Peephole",
-                    "Smoke alarm in room",
-                ],
-                # No Comfort Features requested for this specific room
-                "Electric Facilities": ["220/240 V AC"],
-                "Room Services": ["Operator wake up call"],
-                "Temperature Air Control": [
-                    "Air Conditioning",
-                    "Individual heating and air conditioning adjustment",
-                ],
-                "Working Area": ["Business Desk"],
-            },
-        )
+@functools.cache
+def expected_seed_fingerprint() -> str:
+    """
+    Get the fingerprint stored once the current seed data is applied.
 
-        # 4. Deluxe Twin Sea View
-        add_room_seed(
-            "DLX_TWN_SV",
-            "Deluxe Twin Sea View",
-            "Deluxe",
-            [
-                (
-                    "Our Deluxe Sea View Rooms welcome you into a superior 40 sqm space "
-                    "which offers exquisite comfort in a prime location. Enjoy breath-taking "
-                    "views over the Red Sea from your balcony or terrace."
-                ),
-                "40m²",
-                "Balcony or Terrace",
-                "Walk-in shower",
-                "High floor",
-            ],
-            "Ocean/Sea View",
-            "Twin",
-            {"maxOccupancy": 4, "adults": 2, "children": 1, "maxAdults": 2, "maxChildren": 1},
-            "DLX_SV_TWN",
-            {
-                "Food And Beverage": [
-                    "Bottled water",
-                    "Coffee/tea making facilities",
-                    "Kettle",
-                    "Mini-refrigerator",
-                    "Free in Room Mineral Water",
-                    "Mini Bar",
-                ],
-                "Bathroom": [
-                    "Accessible bathroom",
-                    "Bathroom products",
-                    "Flexible showerhead",
-                    "Hair dryer in bathroom",
-                    "Make-up/magnifying mirror",
-                    "Mirror",
-                    "Telephone in bathroom",
-                    "Towel rack",
-                ],
-                "Media And Technology": [
-                    "Wireless internet in your room",
-                    "High speed internet",
-                    "Direct dial telephone",
-                    "Children's TV Channels",
-                    "Music TV channels",
-                    "Satellite/cable colour TV",
-                ],
-                "Service And Equipment": [
-                    "Audible smoke alarms in rooms",
-                    "Dead bolt in rooms",
-                    "Emergency info in rooms",
-                    "Keycard-operated door locks",
-                    "Safe deposit box in room",
-                    "Security Peephole",
-                    "Smoke alarm in room",
-                ],
-                "Comfort Features": ["Blackout curtain", "Slippers"],
-                "Electric Facilities": ["220/240 V AC"],
-                "Room Services": ["Operator wake up call"],
-                "Temperature Air Control": [
-                    "Air Conditioning",
-                    "Individual heating and air conditioning adjustment",
-                ],
-                "Working Area": ["Business Desk"],
-            },
-        )
+    :return: fingerprint of ``hotel_seed_data`` and ``room_type_seed_data``.
+    """
+    return seed_fingerprint(hotel_seed_data(), room_type_seed_data())
 
-        # 5. Family room lagoon view
-        add_room_seed(
-            "FAM_LG",
-            "Family room lagoon view",
-            "Family",
-            [
-                (
-                    "More space, a cool design and great views make our Family Lagoon View "
-                    "Rooms an excellent choice for families. The 50 sqm duplex rooms are "
-                    "spread over two floors, with the lower area featuring a king-size bed, "
-                    "while an elevated sleeping area"
-                ),
-                "50m²",
-                "Balcony or Duplex",
-                "Walk-in shower",
-                "High floor",
-            ],
-            "Lagoon View",
-            "King",
-            {
-                "maxOccupancy": 4,
-                "adults": 2,
-                "children": 2,
-                "maxAdults": 2,
-                "maxChildren": 2,
-            },  # Adjusted slightly for Family room intuition but staying close to 4 max
-            "FAM_LG",
-            {
-                "Food And Beverage": [
-                    "Bottled water",
-                    "Coffee/tea making facilities",
-                    "Kettle",
-                    "Mini-refrigerator",
-                    "Free in Room Mineral Water",
-                    "Mini Bar",
-                ],
-                "Bathroom": [
-                    "Accessible bathroom",
-                    "Bathroom products",
-                    "Flexible showerhead",
-                    "Hair dryer in bathroom",
-                    "Make-up/magnifying mirror",
-                    "Mirror",
-                    "Telephone in bathroom",
-                    "Towel rack",
-                ],
-                "Media And Technology": [
-                    "Wireless internet in your room",
-                    "High speed internet",
-                    "Direct dial telephone",
-                    "Children's TV Channels",
-                    "Music TV channels",
-                    "Satellite/cable colour TV",
-                ],
-                "Service And Equipment": [
-                    "Audible smoke alarms in rooms",
-                    "Dead bolt in rooms",
-                    "Emergency info in rooms",
-                    "Keycard-operated door locks",
-                    "Safe deposit box in room",
-                    "Security Peephole",
-                    "Smoke alarm in room",
-                ],
-                "Comfort Features": ["Blackout curtain", "Hair dryer"],
-                "Electric Facilities": ["220/240 V AC"],
-                "Room Services": ["Operator wake up call"],
-                "Temperature Air Control": [
-                    "Air Conditioning",
-                    "Individual heating and air conditioning adjustment",
-                ],
-                "Working Area": ["Business Desk"],
-            },
-            size_sqm=50,
+
+async def _apply_seed(session_factory: async_sessionmaker[AsyncSession]) -> bool:
+    hotel = hotel_seed_data()
+    room_types = room_type_seed_data()
+    fingerprint = expected_seed_fingerprint()
+
+    async with session_factory() as session:
+        stored = await session.get(AppMetadataModel, SEED_FINGERPRINT_KEY)
+        if stored is not None and stored.value == fingerprint:
+            logger.info("Seed data is up to date (%s), skipping.", fingerprint[:12])
+            return False
+
+        hotel_insert = insert(Hotel).values(hotel)
+        await session.execute(
+            hotel_insert.on_conflict_do_update(
+                index_elements=[Hotel.id],
+                set_={key: hotel_insert.excluded[key] for key in hotel if key != "id"},
+            ),
         )
 
-        # 6. Deluxe Suite Sea View
-        add_room_seed(
-            "DLX_STE_SV",
-            "Deluxe Suite Sea View",
-            "Suite",
-            [
-                (
-                    "Relax and unwind in our comfortable Deluxe Sea View Suites, which are "
-                    "superb 72 sqm retreats in a great waterfront location, with lagoon or "
-                    "sea views."
-                ),
-                "72m²",
-                "Balcony or Terrace",
-                "Bath",
-                "Separate tub and shower",
-                "High floor",
-            ],
-            "Ocean/Sea View",
-            "King",
-            {"maxOccupancy": 4, "adults": 2, "children": 2, "maxAdults": 2, "maxChildren": 2},
-            "DLX_SV_STE",
-            {
-                "Food And Beverage": [
-                    "Bottled water",
-                    "Coffee/tea making facilities",
-                    "Kettle",
-                    "Mini-refrigerator",
-                    "Free in Room Mineral Water",
-                    "Mini Bar",
-                ],
-                "Bathroom": [
-                    "Bathroom products",
-                    "Bidet",
-                    "Flexible showerhead",
-                    "Hair dryer in bathroom",
-                    "Make-up/magnifying mirror",
-                    "Mirror",
-                    "Telephone in bathroom",
-                    "Towel rack",
-                ],  # Note: "Accessible bathroom" removed per req
-                "Media And Technology": [
-                    "Wireless internet in your room",
-                    "High speed internet",
-                    "Direct dial telephone",
-                    "Children's TV Channels",
-                    "Music TV channels",
-                    "Satellite/cable colour TV",
-                ],
-                "Service And Equipment": [
-                    "Audible smoke alarms in rooms",
-                    "Dead bolt in rooms",
-                    "Emergency info in rooms",
-                    "Keycard-operated door locks",
-                    "Safe deposit box in room",
-                    "Security Peephole",
-                    "Smoke alarm in room",
-                ],
-                "Comfort Features": ["Blackout curtain", "Hair dryer", "Turn Down Services"],
-                "Electric Facilities": ["220/240 V AC"],
-                "Room Services": ["Operator wake up call"],
-                "Temperature Air Control": [
-                    "Air Conditioning",
-                    "Individual heating and air conditioning adjustment",
-                ],
-                "Working Area": ["Business Desk"],
-            },
-            size_sqm=72,
+        room_insert = insert(RoomType).values(room_types)
+        await session.execute(
+            room_insert.on_conflict_do_update(
+                constraint=RoomType.HOTEL_ROOM_TYPE_CONSTRAINT,
+                set_={key: room_insert.excluded[key] for key in room_types[0]},
+            ),
         )
 
-        # 7. Family Suite Sea view
-        add_room_seed(
-            "FAM_STE_SV",
-            "Family Suite Sea view",
-            "Suite",
-            [
-                (
-                    "The Family Sea View Suite offers exquisite comfort and space for family "
-                    "or friends. The 112 sqm space features a comfortable living room with "
-                    "sofa corner and dining table, two separate ensuite bedrooms."
-                ),
-                "112m²",
-                "Terrace",
-                "Bath",
-                "Walk-in shower",
-            ],
-            "Ocean/Sea View",
-            "King",
-            {
-                "maxOccupancy": 3,
-                "adults": 3,
-                "children": 0,
-                "maxAdults": 3,
-                "maxChildren": 0,
-            },  # Request says 3 pers max
-            "FAM_SV_STE",
-            {
-                "Food And Beverage": [
-                    "Bottled water",
-                    "Coffee/tea making facilities",
-                    "Kettle",
-                    "Mini Bar",
-                    "Mini bar with free soft drinks",
-                    "Mini-refrigerator",
-                    "Free in Room Mineral Water",
-                ],
-                "Bathroom": [
-                    "Bathroom products",
-                    "Bidet",
-                    "Flexible showerhead",
-                    "Hair dryer in bathroom",
-                    "Make-up/magnifying mirror",
-                    "Mirror",
-                    "Telephone in bathroom",
-                    "Towel rack",
-                ],
-                "Media And Technology": [
-                    "Wireless internet in your room",
-                    "High speed internet",
-                    "Direct dial telephone",
-                    "Children's TV Channels",
-                    "Music TV channels",
-                    "Satellite/cable colour TV",
-                ],
-                "Service And Equipment": [
-                    "Audible smoke alarms in rooms",
-                    "Dead bolt in rooms",
-                    "Emergency info in rooms",
-                    "Keycard-operated door locks",
-                    "Safe deposit box in room",
-                    "Security Peephole",
-                    "Smoke alarm in room",
-                ],
-                # No Comfort Features
-                "Electric Facilities": ["220/240 V AC"],
-                "Room Services": ["Operator wake up call"],
-                "Temperature Air Control": [
-                    "Air Conditioning",
-                    "Individual heating and air conditioning adjustment",
-                ],
-                "Working Area": ["Business Desk"],
-            },
-            size_sqm=112,
+        metadata_insert = insert(AppMetadataModel).values(
+            key=SEED_FINGERPRINT_KEY,
+            value=fingerprint,
+            update_date_time=datetime.now(),
         )
+        await session.execute(
+            metadata_insert.on_conflict_do_update(
+                index_elements=[AppMetadataModel.key],
+                set_={
+                    "value": metadata_insert.excluded.value,
+                    "update_date_time": metadata_insert.excluded.update_date_time,
+                },
+            ),
+        )
+        await session.commit()
 
-        for room_data in rooms_to_seed:
-            r_code = room_data["room_type"]
-            # Check if room exists
-            query_room = select(RoomType).where(
-                RoomType.room_type == r_code, RoomType.hotel_id_fk == hotel.id
-            )
-            result_room = await session.execute(query_room)
-            existing_room = result_room.scalar_one_or_none()
-
-            if existing_room:
-                logger.info("Updating existing room %s", r_code)
-                for key, value in room_data.items():
-                    setattr(existing_room, key, value)
-            else:
-                logger.info("Creating new room %s", r_code)
-                new_room = RoomType(**room_data)
-                session.add(new_room)
+    logger.info(
+        "Seeded 1 hotel and %d room types (%s).",
+        len(room_types),
+        fingerprint[:12],
+    )
+    return True
 
-        await session.commit()
 
-    if should_dispose and engine:
-        await engine.dispose()
-    logger.info("Seed room completed successfully.")
+async def seed_database(
+    session_factory: async_sessionmaker[AsyncSession] | None = None,
+) -> bool:
+    """
+    Seed the hotel and its room types unless they are already up to date.
+
+    The seed data is hashed and compared with the fingerprint stored by
+    the last run, so an unchanged seed costs a single primary key lookup.
+    Otherwise the hotel and all room types are upserted with one
+    statement each, in the same transaction as the new fingerprint.
+
+    :param session_factory: session factory, a temporary engine is used when None.
+    :return: whether the seed was applied.
+    """
+    engine = None
+    if session_factory is None:
+        engine = create_async_engine(str(settings.db_url), echo=True)
+        session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    try:
+        return await _apply_seed(session_factory)
+    finally:
+        if engine is not None:
+            await engine.dispose()
 
 
 if __name__ == "__main__":
-    asyncio.run(seed_hotel())
-    asyncio.run(seed_room())
+    asyncio.run(seed_database())
@@ -0,0 +1,138 @@
+import asyncio
+import copy
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import AbstractAsyncContextManager, asynccontextmanager, nullcontext
+from typing import Any, Self, overload
+
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.requests import Request
+
+from operaclone2.channels import channel_code
+from operaclone2.db.dependencies import LazySession, get_lazy_db_session
+from operaclone2.db.scheduler import FairScheduler
+from operaclone2.settings import settings
+
+type SessionCall[T] = Callable[[AsyncSession], Awaitable[T]]
+
+
+class ConcurrentQueries:
+    """
+    Runs independent DAO calls of one request concurrently.
+
+    An ``AsyncSession`` can only run one statement at a time, so the first
+    call uses the request session and every other call gets its own session
+    from the pool. At most ``settings.db_fanout_concurrency`` sessions are
+    busy at once per request. The request session is opened by the first
+    call needing it, so requests answered from caches use none.
+
+    Pooled sessions hold a slot of the fair scheduler of the request
+    channel, like the request session. The request already holds a slot,
+    so a call finding none free does not wait for one: it runs on the
+    request session once that is free, and requests never wait on each
+    other for slots they hold.
+
+    When the application has no session factory (for example when the
+    request session is overridden in tests) or the cap is 1, the calls run
+    one after another on the request session.
+    """
+
+    def __init__(
+        self,
+        request: Request,
+        session: LazySession = Depends(get_lazy_db_session),
+    ) -> None:
+        self.request_session = session
+        self.session_factory = getattr(request.app.state, "db_session_factory", None)
+        self.scheduler: FairScheduler | None = getattr(request.app.state, "db_scheduler", None)
+        self.channel = channel_code(request.scope)
+        self.limit = max(settings.db_fanout_concurrency, 1)
+        self._semaphore = asyncio.Semaphore(self.limit)
+        self._request_session_lock = asyncio.Lock()
+
+    async def get_session(self) -> AsyncSession:
+        """
+        Get the request session, opening it on the first call.
+
+        :return: database session.
+        """
+        return await self.request_session.get()
+
+    @overload
+    async def gather[T1, T2](
+        self,
+        call1: SessionCall[T1],
+        call2: SessionCall[T2],
+        /,
+    ) -> tuple[T1, T2]: ...
+
+    @overload
+    async def gather[T1, T2, T3](
+        self,
+        call1: SessionCall[T1],
+        call2: SessionCall[T2],
+        call3: SessionCall[T3],
+        /,
+    ) -> tuple[T1, T2, T3]: ...
+
+    async def gather(self, *calls: SessionCall[Any]) -> tuple[Any, ...]:
+        """
+        Await all calls and return their results in order.
+
+        If one call fails, the others are cancelled and the error is re-raised.
+
+        :param calls: callables receiving the session to run on.
+        :return: results of the calls.
+        """
+        if self.session_factory is None or self.limit == 1:
+            session = await self.get_session()
+            return tuple([await call(session) for call in calls])
+
+        tasks = [
+            asyncio.ensure_future(self._run(call, index == 0)) for index, call in enumerate(calls)
+        ]
+        try:
+            return tuple(await asyncio.gather(*tasks))
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+    @asynccontextmanager
+    async def detached(self) -> AsyncIterator[Self]:
+        """
+        Get queries on a session of their own, usable after the request ended.
+
+        The calls run one after another on that session, e.g. to refresh a
+        cache entry in the background. The session waits for a scheduler
+        slot of the channel of the request.
+
+        :yield: queries on a new session from the pool.
+        :raises RuntimeError: if the application has no session factory.
+        """
+        if self.session_factory is None:
+            raise RuntimeError("Detached queries need a session factory")
+        slot: AbstractAsyncContextManager[None] = (
+            self.scheduler.slot(self.channel) if self.scheduler is not None else nullcontext()
+        )
+        async with slot, self.session_factory() as session:
+            detached = copy.copy(self)
+            detached.request_session = LazySession.of(session)
+            detached.session_factory = None
+            yield detached
+
+    async def _run[T](self, call: SessionCall[T], use_request_session: bool) -> T:
+        async with self._semaphore:
+            if not use_request_session and self._try_slot():
+                try:
+                    async with self.session_factory() as session:  # type: ignore[misc]
+                        return await call(session)
+                finally:
+                    if self.scheduler is not None:
+                        self.scheduler.release(self.channel)
+            async with self._request_session_lock:
+                return await call(await self.get_session())
+
+    def _try_slot(self) -> bool:
+        return self.scheduler is None or self.scheduler.try_acquire(self.channel)
@@ -4,6 +4,9 @@ from operaclone2.db.dao.hotel_dao import HotelDAO
 from operaclone2.db.models.hotel import Hotel
 from operaclone2.db.models.room_type import RoomType
 from operaclone2.errors.exceptions import HotelNotFoundError
+from operaclone2.services.concurrency import ConcurrentQueries
+from operaclone2.services.stale_cache import StaleCache, get_stale_cache
+from operaclone2.settings import settings
 from operaclone2.web.api.content.schema import (
     Address,
     Connectivity,
@@ -18,12 +21,31 @@ from operaclone2.web.api.content.schema import (
     PropertySnippet,
 )
 
+type RoomTypesKey = tuple[str, int, int, str | None, bool]
+
+# Hotel content barely changes, so reads stay available through database outages.
+_summary_pages: StaleCache[tuple[int, int], tuple[list[PropertySnippet], int]] = get_stale_cache(
+    "content.summary_pages",
+    settings.content_cache_soft_ttl_seconds,
+)
+_property_infos: StaleCache[str, PropertyInfoResponse] = get_stale_cache(
+    "content.property_info",
+    settings.content_cache_soft_ttl_seconds,
+)
+_room_types: StaleCache[RoomTypesKey, tuple[list[ContentRoomType], int]] = get_stale_cache(
+    "content.room_types",
+    settings.content_cache_soft_ttl_seconds,
+)
+
 
 class ContentService:
     """Service for property content domain logic."""
 
-    def __init__(self, hotel_dao: HotelDAO = Depends()) -> None:
-        self.hotel_dao = hotel_dao
+    def __init__(self, queries: ConcurrentQueries = Depends()) -> None:
+        self.queries = queries
+
+    async def _hotel_dao(self) -> HotelDAO:
+        return HotelDAO(await self.queries.get_session())
 
     async def get_all_properties_summary(
         self,
@@ -37,9 +59,43 @@ class ContentService:
         :param offset: Page offset.
         :returns: List of property snippets.
         """
-        hotels = await self.hotel_dao.get_all_hotels(limit=limit, offset=offset)
+        hotel_dao = await self._hotel_dao()
+        hotels = await hotel_dao.get_all_hotels(limit=limit, offset=offset)
         return [self.map_hotel_to_summary(h) for h in hotels]
 
+    async def get_properties_summary_page(
+        self,
+        limit: int = 20,
+        offset: int = 0,
+    ) -> tuple[list[PropertySnippet], int]:
+        """
+        Get a page of property snippets together with the total count.
+
+        The page and the count are fetched concurrently, and served from
+        cache while fresh or while the database is unavailable.
+
+        :param limit: Page size.
+        :param offset: Page offset.
+        :returns: Tuple of (list of property snippets, total count).
+        """
+        return await _summary_pages.get(
+            (limit, offset),
+            lambda queries: self._read_properties_summary_page(queries, limit, offset),
+            self.queries,
+        )
+
+    async def _read_properties_summary_page(
+        self,
+        queries: ConcurrentQueries,
+        limit: int,
+        offset: int,
+    ) -> tuple[list[PropertySnippet], int]:
+        hotels, total_count = await queries.gather(
+            lambda session: HotelDAO(session).get_all_hotels(limit=limit, offset=offset),
+            lambda session: HotelDAO(session).total_properties_count(),
+        )
+        return [self.map_hotel_to_summary(h) for h in hotels], total_count
+
     async def get_property_details(self, hotel_code: str) -> Hotel:
         """
         Get a single property's full details.
@@ -48,11 +104,36 @@ class ContentService:
         :returns: Property details.
         :raises HotelNotFoundError: If hotel is not found.
         """
-        hotel = await self.hotel_dao.get_hotel_by_code(hotel_code)
+        hotel_dao = await self._hotel_dao()
+        hotel = await hotel_dao.get_hotel_by_code(hotel_code)
         if not hotel:
             raise HotelNotFoundError(f"Hotel {hotel_code} not found")
         return hotel
 
+    async def get_property_info(self, hotel_code: str) -> PropertyInfoResponse:
+        """
+        Get a single property's full details, served from cache when possible.
+
+        :param hotel_code: Unique hotel identifier.
+        :returns: Property info response.
+        :raises HotelNotFoundError: If hotel is not found.
+        """
+        return await _property_infos.get(
+            hotel_code,
+            lambda queries: self._read_property_info(queries, hotel_code),
+            self.queries,
+        )
+
+    async def _read_property_info(
+        self,
+        queries: ConcurrentQueries,
+        hotel_code: str,
+    ) -> PropertyInfoResponse:
+        hotel = await HotelDAO(await queries.get_session()).get_hotel_by_code(hotel_code)
+        if not hotel:
+            raise HotelNotFoundError(f"Hotel {hotel_code} not found")
+        return self.map_hotel_to_detail(hotel)
+
     async def get_room_types(
         self,
         hotel_code: str,
@@ -72,18 +153,45 @@ class ContentService:
         :returns: Tuple of (list of room types, total count).
         :raises HotelNotFoundError: If hotel is not found.
         """
-        # Ensure hotel exists
-        hotel = await self.hotel_dao.get_hotel_by_code(hotel_code)
-        if not hotel:
-            raise HotelNotFoundError(f"Hotel {hotel_code} not found")
+        return await _room_types.get(
+            (hotel_code, limit, offset, room_type_filter, include_room_amenities),
+            lambda queries: self._read_room_types(
+                queries,
+                hotel_code=hotel_code,
+                limit=limit,
+                offset=offset,
+                room_type_filter=room_type_filter,
+                include_room_amenities=include_room_amenities,
+            ),
+            self.queries,
+        )
 
-        raw_room_types, total_count = await self.hotel_dao.get_room_types_by_hotel(
-            hotel_code=hotel_code,
-            limit=limit,
-            offset=offset,
-            room_type_filter=room_type_filter,
-            include_amenities=include_room_amenities,
+    async def _read_room_types(
+        self,
+        queries: ConcurrentQueries,
+        *,
+        hotel_code: str,
+        limit: int,
+        offset: int,
+        room_type_filter: str | None,
+        include_room_amenities: bool,
+    ) -> tuple[list[ContentRoomType], int]:
+        # The existence check, the page and the count are independent queries.
+        hotel, raw_room_types, total_count = await queries.gather(
+            lambda session: HotelDAO(session).get_hotel_by_code(hotel_code),
+            lambda session: HotelDAO(session).get_room_types_page(
+                hotel_code=hotel_code,
+                limit=limit,
+                offset=offset,
+                room_type_filter=room_type_filter,
+            ),
+            lambda session: HotelDAO(session).count_room_types(
+                hotel_code=hotel_code,
+                room_type_filter=room_type_filter,
+            ),
         )
+        if not hotel:
+            raise HotelNotFoundError(f"Hotel {hotel_code} not found")
 
         return [
             self._map_room_type(rt, include_amenities=include_room_amenities)
@@ -98,7 +206,8 @@ class ContentService:
         """
         # This is a placeholder implementation.
         # In a real scenario, you would implement a count query in the DAO.
-        return await self.hotel_dao.total_properties_count()
+        hotel_dao = await self._hotel_dao()
+        return await hotel_dao.total_properties_count()
 
     def map_hotel_to_summary(self, hotel: Hotel) -> PropertySnippet:
         """Map Hotel model to PropertySnippet for summary list."""
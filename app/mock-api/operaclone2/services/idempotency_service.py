@@ -0,0 +1,184 @@
+import asyncio
+import hashlib
+import logging
+import weakref
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any
+
+from fastapi import Depends
+from pydantic import BaseModel
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from operaclone2.cache import TTLCache
+from operaclone2.db.dao.idempotency_dao import IdempotencyDAO
+from operaclone2.errors.exceptions import (
+    IdempotencyKeyConflictError,
+    IdempotencyKeyInProgressError,
+)
+from operaclone2.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class StoredResponse:
+    """Response remembered for an idempotency key."""
+
+    request_hash: str
+    body: dict[str, Any]
+    expire_date_time: datetime
+
+
+# Front cache so that retries hitting the same worker skip the database.
+_response_cache: TTLCache[str, StoredResponse] = TTLCache(
+    ttl=settings.idempotency_ttl_seconds,
+    maxsize=settings.idempotency_cache_size,
+)
+# Serializes concurrent requests with the same key inside one worker.
+_key_locks: "weakref.WeakValueDictionary[str, asyncio.Lock]" = weakref.WeakValueDictionary()
+
+
+class IdempotencyService:
+    """Replays stored responses for requests repeated with the same Idempotency-Key."""
+
+    def __init__(self, idempotency_dao: IdempotencyDAO = Depends()) -> None:
+        self.idempotency_dao = idempotency_dao
+
+    @staticmethod
+    def fingerprint(scope: str, payload: BaseModel) -> str:
+        """
+        Compute the request fingerprint stored along with the key.
+
+        :param scope: method and route the key was sent to.
+        :param payload: request body.
+        :return: hex digest.
+        """
+        digest = hashlib.sha256(scope.encode())
+        digest.update(b"\n")
+        digest.update(payload.model_dump_json().encode())
+        return digest.hexdigest()
+
+    async def execute[ModelT: BaseModel](
+        self,
+        idempotency_key: str | None,
+        request_hash: str,
+        response_model: type[ModelT],
+        operation: Callable[[], Awaitable[ModelT]],
+    ) -> ModelT:
+        """
+        Run a write operation at most once per idempotency key.
+
+        Without a key the operation is simply awaited. With a key, the key
+        is claimed in the transaction of the write and its response stored
+        before the single commit, so a write and its key are committed
+        together or not at all, whichever worker runs them. A previously
+        stored response is returned instead of running it again.
+
+        :param idempotency_key: value of the Idempotency-Key header.
+        :param request_hash: fingerprint of the current request.
+        :param response_model: schema used to rebuild a stored response.
+        :param operation: the actual write.
+        :return: fresh or replayed response.
+        :raises IdempotencyKeyConflictError: if the key was used for another request.
+        :raises IdempotencyKeyInProgressError: if the key is held by an unfinished request.
+        """
+        if not idempotency_key:
+            response = await operation()
+            await self.idempotency_dao.commit()
+            return response
+
+        lock = _key_locks.get(idempotency_key)
+        if lock is None:
+            lock = asyncio.Lock()
+            _key_locks[idempotency_key] = lock
+
+        async with lock:
+            stored = _response_cache.get(idempotency_key)
+            if stored is None:
+                expire_date_time = datetime.now() + timedelta(
+                    seconds=settings.idempotency_ttl_seconds,
+                )
+                if await self.idempotency_dao.claim(
+                    idempotency_key,
+                    request_hash,
+                    expire_date_time,
+                ):
+                    return await self._run(
+                        idempotency_key,
+                        request_hash,
+                        expire_date_time,
+                        operation,
+                    )
+                # The claim wrote nothing: another request holds or held the key.
+                stored = await self._load(idempotency_key)
+
+            if stored.request_hash != request_hash:
+                raise IdempotencyKeyConflictError
+            return response_model.model_validate(stored.body)
+
+    async def _run[ModelT: BaseModel](
+        self,
+        idempotency_key: str,
+        request_hash: str,
+        expire_date_time: datetime,
+        operation: Callable[[], Awaitable[ModelT]],
+    ) -> ModelT:
+        try:
+            response = await operation()
+            body = response.model_dump(mode="json")
+            # Committed with the write, so a crash leaves neither behind.
+            await self.idempotency_dao.complete(idempotency_key, body)
+            await self.idempotency_dao.commit()
+        except BaseException:
+            await self.idempotency_dao.rollback()
+            raise
+        self._remember(idempotency_key, StoredResponse(request_hash, body, expire_date_time))
+        return response
+
+    async def _load(self, idempotency_key: str) -> StoredResponse:
+        record = await self.idempotency_dao.get_by_key(idempotency_key)
+        if record is None or record.response_body is None:
+            # Expired meanwhile, or claimed by a transaction that is still open.
+            raise IdempotencyKeyInProgressError
+
+        stored = StoredResponse(
+            request_hash=record.request_hash,
+            body=record.response_body,
+            expire_date_time=record.expire_date_time,
+        )
+        self._remember(idempotency_key, stored)
+        return stored
+
+    @staticmethod
+    def _remember(idempotency_key: str, stored: StoredResponse) -> None:
+        # Never keep an entry in memory longer than the database keeps it.
+        remaining = (stored.expire_date_time - datetime.now()).total_seconds()
+        _response_cache.set(idempotency_key, stored, ttl=remaining)
+
+
+async def purge_expired_keys(
+    session_factory: async_sessionmaker[AsyncSession],
+    interval: float,
+) -> None:
+    """
+    Delete expired idempotency keys now and then every ``interval`` seconds.
+
+    Meant to run as a background task for the lifetime of a worker.
+    Every worker purges, concurrent deletes of the same rows are harmless.
+
+    :param session_factory: factory of the sessions to delete with.
+    :param interval: seconds between two purges.
+    """
+    while True:
+        try:
+            async with session_factory() as session:
+                deleted = await IdempotencyDAO(session).delete_expired()
+        except (SQLAlchemyError, OSError) as exc:
+            logger.warning("Purging expired idempotency keys failed: %s", type(exc).__name__)
+        else:
+            if deleted:
+                logger.info("Purged %d expired idempotency keys.", deleted)
+        await asyncio.sleep(interval)
@@ -189,8 +189,8 @@ class ReservationService:
             num_adults = guest_counts.adults if guest_counts.adults is not None else 1
             num_children = guest_counts.children if guest_counts.children is not None else 0
 
-        conf_num = str(uuid4().int)[:8]
-        res_id = str(uuid4().int)[:6]
+        res_id = await self.reservation_dao.next_reservation_id()
+        conf_num = await self.reservation_dao.next_confirmation_number()
 
         arrival_date = res_data.roomStay.arrivalDate if res_data.roomStay else date.today()
         departure_date = res_data.roomStay.departureDate if res_data.roomStay else date.today()
@@ -5,6 +5,10 @@ from typing import Any
 from fastapi import Depends
 
 from operaclone2.db.dao.hotel_dao import HotelDAO
+from operaclone2.services.concurrency import ConcurrentQueries
+from operaclone2.services.single_flight import get_single_flight
+from operaclone2.services.stale_cache import StaleCache, get_stale_cache
+from operaclone2.settings import settings
 from operaclone2.web.api.shop.schema import (
     Address,
     BlockInformation,
@@ -32,12 +36,30 @@ from operaclone2.web.api.shop.schema import (
     PropertySearchRoomStay,
 )
 
+type ShopKey = tuple[str, date, date]
+
+# Concurrent identical offer queries share one computation per worker.
+_property_offers_flight = get_single_flight("shop.property_offers")
+_offer_details_flight = get_single_flight("shop.offer_details")
+# Responses stay available through database outages, see StaleCache.
+_property_searches: StaleCache[tuple[tuple[str, ...], date, date], PropertySearchResponse] = (
+    get_stale_cache("shop.property_search", settings.shop_cache_soft_ttl_seconds)
+)
+_property_offers: StaleCache[ShopKey, PropertyOffersResponse] = get_stale_cache(
+    "shop.property_offers",
+    settings.shop_cache_soft_ttl_seconds,
+)
+_offer_details: StaleCache[ShopKey, OfferDetailsResponse] = get_stale_cache(
+    "shop.offer_details",
+    settings.shop_cache_soft_ttl_seconds,
+)
+
 
 class ShopService:
     """Service for shop domain logic."""
 
-    def __init__(self, hotel_dao: HotelDAO = Depends()) -> None:
-        self.hotel_dao = hotel_dao
+    def __init__(self, queries: ConcurrentQueries = Depends()) -> None:
+        self.queries = queries
 
     async def search_properties(
         self,
@@ -46,7 +68,114 @@ class ShopService:
         departure_date: date,
     ) -> PropertySearchResponse:
         """Search for properties."""
-        hotels = await self.hotel_dao.get_hotels_by_codes(hotel_codes)
+        return await _property_searches.get(
+            (tuple(hotel_codes), arrival_date, departure_date),
+            lambda queries: self._read_property_search(
+                queries,
+                hotel_codes,
+                arrival_date,
+                departure_date,
+            ),
+            self.queries,
+        )
+
+    async def get_property_offers(
+        self,
+        hotel_code: str,
+        arrival_date: date,
+        departure_date: date,
+    ) -> PropertyOffersResponse:
+        """Get property offers."""
+        key = (hotel_code, arrival_date, departure_date)
+        return await _property_offers.get(
+            key,
+            lambda queries: _property_offers_flight.do(
+                key,
+                lambda: self._read_property_offers(
+                    queries,
+                    hotel_code,
+                    arrival_date,
+                    departure_date,
+                ),
+            ),
+            self.queries,
+        )
+
+    async def get_offer_details(
+        self,
+        hotel_code: str,
+        arrival_date: date,
+        departure_date: date,
+    ) -> OfferDetailsResponse:
+        """Get offer details."""
+        key = (hotel_code, arrival_date, departure_date)
+        return await _offer_details.get(
+            key,
+            lambda queries: _offer_details_flight.do(
+                key,
+                lambda: self._read_offer_details(
+                    queries,
+                    hotel_code,
+                    arrival_date,
+                    departure_date,
+                ),
+            ),
+            self.queries,
+        )
+
+    async def _read_property_search(
+        self,
+        queries: ConcurrentQueries,
+        hotel_codes: list[str],
+        arrival_date: date,
+        departure_date: date,
+    ) -> PropertySearchResponse:
+        hotel_dao = HotelDAO(await queries.get_session())
+        return await self._build_property_search(
+            hotel_dao,
+            hotel_codes,
+            arrival_date,
+            departure_date,
+        )
+
+    async def _read_property_offers(
+        self,
+        queries: ConcurrentQueries,
+        hotel_code: str,
+        arrival_date: date,
+        departure_date: date,
+    ) -> PropertyOffersResponse:
+        hotel_dao = HotelDAO(await queries.get_session())
+        return await self._build_property_offers(
+            hotel_dao,
+            hotel_code,
+            arrival_date,
+            departure_date,
+        )
+
+    async def _read_offer_details(
+        self,
+        queries: ConcurrentQueries,
+        hotel_code: str,
+        arrival_date: date,
+        departure_date: date,
+    ) -> OfferDetailsResponse:
+        hotel_dao = HotelDAO(await queries.get_session())
+        return await self._build_offer_details(
+            hotel_dao,
+            hotel_code,
+            arrival_date,
+            departure_date,
+        )
+
+    async def _build_property_search(
+        self,
+        hotel_dao: HotelDAO,
+        hotel_codes: list[str],
+        arrival_date: date,
+        departure_date: date,
+    ) -> PropertySearchResponse:
+        hotels = await hotel_dao.get_hotels_by_codes(hotel_codes)
         nights = max((departure_date - arrival_date).days, 1)
 
         room_stays = []
@@ -90,14 +219,14 @@ class ShopService:
 
         return PropertySearchResponse(roomStays=room_stays)
 
-    async def get_property_offers(
+    async def _build_property_offers(
         self,
+        hotel_dao: HotelDAO,
         hotel_code: str,
         arrival_date: date,
         departure_date: date,
     ) -> PropertyOffersResponse:
-        """Get property offers."""
-        hotel: Any = await self.hotel_dao.get_hotel_by_code(hotel_code)
+        hotel: Any = await hotel_dao.get_hotel_by_code(hotel_code)
         nights = max((departure_date - arrival_date).days, 1)
 
         if not hotel:
@@ -269,14 +398,14 @@ class ShopService:
 
         return PropertyOffersResponse(roomStays=room_stays)
 
-    async def get_offer_details(
+    async def _build_offer_details(
         self,
+        hotel_dao: HotelDAO,
         hotel_code: str,
         arrival_date: date,
         departure_date: date,
     ) -> OfferDetailsResponse:
-        """Get offer details."""
-        hotel: Any = await self.hotel_dao.get_hotel_by_code(hotel_code)
+        hotel: Any = await hotel_dao.get_hotel_by_code(hotel_code)
         nights = max((departure_date - arrival_date).days, 1)
 
         if not hotel:
@@ -0,0 +1,117 @@
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any
+
+from operaclone2.metrics import CallbackMetric, LabelValues, registry
+
+logger = logging.getLogger(__name__)
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent identical computations inside a worker.
+
+    The first caller for a key (the leader) runs the computation, every
+    caller arriving while it is in flight awaits the leader's result.
+    Nothing is cached: once the computation finishes the next caller
+    starts a new one.
+
+    If the leader is cancelled (e.g. its client disconnected), waiting
+    callers start over and one of them becomes the new leader.
+    """
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.executions = 0
+        self.coalesced = 0
+        self._in_flight: dict[Hashable, asyncio.Future[Any]] = {}
+
+    @property
+    def in_flight(self) -> int:
+        """Number of computations currently running."""
+        return len(self._in_flight)
+
+    async def do[T](self, key: Hashable, factory: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run the computation for a key or join the one already running.
+
+        :param key: identity of the computation.
+        :param factory: callable performing the computation.
+        :return: computation result.
+        """
+        while (future := self._in_flight.get(key)) is not None:
+            self.coalesced += 1
+            logger.debug("Coalesced %s call for %s", self.name, key)
+            try:
+                # A cancelled follower must not cancel the leader.
+                return await asyncio.shield(future)  # type: ignore[no-any-return]
+            except asyncio.CancelledError:
+                task = asyncio.current_task()
+                if future.cancelled() and not (task and task.cancelling()):
+                    self.coalesced -= 1
+                    continue
+                raise
+
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = future
+        self.executions += 1
+        try:
+            result = await factory()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as exc:
+            future.set_exception(exc)
+            # Mark the exception as retrieved when nobody else is waiting.
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            del self._in_flight[key]
+
+
+_flights: dict[str, SingleFlight] = {}
+
+
+def get_single_flight(name: str) -> SingleFlight:
+    """
+    Get the worker-wide single-flight group with the given name.
+
+    :param name: group name, used in logs and metrics.
+    :return: single-flight group.
+    """
+    flight = _flights.get(name)
+    if flight is None:
+        flight = _flights[name] = SingleFlight(name)
+    return flight
+
+
+def all_single_flights() -> list[SingleFlight]:
+    """
+    Get all single-flight groups of the worker.
+
+    :return: single-flight groups.
+    """
+    return list(_flights.values())
+
+
+def _single_flight_calls() -> list[tuple[LabelValues, float]]:
+    samples: list[tuple[LabelValues, float]] = []
+    for flight in _flights.values():
+        samples.append(((flight.name, "executed"), flight.executions))
+        samples.append(((flight.name, "coalesced"), flight.coalesced))
+    return samples
+
+
+registry.register(
+    CallbackMetric(
+        "single_flight_calls",
+        "Calls of single-flight groups, executed or coalesced into a running one.",
+        "counter",
+        _single_flight_calls,
+        ("group", "result"),
+    ),
+)
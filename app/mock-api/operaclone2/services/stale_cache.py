@@ -0,0 +1,278 @@
+"""Stale-while-revalidate caching of content and shop reads."""
+
+import asyncio
+import contextvars
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+from contextvars import ContextVar, Token
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy.exc import SQLAlchemyError
+
+from operaclone2.deadline import activate_deadline
+from operaclone2.metrics import CallbackMetric, Counter, LabelValues, registry
+from operaclone2.settings import settings
+
+if TYPE_CHECKING:
+    from operaclone2.services.concurrency import ConcurrentQueries
+
+logger = logging.getLogger(__name__)
+
+# Warning header values, as defined by RFC 7234.
+STALE_WARNING = '110 - "Response is Stale"'
+REVALIDATION_FAILED_WARNING = '111 - "Revalidation Failed"'
+# Errors of an unavailable database, answered with stale entries.
+DATABASE_ERRORS = (SQLAlchemyError, OSError)
+
+type StaleRead[V] = Callable[["ConcurrentQueries"], Awaitable[V]]
+
+stale_cache_reads = registry.register(
+    Counter(
+        "stale_cache_reads",
+        "Reads of stale-while-revalidate caches, by cache and outcome.",
+        ("cache", "result"),
+    ),
+)
+stale_cache_refresh_failures = registry.register(
+    Counter(
+        "stale_cache_refresh_failures",
+        "Refreshes of stale entries that failed on a database error, by cache.",
+        ("cache",),
+    ),
+)
+
+_warnings: ContextVar[set[str] | None] = ContextVar("stale_warnings", default=None)
+
+
+def activate_stale_warnings() -> tuple[set[str], Token[set[str] | None]]:
+    """
+    Start collecting the warnings of the current context.
+
+    :return: warnings, filled by caches serving stale entries, and the
+        token to pass to ``deactivate_stale_warnings``.
+    """
+    warnings: set[str] = set()
+    return warnings, _warnings.set(warnings)
+
+
+def deactivate_stale_warnings(token: Token[set[str] | None]) -> None:
+    """
+    Restore the warnings that were active before ``activate_stale_warnings``.
+
+    :param token: token returned by ``activate_stale_warnings``.
+    """
+    _warnings.reset(token)
+
+
+def _warn(warning: str) -> None:
+    warnings = _warnings.get()
+    if warnings is not None:
+        warnings.add(warning)
+
+
+@dataclass(slots=True)
+class StaleEntry[V]:
+    """Cached value with the time it was read."""
+
+    value: V
+    # time.monotonic() value when the value was read from the database.
+    read_at: float
+    # Whether the last refresh failed on a database error.
+    revalidation_failed: bool = False
+
+    @property
+    def age(self) -> float:
+        """Seconds since the value was read."""
+        return time.monotonic() - self.read_at
+
+
+class StaleCache[K: Hashable, V]:
+    """
+    Bounded LRU cache serving stale values while the database is unavailable.
+
+    An entry is fresh for ``soft_ttl`` seconds. Until ``hard_ttl`` it is
+    still served, marked stale, and refreshed by a background task on a
+    session of its own, so the request does not wait for the database.
+    When the refresh fails on a database error, the stale entry keeps
+    being served with a ``Revalidation Failed`` warning until the next
+    refresh succeeds or the entry is dropped at ``hard_ttl``. Missing and
+    expired entries are read by the request itself, and errors propagate.
+
+    Without a session factory (e.g. in tests), stale entries are
+    revalidated by the request, falling back to the entry on a database
+    error. Like ``TTLCache``, the cache belongs to one worker and is only
+    used from the event loop.
+    """
+
+    def __init__(self, name: str, soft_ttl: float, hard_ttl: float, maxsize: int) -> None:
+        self.name = name
+        self.soft_ttl = soft_ttl
+        self.hard_ttl = hard_ttl
+        self.maxsize = maxsize
+        self._entries: OrderedDict[K, StaleEntry[V]] = OrderedDict()
+        self._refreshes: dict[K, asyncio.Task[None]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._entries.clear()
+
+    def set(self, key: K, value: V) -> None:
+        """
+        Store a fresh value.
+
+        :param key: cache key.
+        :param value: value read from the database.
+        """
+        if self.hard_ttl <= 0:
+            return
+        self._entries[key] = StaleEntry(value, time.monotonic())
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def _lookup(self, key: K) -> StaleEntry[V] | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.age >= self.hard_ttl:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    async def get(self, key: K, read: StaleRead[V], queries: "ConcurrentQueries") -> V:
+        """
+        Get a value from the cache, reading it when missing or expired.
+
+        :param key: cache key, identifying the read.
+        :param read: callable reading the value with the given queries.
+        :param queries: queries of the current request.
+        :return: fresh or stale value.
+        """
+        entry = self._lookup(key)
+        if entry is None:
+            stale_cache_reads.inc(self.name, "miss")
+            value = await read(queries)
+            self.set(key, value)
+            return value
+        if entry.age < self.soft_ttl:
+            stale_cache_reads.inc(self.name, "fresh")
+            return entry.value
+
+        if queries.session_factory is None:
+            return await self._revalidate(key, entry, read, queries)
+        if key not in self._refreshes:
+            # A context of its own leaves the deadline and memo of the request behind.
+            self._refreshes[key] = asyncio.get_running_loop().create_task(
+                self._refresh(key, read, queries),
+                name=f"stale-cache-refresh:{self.name}",
+                context=contextvars.Context(),
+            )
+        return self._serve_stale(entry)
+
+    def _serve_stale(self, entry: StaleEntry[V]) -> V:
+        if entry.revalidation_failed:
+            stale_cache_reads.inc(self.name, "revalidation_failed")
+            _warn(REVALIDATION_FAILED_WARNING)
+        else:
+            stale_cache_reads.inc(self.name, "stale")
+            _warn(STALE_WARNING)
+        return entry.value
+
+    async def _revalidate(
+        self,
+        key: K,
+        entry: StaleEntry[V],
+        read: StaleRead[V],
+        queries: "ConcurrentQueries",
+    ) -> V:
+        try:
+            value = await read(queries)
+        except DATABASE_ERRORS as exc:
+            self._refresh_failed(entry, exc)
+            return self._serve_stale(entry)
+        stale_cache_reads.inc(self.name, "revalidated")
+        self.set(key, value)
+        return value
+
+    async def _refresh(self, key: K, read: StaleRead[V], queries: "ConcurrentQueries") -> None:
+        timeout = settings.request_timeout_seconds or None
+        if timeout is not None:
+            activate_deadline(timeout)
+        try:
+            async with asyncio.timeout(timeout), queries.detached() as detached:
+                value = await read(detached)
+        except DATABASE_ERRORS as exc:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._refresh_failed(entry, exc)
+        except Exception:
+            # E.g. the hotel was removed, the next request reads it again.
+            logger.exception("Refreshing %s entry %s failed", self.name, key)
+            self._entries.pop(key, None)
+        else:
+            self.set(key, value)
+        finally:
+            del self._refreshes[key]
+
+    def _refresh_failed(self, entry: StaleEntry[V], exc: BaseException) -> None:
+        stale_cache_refresh_failures.inc(self.name)
+        if not entry.revalidation_failed:
+            logger.warning(
+                "Serving stale %s entries, refresh failed: %s",
+                self.name,
+                type(exc).__name__,
+            )
+        entry.revalidation_failed = True
+
+
+_caches: dict[str, StaleCache[Any, Any]] = {}
+
+
+def get_stale_cache(name: str, soft_ttl: float) -> StaleCache[Any, Any]:
+    """
+    Get the worker-wide stale cache with the given name.
+
+    :param name: cache name, used in logs and metrics.
+    :param soft_ttl: seconds an entry is fresh.
+    :return: stale cache, sized by the ``stale_cache_*`` settings.
+    """
+    cache = _caches.get(name)
+    if cache is None:
+        cache = _caches[name] = StaleCache(
+            name,
+            soft_ttl=soft_ttl,
+            hard_ttl=settings.stale_cache_hard_ttl_seconds,
+            maxsize=settings.stale_cache_size,
+        )
+    return cache
+
+
+def all_stale_caches() -> list[StaleCache[Any, Any]]:
+    """
+    Get all stale caches of the worker.
+
+    :return: stale caches.
+    """
+    return list(_caches.values())
+
+
+def _stale_cache_entries() -> list[tuple[LabelValues, float]]:
+    return [((cache.name,), len(cache)) for cache in _caches.values()]
+
+
+registry.register(
+    CallbackMetric(
+        "stale_cache_entries",
+        "Entries held by stale-while-revalidate caches.",
+        "gauge",
+        _stale_cache_entries,
+        ("cache",),
+    ),
+)
@@ -38,6 +38,12 @@ class Settings(BaseSettings):
     environment: str = "dev"
 
     log_level: LogLevel = LogLevel.DEBUG
+    # Writes one JSON object per line instead of colored text
+    log_json: bool = False
+    # Writes log lines from a background thread so logging never blocks the event loop
+    log_enqueue: bool = True
+    # Fraction of records below WARNING kept per logger, e.g. {"uvicorn.access": 0.1}
+    log_sampling: dict[str, float] = {}
     # Variables for the database
     db_host: str = "localhost"
     db_port: int = 5432
@@ -45,10 +51,78 @@ class Settings(BaseSettings):
     db_pass: str = "OperaClone2"  # noqa: S105
     db_base: str = "OperaClone2"
     db_echo: bool = False
+    # Statements slower than this are logged with redacted parameters
+    db_slow_query_ms: float = 200.0
+    # Max number of pooled sessions one request may use for concurrent queries
+    db_fanout_concurrency: int = 4
+    # Sessions held at once over all x-channelCode values, zero disables fair scheduling
+    db_scheduler_capacity: int = 15
+    # Share of the sessions of a channel under contention, relative to the others
+    db_channel_weights: dict[str, float] = {}
+    db_channel_default_weight: float = 1.0
+    # Max sessions held at once by a channel, zero for no limit besides the capacity
+    db_channel_limits: dict[str, int] = {}
+    db_channel_default_limit: int = 0
+    # Channels labelled by name in metrics besides those with a weight or limit,
+    # any other x-channelCode is labelled "other"
+    metric_channels: list[str] = []
+    # Deadline of shop, content, inventory and reservation requests in seconds, zero for none.
+    # Connections start with the longest deadline as statement_timeout, requests
+    # with a shorter one set theirs.
+    request_timeout_seconds: float = 10.0
+    # Deadlines of single routes by path template, overriding request_timeout_seconds
+    route_timeouts: dict[str, float] = {}
+    # Pooled connections opened and primed by every worker before it accepts requests
+    db_warmup_connections: int = 5
+    # Upserts the seed hotel on startup, skipped when its fingerprint is unchanged
+    seed_on_startup: bool = True
+    # Max seconds a worker waits for the startup leader before starting anyway
+    startup_leader_timeout: float = 60.0
+    # Seconds a /api/ready outcome is reused, so frequent probes add no database load
+    readiness_cache_seconds: float = 2.0
+    # Max seconds the database may take to answer a readiness check
+    readiness_timeout: float = 1.0
+
+    # Enables the /api/debug endpoints, never turn on in production
+    debug_endpoints_enabled: bool = False
+    # Profiles requests sent with x-profile: 1, see /api/debug/profiles
+    profiling_enabled: bool = False
+
+    # Measures event loop lag and logs code blocking the loop for longer than the threshold
+    loop_monitor_enabled: bool = True
+    loop_block_threshold_ms: float = 100.0
+
+    # Sends the DB/service/serialization breakdown in a Server-Timing header
+    server_timing_enabled: bool = True
+
+    # Imports the docs, echo and dummy routers on their first request, for faster cold starts
+    lazy_routers: bool = False
+
+    # Search and content requests get a 503 above these loads, zero disables a check
+    admission_max_in_flight: int = 200
+    admission_max_pool_wait_ms: float = 250.0
+    admission_low_priority_paths: list[str] = ["/api/shop/", "/api/content/"]
+    admission_retry_after_seconds: int = 1
+
+    # Content and shop reads are fresh for their soft TTL, then served stale while they are
+    # refreshed in the background, and on database errors until the hard TTL.
+    # A hard TTL of zero disables the caches.
+    content_cache_soft_ttl_seconds: float = 60.0
+    shop_cache_soft_ttl_seconds: float = 5.0
+    stale_cache_hard_ttl_seconds: float = 15 * 60.0
+    # Max number of entries kept per cache in every worker
+    stale_cache_size: int = 5_000
 
     # CORS
     cors_origins: str = "*"
 
+    # Idempotency-Key handling for reservation writes
+    idempotency_ttl_seconds: int = 24 * 60 * 60
+    # Max number of responses kept in the per-worker front cache
+    idempotency_cache_size: int = 10_000
+    # Seconds between two deletions of expired keys, zero disables them
+    idempotency_purge_interval_seconds: float = 60 * 60
+
     @property
     def db_url(self) -> URL:
         """
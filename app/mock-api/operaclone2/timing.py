@@ -0,0 +1,71 @@
+"""Per-request breakdown of where the time was spent."""
+
+import time
+from contextvars import ContextVar, Token
+from dataclasses import dataclass, field
+
+
+@dataclass(slots=True)
+class RequestTiming:
+    """
+    Durations accumulated while serving one request, in seconds.
+
+    ``db`` is the sum of all statement durations, so with concurrent
+    queries it can be larger than the wall-clock time spent waiting for
+    the database. ``service`` is the time spent in the endpoint function
+    (including ``db``) and ``serialization`` the time spent turning its
+    result into a response body.
+    """
+
+    start: float = field(default_factory=time.perf_counter)
+    db: float = 0.0
+    db_round_trips: int = 0
+    service: float = 0.0
+    serialization: float = 0.0
+    # perf_counter() value when the last endpoint function returned.
+    endpoint_end: float = 0.0
+
+    def add_db(self, duration: float) -> None:
+        """
+        Record one database round trip.
+
+        :param duration: statement duration.
+        """
+        self.db += duration
+        self.db_round_trips += 1
+
+    @property
+    def elapsed(self) -> float:
+        """Time since the request started."""
+        return time.perf_counter() - self.start
+
+
+_current_timing: ContextVar[RequestTiming | None] = ContextVar("request_timing", default=None)
+
+
+def current_timing() -> RequestTiming | None:
+    """
+    Get the timing of the current request.
+
+    :return: timing or None outside of a request.
+    """
+    return _current_timing.get()
+
+
+def activate_timing() -> tuple[RequestTiming, Token[RequestTiming | None]]:
+    """
+    Start timing the current context.
+
+    :return: timing and the token to pass to ``deactivate_timing``.
+    """
+    timing = RequestTiming()
+    return timing, _current_timing.set(timing)
+
+
+def deactivate_timing(token: Token[RequestTiming | None]) -> None:
+    """
+    Restore the timing that was active before ``activate_timing``.
+
+    :param token: token returned by ``activate_timing``.
+    """
+    _current_timing.reset(token)
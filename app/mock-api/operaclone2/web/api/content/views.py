@@ -10,9 +10,10 @@ from operaclone2.web.api.content.schema import (
     PropertyInfoSummaryResponse,
     RoomTypesResponse,
 )
+from operaclone2.web.routing import TimedRoute
 
 logger = logging.getLogger(__name__)
-router = APIRouter()
+router = APIRouter(route_class=TimedRoute)
 
 
 @router.get("/hotels", response_model=PropertyInfoSummaryResponse)
@@ -64,11 +65,10 @@ async def get_properties_summary(
         x_channel_code,
     )
 
-    snippets = await content_service.get_all_properties_summary(
+    snippets, total_properties = await content_service.get_properties_summary_page(
         limit=limit or 20,
         offset=offset or 0,
     )
-    total_properties = await content_service.total_properties_count()
 
     return PropertyInfoSummaryResponse(
         hasMore=total_properties > offset + len(snippets),
@@ -114,7 +114,7 @@ async def get_property_info(
     )
 
     try:
-        hotel = await content_service.get_property_details(hotel_code)
+        return await content_service.get_property_info(hotel_code)
     except HotelNotFoundError:
         logger.warning(
             "Hotel %s not found. Request ID: %s",
@@ -123,8 +123,6 @@ async def get_property_info(
         )
         raise HTTPException(status_code=404, detail="Hotel not found") from None
 
-    return content_service.map_hotel_to_detail(hotel)
-
 
 @router.get("/hotels/{hotelCode}/roomTypes", response_model=RoomTypesResponse)
 async def get_room_types_info(
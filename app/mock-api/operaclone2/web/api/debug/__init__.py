@@ -0,0 +1,5 @@
+"""Debugging API, disabled unless ``debug_endpoints_enabled`` is set."""
+
+from operaclone2.web.api.debug.views import router
+
+__all__ = ["router"]
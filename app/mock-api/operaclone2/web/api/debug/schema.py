@@ -0,0 +1,46 @@
+from pydantic import BaseModel
+
+
+class StatementStatistics(BaseModel):
+    """Timings of one SQL statement shape."""
+
+    fingerprint: str
+    statement: str
+    count: int
+    totalMs: float
+    meanMs: float
+    maxMs: float
+
+
+class SlowestStatementsResponse(BaseModel):
+    """Statement shapes with the highest latency."""
+
+    statements: list[StatementStatistics]
+
+
+class AllocationSite(BaseModel):
+    """Memory allocated from one place and still alive."""
+
+    location: str
+    sizeBytes: int
+    count: int
+    sizeDiffBytes: int
+    countDiff: int
+
+
+class RoutePeak(BaseModel):
+    """Peak memory allocated by the sampled requests of a route."""
+
+    route: str
+    samples: int
+    meanBytes: float
+    maxBytes: int
+
+
+class MemoryReport(BaseModel):
+    """Largest allocation sites, with their growth since the baseline."""
+
+    tracedBytes: int
+    peakBytes: int
+    sites: list[AllocationSite]
+    routes: list[RoutePeak]
@@ -0,0 +1,170 @@
+import asyncio
+import tracemalloc
+from typing import Annotated, Literal
+
+from fastapi import APIRouter, Depends, HTTPException, Path, Query
+from fastapi.responses import FileResponse
+
+from operaclone2.db.instrumentation import reset_statistics, slowest_statements
+from operaclone2.memory import GroupBy, memory_tracker
+from operaclone2.profiling import PROFILE_ID_PATTERN, ProfileFormat, profile_path
+from operaclone2.settings import settings
+from operaclone2.web.api.debug.schema import (
+    AllocationSite,
+    MemoryReport,
+    RoutePeak,
+    SlowestStatementsResponse,
+    StatementStatistics,
+)
+
+
+def require_debug_endpoints() -> None:
+    """
+    Hide debugging endpoints unless they are enabled in settings.
+
+    :raises HTTPException: if debugging endpoints are disabled.
+    """
+    if not settings.debug_endpoints_enabled:
+        raise HTTPException(status_code=404, detail="Not Found")
+
+
+router = APIRouter(dependencies=[Depends(require_debug_endpoints)])
+
+
+@router.get("/queries", response_model=SlowestStatementsResponse)
+async def get_slowest_queries(
+    limit: Annotated[int, Query(ge=1, le=1000)] = 20,
+    order_by: Annotated[
+        Literal["max", "mean", "total", "count"],
+        Query(alias="orderBy"),
+    ] = "max",
+) -> SlowestStatementsResponse:
+    """
+    Get the slowest SQL statement shapes executed by this worker.
+
+    :param limit: number of statement shapes.
+    :param order_by: statistic to sort by.
+    :return: statement statistics, slowest first.
+    """
+    return SlowestStatementsResponse(
+        statements=[
+            StatementStatistics(
+                fingerprint=stats.fingerprint,
+                statement=stats.statement,
+                count=stats.count,
+                totalMs=stats.total * 1000,
+                meanMs=stats.mean * 1000,
+                maxMs=stats.max * 1000,
+            )
+            for stats in slowest_statements(limit, order_by)
+        ],
+    )
+
+
+@router.delete("/queries", status_code=204)
+async def reset_queries() -> None:
+    """Reset the SQL statement statistics of this worker."""
+    reset_statistics()
+
+
+@router.get("/profiles/{profileId}", response_class=FileResponse)
+async def get_profile(
+    profile_id: Annotated[str, Path(alias="profileId", pattern=PROFILE_ID_PATTERN)],
+    fmt: Annotated[ProfileFormat, Query(alias="format")] = "collapsed",
+) -> FileResponse:
+    """
+    Download the profile of a request sent with ``x-profile: 1``.
+
+    ``pstats`` files load with ``pstats.Stats`` or snakeviz, ``collapsed``
+    files with ``flamegraph.pl`` or speedscope. ``json`` describes the
+    profiled request, with its ``x-request-id``.
+
+    :param profile_id: ``x-profile-id`` header of the profiled response.
+    :param fmt: file format.
+    :raises HTTPException: if this worker has no such profile.
+    :return: profile file.
+    """
+    path = profile_path(profile_id, fmt)
+    if not path.is_file():
+        raise HTTPException(status_code=404, detail="Profile not found")
+    return FileResponse(path, filename=path.name)
+
+
+def require_tracing() -> None:
+    """
+    Fail unless allocations are being traced.
+
+    :raises HTTPException: if tracing was not started.
+    """
+    if not tracemalloc.is_tracing():
+        raise HTTPException(status_code=409, detail="Memory tracing is not started")
+
+
+@router.post("/memory", status_code=204)
+async def start_memory_tracing(
+    frames: Annotated[int, Query(ge=1, le=100)] = 25,
+) -> None:
+    """
+    Start tracing the allocations of this worker, restarting if needed.
+
+    Tracing slows the worker down and grows with ``frames``, stop it
+    with ``DELETE /memory`` when done.
+
+    :param frames: frames stored per allocation, enough to reach application code.
+    """
+    await asyncio.to_thread(memory_tracker.start, frames)
+
+
+@router.post("/memory/baseline", status_code=204, dependencies=[Depends(require_tracing)])
+async def reset_memory_baseline() -> None:
+    """Compare later reports with the allocations alive now."""
+    await asyncio.to_thread(memory_tracker.reset_baseline)
+
+
+@router.get("/memory", response_model=MemoryReport, dependencies=[Depends(require_tracing)])
+async def get_memory_report(
+    limit: Annotated[int, Query(ge=1, le=1000)] = 20,
+    group_by: Annotated[GroupBy, Query(alias="groupBy")] = "module",
+) -> MemoryReport:
+    """
+    Get the places holding the most memory in this worker.
+
+    By module, allocations made by libraries count for the innermost
+    ``operaclone2`` module that called them. Diffs are relative to the
+    baseline taken on start or with ``POST /memory/baseline``.
+
+    :param limit: number of places.
+    :param group_by: ``module`` or ``line``.
+    :return: allocation sites and sampled per-route peaks.
+    """
+    sites = await asyncio.to_thread(memory_tracker.report, group_by, limit)
+    traced, peak = tracemalloc.get_traced_memory()
+    return MemoryReport(
+        tracedBytes=traced,
+        peakBytes=peak,
+        sites=[
+            AllocationSite(
+                location=site.location,
+                sizeBytes=site.size,
+                count=site.count,
+                sizeDiffBytes=site.size_diff,
+                countDiff=site.count_diff,
+            )
+            for site in sites
+        ],
+        routes=[
+            RoutePeak(
+                route=peak.route,
+                samples=peak.samples,
+                meanBytes=peak.mean,
+                maxBytes=peak.max,
+            )
+            for peak in memory_tracker.largest_route_peaks()
+        ],
+    )
+
+
+@router.delete("/memory", status_code=204)
+async def stop_memory_tracing() -> None:
+    """Stop tracing allocations and free the snapshots."""
+    memory_tracker.stop()
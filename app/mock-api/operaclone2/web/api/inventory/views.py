@@ -4,8 +4,9 @@ from fastapi import APIRouter, Depends, Path, Query
 
 from operaclone2.services.inventory_service import InventoryService
 from operaclone2.web.api.inventory.schema import InventoryStatistics
+from operaclone2.web.routing import TimedRoute
 
-router = APIRouter()
+router = APIRouter(route_class=TimedRoute)
 
 
 @router.get("/hotels/{hotelId}/inventoryStatistics", response_model=InventoryStatistics)
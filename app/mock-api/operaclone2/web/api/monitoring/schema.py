@@ -0,0 +1,17 @@
+from typing import Literal
+
+from pydantic import BaseModel
+
+
+class ReadinessCheck(BaseModel):
+    """Outcome of one readiness check."""
+
+    ok: bool
+    detail: str
+
+
+class ReadinessResponse(BaseModel):
+    """Whether the worker can serve requests, and why."""
+
+    status: Literal["ready", "notReady", "starting"]
+    checks: dict[str, ReadinessCheck]
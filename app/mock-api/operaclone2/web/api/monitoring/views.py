@@ -1,12 +1,63 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Request, Response
+from fastapi.responses import PlainTextResponse
+
+from operaclone2.metrics import registry
+from operaclone2.web.api.monitoring.schema import ReadinessCheck, ReadinessResponse
 
 router = APIRouter()
 
+EXPOSITION_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
 
 @router.get("/health")
-def health_check() -> None:
+async def health_check() -> None:
     """
     Checks the health of a project.
 
     It returns 200 if the project is healthy.
     """
+
+
+@router.get(
+    "/ready",
+    response_model=ReadinessResponse,
+    responses={503: {"model": ReadinessResponse}},
+    include_in_schema=False,
+)
+async def readiness_check(request: Request, response: Response) -> ReadinessResponse:
+    """
+    Checks whether this worker can serve requests.
+
+    Unlike ``/health``, it checks the database, the connection pool,
+    the pool warm-up and the seed data. Outcomes are cached for
+    ``readiness_cache_seconds``.
+
+    :param request: current request.
+    :param response: response, set to 503 when not ready.
+    :return: outcome of every check.
+    """
+    probe = getattr(request.app.state, "readiness", None)
+    if probe is None:
+        response.status_code = 503
+        return ReadinessResponse(status="starting", checks={})
+
+    readiness = await probe.check()
+    if not readiness.ready:
+        response.status_code = 503
+    return ReadinessResponse(
+        status="ready" if readiness.ready else "notReady",
+        checks={
+            name: ReadinessCheck(ok=check.ok, detail=check.detail)
+            for name, check in readiness.checks.items()
+        },
+    )
+
+
+@router.get("/metrics", include_in_schema=False)
+async def get_metrics() -> PlainTextResponse:
+    """
+    Metrics of this worker in the Prometheus text exposition format.
+
+    :return: exposition text.
+    """
+    return PlainTextResponse(registry.render(), media_type=EXPOSITION_CONTENT_TYPE)
@@ -1,8 +1,13 @@
 from datetime import date
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, Path, Query
+from fastapi import APIRouter, Depends, Header, HTTPException, Path, Query
 
+from operaclone2.errors.exceptions import (
+    IdempotencyKeyConflictError,
+    IdempotencyKeyInProgressError,
+)
+from operaclone2.services.idempotency_service import IdempotencyService
 from operaclone2.services.reservation_service import ReservationService
 from operaclone2.web.api.reservation.schema import (
     CancelReservationDetails,
@@ -12,8 +17,18 @@ from operaclone2.web.api.reservation.schema import (
     ReservationListResponse,
     ReservationSummaryResponse,
 )
+from operaclone2.web.routing import TimedRoute
+
+router = APIRouter(route_class=TimedRoute)
 
-router = APIRouter()
+IdempotencyKey = Annotated[
+    str | None,
+    Header(
+        alias="Idempotency-Key",
+        max_length=255,
+        description="Unique key making retries of this request safe",
+    ),
+]
 
 
 @router.get("/hotels/{hotelId}/reservations", response_model=ReservationListResponse)
@@ -88,10 +103,22 @@ async def get_reservation_statistics(
 async def create_reservation(
     hotel_id: Annotated[str, Path(alias="hotelId")],
     request: CreateReservationRequest,
+    idempotency_key: IdempotencyKey = None,
     reservation_service: ReservationService = Depends(),
+    idempotency_service: IdempotencyService = Depends(),
 ) -> ReservationListResponse:
     """Create Reservation."""
-    return await reservation_service.create_reservation(hotel_id=hotel_id, request=request)
+    try:
+        return await idempotency_service.execute(
+            idempotency_key,
+            idempotency_service.fingerprint(f"POST /hotels/{hotel_id}/reservations", request),
+            ReservationListResponse,
+            lambda: reservation_service.create_reservation(hotel_id=hotel_id, request=request),
+        )
+    except IdempotencyKeyConflictError as exc:
+        raise HTTPException(status_code=422, detail=exc.message) from None
+    except IdempotencyKeyInProgressError as exc:
+        raise HTTPException(status_code=409, detail=exc.message) from None
 
 
 @router.put(
@@ -102,12 +129,26 @@ async def update_reservation(
     hotel_id: Annotated[str, Path(alias="hotelId")],
     reservation_id: Annotated[str, Path(alias="reservationId")],
     request: CreateReservationRequest,  # Simplified for update
+    idempotency_key: IdempotencyKey = None,
     reservation_service: ReservationService = Depends(),
+    idempotency_service: IdempotencyService = Depends(),
 ) -> ReservationListResponse:
     """Update Reservation by ID."""
-    return await reservation_service.update_reservation(
-        hotel_id=hotel_id, reservation_id=reservation_id, request=request
-    )
+    try:
+        return await idempotency_service.execute(
+            idempotency_key,
+            idempotency_service.fingerprint(
+                f"PUT /hotels/{hotel_id}/reservations/{reservation_id}", request
+            ),
+            ReservationListResponse,
+            lambda: reservation_service.update_reservation(
+                hotel_id=hotel_id, reservation_id=reservation_id, request=request
+            ),
+        )
+    except IdempotencyKeyConflictError as exc:
+        raise HTTPException(status_code=422, detail=exc.message) from None
+    except IdempotencyKeyInProgressError as exc:
+        raise HTTPException(status_code=409, detail=exc.message) from None
 
 
 @router.post(
@@ -119,9 +160,23 @@ async def cancel_reservation(
     hotel_id: Annotated[str, Path(alias="hotelId")],
     reservation_id: Annotated[str, Path(alias="reservationId")],
     request: CancelReservationRequest,
+    idempotency_key: IdempotencyKey = None,
     reservation_service: ReservationService = Depends(),
+    idempotency_service: IdempotencyService = Depends(),
 ) -> CancelReservationDetails:
     """Cancel Reservation by ID."""
-    return await reservation_service.cancel_reservation(
-        hotel_id=hotel_id, reservation_id=reservation_id, request=request
-    )
+    try:
+        return await idempotency_service.execute(
+            idempotency_key,
+            idempotency_service.fingerprint(
+                f"POST /hotels/{hotel_id}/reservations/{reservation_id}/cancellations", request
+            ),
+            CancelReservationDetails,
+            lambda: reservation_service.cancel_reservation(
+                hotel_id=hotel_id, reservation_id=reservation_id, request=request
+            ),
+        )
+    except IdempotencyKeyConflictError as exc:
+        raise HTTPException(status_code=422, detail=exc.message) from None
+    except IdempotencyKeyInProgressError as exc:
+        raise HTTPException(status_code=409, detail=exc.message) from None
@@ -1,21 +1,33 @@
 from fastapi.routing import APIRouter
 
+from operaclone2.settings import settings
 from operaclone2.web.api import (
     content,
-    docs,
-    dummy,
-    echo,
+    debug,
     inventory,
     monitoring,
     reservation,
     shop,
 )
+from operaclone2.web.lazy import OptionalRouter
+
+DOCS = OptionalRouter(
+    "operaclone2.web.api.docs",
+    paths=("/docs", "/swagger-redirect", "/redoc"),
+)
+ECHO = OptionalRouter("operaclone2.web.api.echo", prefix="/echo", tags=("echo",))
+DUMMY = OptionalRouter("operaclone2.web.api.dummy", prefix="/dummy", tags=("dummy",))
+# Routers imported on their first request when settings.lazy_routers is on.
+optional_routers = (DOCS, ECHO, DUMMY)
 
 api_router = APIRouter()
 api_router.include_router(monitoring.router)
-api_router.include_router(docs.router)
-api_router.include_router(echo.router, prefix="/echo", tags=["echo"])
-api_router.include_router(dummy.router, prefix="/dummy", tags=["dummy"])
+if not settings.lazy_routers:
+    DOCS.include_into(api_router)
+api_router.include_router(debug.router, prefix="/debug", tags=["debug"], include_in_schema=False)
+if not settings.lazy_routers:
+    ECHO.include_into(api_router)
+    DUMMY.include_into(api_router)
 api_router.include_router(shop.router, prefix="/shop/v1", tags=["Shop"])
 api_router.include_router(inventory.router, prefix="/inv/v1", tags=["Inventory"])
 api_router.include_router(content.router, prefix="/content/v1", tags=["Content"])
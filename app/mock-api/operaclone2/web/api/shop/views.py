@@ -8,8 +8,9 @@ from operaclone2.web.api.shop.schema import (
     PropertyOffersResponse,
     PropertySearchResponse,
 )
+from operaclone2.web.routing import TimedRoute
 
-router = APIRouter()
+router = APIRouter(route_class=TimedRoute)
 
 
 @router.get("/hotels", response_model=PropertySearchResponse)
@@ -7,8 +7,17 @@ from fastapi.staticfiles import StaticFiles
 
 from operaclone2.log import configure_logging
 from operaclone2.settings import settings
-from operaclone2.web.api.router import api_router
+from operaclone2.web.api.router import api_router, optional_routers
+from operaclone2.web.lazy import add_lazy_routers
 from operaclone2.web.lifespan import lifespan_setup
+from operaclone2.web.middlewares import (
+    AdmissionMiddleware,
+    DAOMemoMiddleware,
+    MetricsMiddleware,
+    ProfilingMiddleware,
+    ServerTimingMiddleware,
+    StaleWarningMiddleware,
+)
 
 APP_ROOT = Path(__file__).parent.parent
 
@@ -45,8 +54,24 @@ def get_app() -> FastAPI:
         allow_headers=["*"],
     )
 
+    # cProfile and stack samples of requests sent with x-profile: 1.
+    app.add_middleware(ProfilingMiddleware)
+    # Request-scoped memo for DAO reads.
+    app.add_middleware(DAOMemoMiddleware)
+    # Warning header on responses served from stale cache entries.
+    app.add_middleware(StaleWarningMiddleware)
+    # Counts requests in flight, see check_admission for the 503 of search and content
+    # requests while the database falls behind.
+    app.add_middleware(AdmissionMiddleware)
+    # Per-route request metrics, exposed at /api/metrics.
+    app.add_middleware(MetricsMiddleware)
+    # Server-Timing header and x-request-id in every log record.
+    app.add_middleware(ServerTimingMiddleware)
+
     # Main router for the API.
     app.include_router(router=api_router, prefix="/api")
+    if settings.lazy_routers:
+        add_lazy_routers(app, optional_routers, prefix="/api")
     # Adds static directory.
     # This directory is used to access swagger files.
     app.mount("/static", StaticFiles(directory=APP_ROOT / "static"), name="static")
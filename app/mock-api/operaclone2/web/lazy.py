@@ -0,0 +1,118 @@
+"""Routers imported on their first request, see ``Settings.lazy_routers``."""
+
+from dataclasses import dataclass
+from importlib import import_module
+from typing import Any
+
+from fastapi import FastAPI
+from fastapi.routing import APIRouter
+from starlette.datastructures import URLPath
+from starlette.routing import BaseRoute, Match, NoMatchFound, get_route_path
+from starlette.types import Receive, Scope, Send
+
+
+@dataclass(frozen=True, slots=True)
+class OptionalRouter:
+    """Router of a rarely used API package."""
+
+    # Package exposing ``router``.
+    module: str
+    prefix: str = ""
+    tags: tuple[str, ...] = ()
+    # Paths below the prefix that need the router, all of them when empty.
+    paths: tuple[str, ...] = ()
+
+    def include_into(self, router: APIRouter, prefix: str = "") -> None:
+        """
+        Import the package and include its router.
+
+        :param router: router to include into.
+        :param prefix: prefix of ``router`` in the application.
+        """
+        router.include_router(
+            import_module(self.module).router,
+            prefix=prefix + self.prefix,
+            tags=list(self.tags),
+        )
+
+
+class LazyRoute(BaseRoute):
+    """
+    Placeholder of an optional router in the application.
+
+    The first request to one of its paths imports the router, replaces
+    the placeholder with the real routes and dispatches the request again.
+    """
+
+    def __init__(self, app: FastAPI, optional: OptionalRouter, prefix: str = "") -> None:
+        self.fastapi_app = app
+        self.optional = optional
+        self.prefix = prefix
+        base = prefix + optional.prefix
+        self.paths = tuple(base + path for path in optional.paths) or (base,)
+
+    def matches(self, scope: Scope) -> tuple[Match, Scope]:
+        """
+        Match every HTTP request below one of the paths.
+
+        :param scope: request scope.
+        :return: match and child scope.
+        """
+        if scope["type"] == "http":
+            route_path = get_route_path(scope)
+            for path in self.paths:
+                if route_path == path or route_path.startswith(path.rstrip("/") + "/"):
+                    return Match.FULL, {}
+        return Match.NONE, {}
+
+    def url_path_for(self, name: str, /, **path_params: Any) -> URLPath:
+        """
+        Lazy routes have no names.
+
+        :param name: route name.
+        :param path_params: path parameters.
+        :raises NoMatchFound: always.
+        """
+        raise NoMatchFound(name, path_params)
+
+    def load(self) -> None:
+        """Replace the placeholder with the routes of the router."""
+        routes = self.fastapi_app.router.routes
+        if self in routes:
+            routes.remove(self)
+            self.optional.include_into(self.fastapi_app.router, self.prefix)
+
+    async def handle(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Load the router and route the request to it.
+
+        :param scope: request scope.
+        :param receive: ASGI receive.
+        :param send: ASGI send.
+        """
+        self.load()
+        await self.fastapi_app.router(scope, receive, send)
+
+
+def add_lazy_routers(
+    app: FastAPI, optional_routers: tuple[OptionalRouter, ...], prefix: str
+) -> None:
+    """
+    Add placeholders of optional routers to an application.
+
+    The OpenAPI schema loads all of them first, so it stays complete.
+
+    :param app: application.
+    :param optional_routers: routers to load on demand.
+    :param prefix: prefix of the routers in the application.
+    """
+    placeholders = [LazyRoute(app, optional, prefix) for optional in optional_routers]
+    app.router.routes.extend(placeholders)
+    build_openapi = app.openapi
+
+    def openapi() -> dict[str, Any]:
+        for placeholder in placeholders:
+            placeholder.load()
+        return build_openapi()
+
+    app.openapi = openapi  # type: ignore[method-assign]
@@ -1,10 +1,24 @@
+import asyncio
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
+from functools import partial
 
 from fastapi import FastAPI
 from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import QueuePool
 
 from operaclone2 import seed
+from operaclone2.db.instrumentation import instrument_engine
+from operaclone2.db.leader import StartupTask, run_startup_tasks
+from operaclone2.db.pool import WaitTimedQueuePool
+from operaclone2.db.scheduler import FairScheduler
+from operaclone2.db.utils import check_migrations
+from operaclone2.db.warmup import warm_up_pool
+from operaclone2.deadline import DeadlineSession, connect_args
+from operaclone2.loop_monitor import LoopMonitor
+from operaclone2.metrics import CallbackMetric, LabelValues, registry
+from operaclone2.readiness import ReadinessProbe
+from operaclone2.services.idempotency_service import purge_expired_keys
 from operaclone2.settings import settings
 
 
@@ -18,13 +32,73 @@ def _setup_db(app: FastAPI) -> None:  # pragma: no cover
 
     :param app: fastAPI application.
     """
-    engine = create_async_engine(str(settings.db_url), echo=settings.db_echo)
+    engine = create_async_engine(
+        str(settings.db_url),
+        echo=settings.db_echo,
+        # Checkout waits feed admission control.
+        poolclass=WaitTimedQueuePool,
+        # Default statement_timeout, so most transactions need no SET LOCAL.
+        connect_args=connect_args(),
+    )
+    instrument_engine(engine)
     session_factory = async_sessionmaker(
         engine,
         expire_on_commit=False,
+        # Applies the request deadline as statement_timeout.
+        sync_session_class=DeadlineSession,
     )
     app.state.db_engine = engine
     app.state.db_session_factory = session_factory
+    app.state.db_scheduler = None
+    if settings.db_scheduler_capacity > 0:
+        app.state.db_scheduler = FairScheduler(
+            settings.db_scheduler_capacity,
+            weights=settings.db_channel_weights,
+            limits=settings.db_channel_limits,
+            default_weight=settings.db_channel_default_weight,
+            default_limit=settings.db_channel_default_limit,
+        )
+
+
+def _setup_metrics(app: FastAPI) -> None:  # pragma: no cover
+    """
+    Exposes the state of the database connection pool as metrics.
+
+    :param app: fastAPI application.
+    """
+    pool = app.state.db_engine.pool
+
+    def pool_connections() -> list[tuple[LabelValues, float]]:
+        if not isinstance(pool, QueuePool):
+            return []
+        return [
+            (("size",), pool.size()),
+            (("checked_out",), pool.checkedout()),
+            (("checked_in",), pool.checkedin()),
+            (("overflow",), pool.overflow()),
+        ]
+
+    registry.register(
+        CallbackMetric(
+            "db_pool_connections",
+            "Connections of the database pool by state.",
+            "gauge",
+            pool_connections,
+            ("state",),
+        ),
+    )
+
+    scheduler = app.state.db_scheduler
+    if scheduler is not None:
+        registry.register(
+            CallbackMetric(
+                "db_scheduler_queue_depth",
+                "Requests waiting for a database session, by channel.",
+                "gauge",
+                scheduler.queue_depths,
+                ("channel",),
+            ),
+        )
 
 
 @asynccontextmanager
@@ -43,11 +117,48 @@ async def lifespan_setup(
 
     app.middleware_stack = None
     _setup_db(app)
+    _setup_metrics(app)
     app.middleware_stack = app.build_middleware_stack()
 
-    # Seed data
-    await seed.seed_hotel(app.state.db_session_factory)
-    await seed.seed_room(app.state.db_session_factory)
+    # One-off tasks run in a single worker, see run_startup_tasks.
+    tasks: list[StartupTask] = [partial(check_migrations, app.state.db_engine)]
+    if settings.seed_on_startup:
+        tasks.append(partial(seed.seed_database, app.state.db_session_factory))
+    app.state.startup_leader = await run_startup_tasks(
+        app.state.db_engine,
+        tasks,
+        settings.startup_leader_timeout,
+    )
+    # Read-only, so every worker warms up its own pool.
+    warmed = await warm_up_pool(app.state.db_engine, settings.db_warmup_connections)
+    app.state.readiness = ReadinessProbe(
+        app.state.db_engine,
+        cache_seconds=settings.readiness_cache_seconds,
+        timeout=settings.readiness_timeout,
+        warmup_connections=settings.db_warmup_connections,
+        warmed_up=warmed > 0,
+        seed_required=settings.seed_on_startup,
+    )
+
+    loop_monitor = None
+    if settings.loop_monitor_enabled:
+        loop_monitor = LoopMonitor(settings.loop_block_threshold_ms / 1000)
+        loop_monitor.start()
+
+    purge = None
+    if settings.idempotency_purge_interval_seconds > 0:
+        purge = asyncio.create_task(
+            purge_expired_keys(
+                app.state.db_session_factory,
+                settings.idempotency_purge_interval_seconds,
+            ),
+            name="idempotency-purge",
+        )
 
     yield
+    if purge is not None:
+        purge.cancel()
+        await asyncio.gather(purge, return_exceptions=True)
+    if loop_monitor is not None:
+        await loop_monitor.stop()
     await app.state.db_engine.dispose()
@@ -0,0 +1,17 @@
+"""ASGI middlewares of the application."""
+
+from operaclone2.web.middlewares.admission import AdmissionMiddleware
+from operaclone2.web.middlewares.dao_memo import DAOMemoMiddleware
+from operaclone2.web.middlewares.metrics import MetricsMiddleware
+from operaclone2.web.middlewares.profiling import ProfilingMiddleware
+from operaclone2.web.middlewares.server_timing import ServerTimingMiddleware
+from operaclone2.web.middlewares.stale_warning import StaleWarningMiddleware
+
+__all__ = [
+    "AdmissionMiddleware",
+    "DAOMemoMiddleware",
+    "MetricsMiddleware",
+    "ProfilingMiddleware",
+    "ServerTimingMiddleware",
+    "StaleWarningMiddleware",
+]
@@ -0,0 +1,34 @@
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from operaclone2.admission import admission_controller
+
+
+class AdmissionMiddleware:
+    """
+    Counts the requests in flight, for admission control.
+
+    Low-priority requests are shed when they open a database session
+    while the worker is overloaded, see ``check_admission``, so those
+    answered from caches still go through.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Handle a request while counting it in flight.
+
+        :param scope: ASGI scope.
+        :param receive: ASGI receive channel.
+        :param send: ASGI send channel.
+        """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        admission_controller.in_flight += 1
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            admission_controller.in_flight -= 1
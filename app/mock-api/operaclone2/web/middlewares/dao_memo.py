@@ -0,0 +1,40 @@
+import logging
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from operaclone2.db.dao.memo import activate_memo, deactivate_memo
+
+logger = logging.getLogger(__name__)
+
+
+class DAOMemoMiddleware:
+    """Gives every HTTP request its own DAO memo, see ``DAOMemo``."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Handle a request with a fresh memo.
+
+        :param scope: ASGI scope.
+        :param receive: ASGI receive channel.
+        :param send: ASGI send channel.
+        """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        memo, token = activate_memo()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            deactivate_memo(token)
+            if memo.duplicates:
+                logger.debug(
+                    "%s %s: %d of %d DAO reads were duplicates",
+                    scope["method"],
+                    scope["path"],
+                    memo.duplicates,
+                    memo.calls,
+                )
@@ -0,0 +1,86 @@
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from operaclone2.channels import channel_code, channel_label, known_channels
+from operaclone2.loop_monitor import activate_request_scope, deactivate_request_scope
+from operaclone2.memory import memory_tracker
+from operaclone2.metrics import (
+    http_request_duration,
+    http_requests,
+    http_requests_in_flight,
+    http_response_size,
+)
+
+# Requests that did not match any route share one label value.
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+def route_template(scope: Scope) -> str:
+    """
+    Get the path template of the route that handled a request.
+
+    :param scope: ASGI scope after routing.
+    :return: template such as ``/api/shop/v1/hotels/{hotelCode}/offers``.
+    """
+    route = scope.get("route")
+    return getattr(route, "path", None) or UNMATCHED_ROUTE
+
+
+class MetricsMiddleware:
+    """
+    Records per-route request count, latency and response size.
+
+    Requests of channels missing from ``known_channels`` are labelled
+    ``other``, so clients cannot add series with new channel codes.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+        self.known_channels = known_channels()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Handle a request while recording its metrics.
+
+        :param scope: ASGI scope.
+        :param receive: ASGI receive channel.
+        :param send: ASGI send channel.
+        """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+        response_size = 0
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code, response_size
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            elif message["type"] == "http.response.body":
+                response_size += len(message.get("body", b""))
+            await send(message)
+
+        http_requests_in_flight.inc()
+        # Lets the loop monitor attribute blocking calls to the route.
+        scope_token = activate_request_scope(scope)
+        # Only while allocations are traced, see ``/api/debug/memory``.
+        memory_start = memory_tracker.begin_route_sample()
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            duration = time.perf_counter() - start
+            deactivate_request_scope(scope_token)
+            if memory_start is not None:
+                memory_tracker.end_route_sample(route_template(scope), memory_start)
+            http_requests_in_flight.dec()
+            labels = (
+                route_template(scope),
+                scope["method"],
+                channel_label(channel_code(scope), self.known_channels),
+            )
+            http_requests.inc(*labels, str(status_code))
+            http_request_duration.observe(duration, *labels)
+            http_response_size.observe(response_size, *labels)
@@ -0,0 +1,80 @@
+import asyncio
+import cProfile
+import logging
+import threading
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from operaclone2.profiling import StackSampler, profile_id, save_profile
+from operaclone2.settings import settings
+from operaclone2.web.middlewares.server_timing import request_id
+
+logger = logging.getLogger(__name__)
+
+
+def wants_profile(scope: Scope) -> bool:
+    """
+    Check the ``x-profile`` header of a request.
+
+    :param scope: ASGI scope.
+    :return: whether the client asked for a profile.
+    """
+    headers: list[tuple[bytes, bytes]] = scope["headers"]
+    return any(name == b"x-profile" and value in {b"1", b"true"} for name, value in headers)
+
+
+class ProfilingMiddleware:
+    """
+    Profiles requests sent with ``x-profile: 1``.
+
+    Only when ``profiling_enabled`` is on. The request runs under
+    ``cProfile`` while its stack is sampled, and both results are saved
+    under a generated id sent in ``x-profile-id``, along with the request
+    id as metadata, see ``GET /api/debug/profiles/{profileId}``.
+    The profiler sees every coroutine run by the event loop meanwhile,
+    so profile in isolation for clean results. Profiled requests are
+    serialized.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+        self.lock = asyncio.Lock()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Handle a request, under the profiler if asked.
+
+        :param scope: ASGI scope.
+        :param receive: ASGI receive channel.
+        :param send: ASGI send channel.
+        """
+        if scope["type"] != "http" or not settings.profiling_enabled or not wants_profile(scope):
+            await self.app(scope, receive, send)
+            return
+
+        profile = profile_id()
+        metadata = {
+            "requestId": scope.get("state", {}).get("request_id") or request_id(scope),
+            "method": scope["method"],
+            "path": scope["path"],
+        }
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message).append("x-profile-id", profile)
+            await send(message)
+
+        async with self.lock:
+            profiler = cProfile.Profile()
+            sampler = StackSampler(threading.get_ident())
+            sampler.start()
+            profiler.enable()
+            try:
+                await self.app(scope, receive, send_wrapper)
+            finally:
+                profiler.disable()
+                samples = sampler.stop()
+
+        await asyncio.to_thread(save_profile, profile, profiler, samples, metadata)
+        logger.info("Saved profile %s of request %s", profile, metadata["requestId"])
@@ -0,0 +1,88 @@
+import uuid
+
+from loguru import logger
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from operaclone2.settings import settings
+from operaclone2.timing import RequestTiming, activate_timing, deactivate_timing
+
+MAX_REQUEST_ID_LENGTH = 128
+
+
+def request_id(scope: Scope) -> str:
+    """
+    Get the ``x-request-id`` header of a request or generate one.
+
+    :param scope: ASGI scope.
+    :return: request id.
+    """
+    headers: list[tuple[bytes, bytes]] = scope["headers"]
+    for name, value in headers:
+        if name == b"x-request-id" and value:
+            return value.decode("latin-1")[:MAX_REQUEST_ID_LENGTH]
+    return uuid.uuid4().hex
+
+
+def server_timing_header(timing: RequestTiming) -> str:
+    """
+    Render a timing as a ``Server-Timing`` header value.
+
+    :param timing: request timing.
+    :return: header value, durations in milliseconds.
+    """
+    return ", ".join(
+        [
+            f'db;dur={timing.db * 1000:.1f};desc="{timing.db_round_trips} round trips"',
+            f"service;dur={timing.service * 1000:.1f}",
+            f"serialization;dur={timing.serialization * 1000:.1f}",
+            f"total;dur={timing.elapsed * 1000:.1f}",
+        ],
+    )
+
+
+class ServerTimingMiddleware:
+    """
+    Reports where the time of a request went and tags its logs.
+
+    Every log record emitted while serving the request carries the
+    ``x-request-id`` of the request, which is echoed in the response.
+    The time breakdown is sent in the ``Server-Timing`` header unless
+    ``server_timing_enabled`` is off.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+        self.timing_allow_origin = settings.cors_origins
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Handle a request while timing it.
+
+        :param scope: ASGI scope.
+        :param receive: ASGI receive channel.
+        :param send: ASGI send channel.
+        """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        current_request_id = request_id(scope)
+        # Available to inner middlewares and as request.state.request_id.
+        scope.setdefault("state", {})["request_id"] = current_request_id
+        timing, token = activate_timing()
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                headers.append("x-request-id", current_request_id)
+                if settings.server_timing_enabled:
+                    headers.append("Server-Timing", server_timing_header(timing))
+                    headers.append("Timing-Allow-Origin", self.timing_allow_origin)
+            await send(message)
+
+        try:
+            with logger.contextualize(request_id=current_request_id):
+                await self.app(scope, receive, send_wrapper)
+        finally:
+            deactivate_timing(token)
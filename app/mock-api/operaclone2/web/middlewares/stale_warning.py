@@ -0,0 +1,43 @@
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from operaclone2.services.stale_cache import activate_stale_warnings, deactivate_stale_warnings
+
+
+class StaleWarningMiddleware:
+    """
+    Flags responses built from stale cache entries, see ``StaleCache``.
+
+    Every warning raised while serving the request is sent in a
+    ``Warning`` header, so clients can tell stale content apart and
+    notice when the database is unavailable.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Handle a request while collecting its cache warnings.
+
+        :param scope: ASGI scope.
+        :param receive: ASGI receive channel.
+        :param send: ASGI send channel.
+        """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        warnings, token = activate_stale_warnings()
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                for warning in sorted(warnings):
+                    headers.append("Warning", warning)
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            deactivate_stale_warnings(token)
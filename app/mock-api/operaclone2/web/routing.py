@@ -0,0 +1,126 @@
+import asyncio
+import functools
+import inspect
+import time
+from collections.abc import Callable, Coroutine
+from typing import Any
+
+from fastapi.routing import APIRoute
+from sqlalchemy.exc import DBAPIError
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response
+
+from operaclone2.deadline import (
+    activate_deadline,
+    deactivate_deadline,
+    is_query_canceled,
+    request_timeout,
+)
+from operaclone2.timing import current_timing
+
+type RequestHandler = Callable[[Request], Coroutine[Any, Any, Response]]
+
+
+def _timed_endpoint(endpoint: Callable[..., Any]) -> Callable[..., Any]:
+    if inspect.iscoroutinefunction(endpoint):
+
+        @functools.wraps(endpoint)
+        async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+            start = time.perf_counter()
+            try:
+                return await endpoint(*args, **kwargs)
+            finally:
+                _add_service_time(start)
+
+        return async_wrapper
+
+    @functools.wraps(endpoint)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        start = time.perf_counter()
+        try:
+            return endpoint(*args, **kwargs)
+        finally:
+            _add_service_time(start)
+
+    return wrapper
+
+
+def _add_service_time(start: float) -> None:
+    timing = current_timing()
+    if timing is not None:
+        timing.endpoint_end = time.perf_counter()
+        timing.service += timing.endpoint_end - start
+
+
+def deadline_exceeded() -> Response:
+    """
+    Get the response of a request that missed its deadline.
+
+    :return: 504 response.
+    """
+    return JSONResponse({"detail": "Request deadline exceeded"}, status_code=504)
+
+
+def _with_deadline(route: str, handler: RequestHandler) -> RequestHandler:
+    async def deadline_handler(request: Request) -> Response:
+        timeout = request_timeout(request.scope, route)
+        if timeout is None:
+            return await handler(request)
+        token = activate_deadline(timeout)
+        deadline = asyncio.timeout(timeout)
+        try:
+            async with deadline:
+                return await handler(request)
+        except TimeoutError:
+            if not deadline.expired():
+                raise
+            return deadline_exceeded()
+        except DBAPIError as exc:
+            # statement_timeout fired before the handler was cancelled.
+            if not is_query_canceled(exc):
+                raise
+            return deadline_exceeded()
+        finally:
+            deactivate_deadline(token)
+
+    return deadline_handler
+
+
+class TimedRoute(APIRoute):
+    """
+    Route that splits its handling time into service and serialization.
+
+    The endpoint is wrapped to measure the service time; everything the
+    route handler does after the endpoint returned (response model
+    validation, encoding, rendering) is counted as serialization.
+    FastAPI resolves the signature through ``__wrapped__``, so the
+    wrapper is invisible to dependency injection and OpenAPI.
+
+    The handler is also cancelled with a 504 at the deadline of the
+    request, see ``request_timeout``. The deadline is applied to the
+    Postgres statements of the request by ``DeadlineSession``.
+    """
+
+    def __init__(self, path: str, endpoint: Callable[..., Any], **kwargs: Any) -> None:
+        super().__init__(path, _timed_endpoint(endpoint), **kwargs)
+
+    def get_route_handler(self) -> RequestHandler:
+        """
+        Get the request handler recording serialization time.
+
+        :return: request handler.
+        """
+        handler = super().get_route_handler()
+
+        async def timed_handler(request: Request) -> Response:
+            timing = current_timing()
+            if timing is None:
+                return await handler(request)
+            start = time.perf_counter()
+            response = await handler(request)
+            # The endpoint did not run if request validation failed.
+            if timing.endpoint_end >= start:
+                timing.serialization += time.perf_counter() - timing.endpoint_end
+            return response
+
+        return _with_deadline(self.path, timed_handler)
@@ -1,21 +1,149 @@
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
 from typing import Any
 
 import pytest
 from fastapi import FastAPI
 from httpx import ASGITransport, AsyncClient
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, Engine
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
 )
+from starlette.types import ASGIApp, Receive, Scope, Send
 
-from operaclone2.db.dependencies import get_db_session
+from operaclone2.db.dependencies import LazySession, get_db_session, get_lazy_db_session
 from operaclone2.db.utils import create_database, drop_database
+from operaclone2.deadline import DeadlineSession, connect_args
+from operaclone2.services.stale_cache import all_stale_caches
 from operaclone2.settings import settings
 from operaclone2.web.application import get_app
 
+# Most SQL statements a request of each route may execute, by "METHOD /path".
+# The client fixture fails any request above its budget, so a lazy load
+# per row (N+1) or a forgotten memo shows up as a test failure.
+QUERY_BUDGETS: dict[str, int] = {
+    "GET /api/openapi.json": 0,
+    "GET /api/health": 0,
+    "GET /api/ready": 1,
+    "GET /api/metrics": 0,
+    "GET /api/docs": 0,
+    "GET /api/swagger-redirect": 0,
+    "GET /api/redoc": 0,
+    "GET /api/debug/queries": 0,
+    "DELETE /api/debug/queries": 0,
+    "GET /api/debug/profiles/{profileId}": 0,
+    "POST /api/debug/memory": 0,
+    "POST /api/debug/memory/baseline": 0,
+    "GET /api/debug/memory": 0,
+    "DELETE /api/debug/memory": 0,
+    "POST /api/echo/": 0,
+    # Lifting the statement_timeout of the connection, these routes have no deadline.
+    "GET /api/dummy/": 2,
+    "PUT /api/dummy/": 2,
+    "GET /api/shop/v1/hotels": 1,
+    "GET /api/shop/v1/hotels/{hotelCode}/offers": 1,
+    "GET /api/shop/v1/hotels/{hotelCode}/offer": 1,
+    "GET /api/inv/v1/hotels/{hotelId}/inventoryStatistics": 0,
+    # Page and total count.
+    "GET /api/content/v1/hotels": 2,
+    "GET /api/content/v1/hotels/{hotelCode}": 1,
+    # Hotel, page and total count, run concurrently outside of tests.
+    "GET /api/content/v1/hotels/{hotelCode}/roomTypes": 3,
+    "GET /api/rsv/v1/hotels/{hotelId}/reservations": 1,
+    "GET /api/rsv/v1/hotels/{hotelId}/reservations/summary": 1,
+    "GET /api/rsv/v1/hotels/{hotelId}/reservations/statistics": 1,
+    # Idempotency claim, two id blocks, insert, refresh and stored response.
+    "POST /api/rsv/v1/hotels/{hotelId}/reservations": 6,
+    # Idempotency claim, select, update, refresh and stored response.
+    "PUT /api/rsv/v1/hotels/{hotelId}/reservations/{reservationId}": 5,
+    "POST /api/rsv/v1/hotels/{hotelId}/reservations/{reservationId}/cancellations": 5,
+}
+
+_statements: ContextVar[list[str] | None] = ContextVar("statements", default=None)
+
+
+def _count_statement(
+    conn: Connection,
+    cursor: Any,
+    statement: str,
+    parameters: Any,
+    context: Any,
+    executemany: bool,
+) -> None:
+    statements = _statements.get()
+    if statements is not None:
+        statements.append(statement)
+
+
+def listen_for_statements(engine: AsyncEngine | Engine) -> None:
+    """
+    Make statements of an engine visible to ``count_statements``.
+
+    :param engine: engine to listen to.
+    """
+    sync_engine = engine.sync_engine if isinstance(engine, AsyncEngine) else engine
+    event.listen(sync_engine, "before_cursor_execute", _count_statement)
+
+
+@contextmanager
+def count_statements() -> Iterator[list[str]]:
+    """
+    Collect the statements executed in the current context.
+
+    Tasks and threads started meanwhile copy the context, so the statements
+    of concurrent DAO calls count as well.
+
+    :yield: statements, filled as they are executed.
+    """
+    statements: list[str] = []
+    token = _statements.set(statements)
+    try:
+        yield statements
+    finally:
+        _statements.reset(token)
+
+
+class QueryBudgetGuard:
+    """Fails requests executing more statements than their route budget."""
+
+    def __init__(self, app: ASGIApp, budgets: dict[str, int] = QUERY_BUDGETS) -> None:
+        self.app = app
+        self.budgets = budgets
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Handle a request and check its statement count.
+
+        :param scope: ASGI scope.
+        :param receive: ASGI receive channel.
+        :param send: ASGI send channel.
+        :raises AssertionError: if the route has no budget or exceeds it.
+        """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with count_statements() as statements:
+            await self.app(scope, receive, send)
+
+        route = scope.get("route")
+        if route is None:
+            return
+        key = f"{scope['method']} {route.path}"
+        budget = self.budgets.get(key)
+        if budget is None:
+            raise AssertionError(f"{key} has no query budget, add it to QUERY_BUDGETS")
+        if len(statements) > budget:
+            executed = "\n".join(statements)
+            raise AssertionError(
+                f"{key} executed {len(statements)} statements, budget is {budget}:\n{executed}",
+            )
+
 
 @pytest.fixture(scope="session")
 def anyio_backend() -> str:
@@ -41,7 +169,9 @@ async def _engine(anyio_backend: Any) -> AsyncGenerator[AsyncEngine]:
 
     await create_database()
 
-    engine = create_async_engine(str(settings.db_url))
+    # Connections start with the statement_timeout of production.
+    engine = create_async_engine(str(settings.db_url), connect_args=connect_args())
+    listen_for_statements(engine)
     async with engine.begin() as conn:
         await conn.run_sync(meta.create_all)
 
@@ -60,7 +190,8 @@ async def dbsession(
     Get session to database.
 
     Fixture that returns a SQLAlchemy session with a SAVEPOINT, and the rollback to it
-    after the test completes.
+    after the test completes. Like in production, its transactions begin with the
+    statement_timeout of the request deadline, which counts in query budgets.
 
     :param _engine: current engine.
     :yields: async session.
@@ -71,6 +202,7 @@ async def dbsession(
     session_maker = async_sessionmaker(
         connection,
         expire_on_commit=False,
+        sync_session_class=DeadlineSession,
     )
     session = session_maker()
 
@@ -89,10 +221,15 @@ def fastapi_app(
     """
     Fixture for creating FastAPI app.
 
+    Content and shop caches are emptied, so reads see the data of the test.
+
     :return: fastapi app with mocked dependencies.
     """
+    for cache in all_stale_caches():
+        cache.clear()
     application = get_app()
     application.dependency_overrides[get_db_session] = lambda: dbsession
+    application.dependency_overrides[get_lazy_db_session] = lambda: LazySession.of(dbsession)
     return application
 
 
@@ -101,10 +238,12 @@ async def client(fastapi_app: FastAPI, anyio_backend: Any) -> AsyncGenerator[Asy
     """
     Fixture that creates client for requesting server.
 
+    Every request must stay within the query budget of its route.
+
     :param fastapi_app: the application.
     :yield: client for the app.
     """
     async with AsyncClient(
-        transport=ASGITransport(fastapi_app), base_url="http://test", timeout=2.0
+        transport=ASGITransport(QueryBudgetGuard(fastapi_app)), base_url="http://test", timeout=2.0
     ) as ac:
         yield ac
@@ -0,0 +1,35 @@
+from benchmarks.stats import Summary, compare, percentile, summarize
+
+
+def test_percentile_nearest_rank() -> None:
+    """Percentiles pick an observed value."""
+    values = [float(value) for value in range(1, 101)]
+
+    assert percentile(values, 50) == 50.0
+    assert percentile(values, 99) == 99.0
+    assert percentile(values, 100) == 100.0
+    assert percentile([], 50) == 0.0
+
+
+def test_summarize() -> None:
+    """Durations are summarized with throughput and mean round trips."""
+    summary = summarize("case", [0.3, 0.1, 0.2], elapsed=1.5, errors=1, db_round_trips=[2, 4])
+
+    assert summary.count == 3
+    assert summary.throughput == 2.0
+    assert summary.p50 == 0.2
+    assert summary.db_round_trips == 3.0
+
+
+def test_compare_flags_regressions_beyond_tolerance() -> None:
+    """Only changes larger than the tolerance are regressions."""
+    baseline = {"case": Summary("case", 100, 0, 100.0, 0.010, 0.020, 0.050, 2.0)}
+    within = {"case": Summary("case", 100, 0, 95.0, 0.011, 0.021, 0.090, 2.0)}
+    beyond = {"case": Summary("case", 100, 0, 70.0, 0.011, 0.030, 0.050, 3.0)}
+
+    assert compare(within, baseline, tolerance=0.2) == []
+    assert compare(beyond, baseline, tolerance=0.2) == [
+        "case: p95 0.02 -> 0.03",
+        "case: db_round_trips 2 -> 3",
+        "case: throughput 100 -> 70",
+    ]
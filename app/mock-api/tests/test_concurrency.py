@@ -0,0 +1,119 @@
+import asyncio
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from operaclone2.db.dependencies import LazySession
+from operaclone2.db.scheduler import FairScheduler
+from operaclone2.services.concurrency import ConcurrentQueries
+from operaclone2.settings import settings
+
+
+def _queries(session_factory: Any, scheduler: FairScheduler | None = None) -> ConcurrentQueries:
+    scope = {"headers": [(b"x-channelcode", b"WEB")]}
+    request = SimpleNamespace(app=SimpleNamespace(state=SimpleNamespace()), scope=scope)
+    if session_factory is not None:
+        request.app.state.db_session_factory = session_factory
+    if scheduler is not None:
+        request.app.state.db_scheduler = scheduler
+    session = LazySession.of("request-session")  # type: ignore[arg-type]
+    return ConcurrentQueries(request, session)  # type: ignore[arg-type]
+
+
+@asynccontextmanager
+async def _fake_session() -> Any:
+    yield "pooled-session"
+
+
+async def test_gather_runs_calls_concurrently(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Calls overlap, but never more than the configured cap."""
+    monkeypatch.setattr(settings, "db_fanout_concurrency", 2)
+    queries = _queries(_fake_session)
+    running = 0
+    peak = 0
+
+    async def call(session: Any) -> Any:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return session
+
+    results = await queries.gather(call, call, call)
+
+    assert results == ("request-session", "pooled-session", "pooled-session")
+    assert peak == 2
+
+
+async def test_gather_without_session_factory_is_sequential() -> None:
+    """Without a pool every call runs on the request session."""
+    queries = _queries(None)
+
+    async def call(session: Any) -> Any:
+        return session
+
+    assert await queries.gather(call, call) == ("request-session", "request-session")
+
+
+async def test_pooled_sessions_hold_scheduler_slots() -> None:
+    """Every pooled session of a fan-out holds a slot of the request channel."""
+    scheduler = FairScheduler(capacity=3, weights={}, limits={})
+    await scheduler.acquire("WEB")
+    queries = _queries(_fake_session, scheduler)
+    held: list[int] = []
+
+    async def call(session: Any) -> Any:
+        await asyncio.sleep(0.01)
+        held.append(scheduler.channels["WEB"].active)
+        return session
+
+    results = await queries.gather(call, call, call)
+
+    assert results == ("request-session", "pooled-session", "pooled-session")
+    assert max(held) == 3
+    assert scheduler.active == 1
+
+
+async def test_full_scheduler_falls_back_to_the_request_session() -> None:
+    """Without a free slot, calls take turns on the request session instead of waiting."""
+    scheduler = FairScheduler(capacity=1, weights={}, limits={})
+    await scheduler.acquire("WEB")
+    queries = _queries(_fake_session, scheduler)
+    running = 0
+    peak = 0
+
+    async def call(session: Any) -> Any:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return session
+
+    results = await asyncio.wait_for(queries.gather(call, call, call), timeout=1)
+
+    assert results == ("request-session",) * 3
+    assert peak == 1
+    assert scheduler.active == 1
+
+
+async def test_detached_session_waits_for_a_slot() -> None:
+    """Background sessions queue for a slot of the request channel."""
+    scheduler = FairScheduler(capacity=1, weights={}, limits={})
+    await scheduler.acquire("WEB")
+    queries = _queries(_fake_session, scheduler)
+
+    async def detached() -> Any:
+        async with queries.detached() as background:
+            return await background.get_session(), scheduler.active
+
+    task = asyncio.create_task(detached())
+    await asyncio.sleep(0.01)
+    assert not task.done()
+    scheduler.release("WEB")
+
+    assert await task == ("pooled-session", 1)
+    assert scheduler.active == 0
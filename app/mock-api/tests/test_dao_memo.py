@@ -0,0 +1,61 @@
+import asyncio
+
+import pytest
+
+from operaclone2.db.dao.memo import activate_memo, deactivate_memo, memoized
+
+
+class CountingDAO:
+    """DAO stub counting executed reads."""
+
+    def __init__(self) -> None:
+        self.reads = 0
+
+    @memoized
+    async def get(self, code: str, codes: list[str] | None = None) -> str:
+        """Pretend to read a row."""
+        self.reads += 1
+        await asyncio.sleep(0.01)
+        if code == "missing":
+            raise LookupError(code)
+        return code
+
+
+async def test_memo_coalesces_identical_reads() -> None:
+    """Identical reads run once per request, including concurrent ones."""
+    dao = CountingDAO()
+    memo, token = activate_memo()
+    try:
+        results = list(
+            await asyncio.gather(dao.get("A", codes=["x"]), dao.get("A", codes=["x"])),
+        )
+        results.append(await dao.get("A", codes=["x"]))
+        results.append(await dao.get("B"))
+    finally:
+        deactivate_memo(token)
+
+    assert results == ["A", "A", "A", "B"]
+    assert dao.reads == 2
+    assert memo.duplicates == 2
+
+
+async def test_memo_does_not_cache_errors() -> None:
+    """A failed read is retried by the next caller."""
+    dao = CountingDAO()
+    _, token = activate_memo()
+    try:
+        for _ in range(2):
+            with pytest.raises(LookupError):
+                await dao.get("missing")
+    finally:
+        deactivate_memo(token)
+
+    assert dao.reads == 2
+
+
+async def test_no_memo_outside_request() -> None:
+    """Without an active memo every call hits the DAO."""
+    dao = CountingDAO()
+    await dao.get("A")
+    await dao.get("A")
+    assert dao.reads == 2
@@ -0,0 +1,120 @@
+import asyncio
+
+import pytest
+from fastapi import APIRouter, FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+from starlette import status
+
+from operaclone2.deadline import (
+    SET_STATEMENT_TIMEOUT,
+    activate_deadline,
+    connect_args,
+    deactivate_deadline,
+    request_timeout,
+    set_statement_timeout,
+)
+from operaclone2.settings import settings
+from operaclone2.web.routing import TimedRoute
+
+ROUTE = "/api/rsv/v1/hotels/{hotelId}/reservations"
+
+
+def _scope(timeout_ms: str | None = None) -> dict[str, object]:
+    headers = [] if timeout_ms is None else [(b"x-request-timeout-ms", timeout_ms.encode())]
+    return {"type": "http", "headers": headers}
+
+
+@pytest.fixture(autouse=True)
+def _timeouts(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Default deadline of 10 s, 2 s for the reservation search."""
+    monkeypatch.setattr(settings, "request_timeout_seconds", 10.0)
+    monkeypatch.setattr(settings, "route_timeouts", {ROUTE: 2.0})
+
+
+def test_route_timeouts_override_the_default() -> None:
+    """Routes without an override get request_timeout_seconds."""
+    assert request_timeout(_scope(), ROUTE) == 2.0
+    assert request_timeout(_scope(), "/api/content/v1/hotels") == 10.0
+
+
+def test_header_can_only_shorten_the_deadline() -> None:
+    """Clients cannot ask for more time than the route allows."""
+    assert request_timeout(_scope("500"), ROUTE) == 0.5
+    assert request_timeout(_scope("60000"), ROUTE) == 2.0
+    assert request_timeout(_scope("soon"), ROUTE) == 2.0
+
+
+def test_no_deadline(monkeypatch: pytest.MonkeyPatch) -> None:
+    """A zero timeout disables the deadline unless the client sets one."""
+    monkeypatch.setattr(settings, "request_timeout_seconds", 0.0)
+
+    assert request_timeout(_scope(), "/api/content/v1/hotels") is None
+    assert request_timeout(_scope("250"), "/api/content/v1/hotels") == 0.25
+
+
+def _statement_timeouts(*deadlines: float | None) -> list[str]:
+    """Begin one transaction per deadline and collect the statement_timeout values set."""
+    timeouts: list[str] = []
+
+    class Connection:
+        def execute(self, statement: object, parameters: dict[str, str]) -> None:
+            assert statement is SET_STATEMENT_TIMEOUT
+            timeouts.append(parameters["timeout"])
+
+    for deadline in deadlines:
+        if deadline is None:
+            set_statement_timeout(Session(), None, Connection())
+            continue
+        token = activate_deadline(deadline)
+        try:
+            set_statement_timeout(Session(), None, Connection())
+        finally:
+            deactivate_deadline(token)
+    return timeouts
+
+
+def test_statement_timeout_follows_the_deadline() -> None:
+    """Transactions begun under a tight deadline get the time left as statement_timeout."""
+    [timeout] = _statement_timeouts(1.5)
+
+    assert 1400 < int(timeout) <= 1500
+
+
+def test_connection_default_needs_no_round_trip() -> None:
+    """Deadlines close to the connection default keep it, work without one lifts it."""
+    assert connect_args() == {"server_settings": {"statement_timeout": "10000"}}
+    assert _statement_timeouts(10.0, 9.5) == []
+    assert _statement_timeouts(None) == ["0"]
+
+
+def test_no_connection_default(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Without a deadline on every route, only requests with one set statement_timeout."""
+    monkeypatch.setattr(settings, "request_timeout_seconds", 0.0)
+
+    assert connect_args() == {}
+    assert _statement_timeouts(None) == []
+    assert len(_statement_timeouts(9.5)) == 1
+
+
+def test_handler_is_cancelled_at_the_deadline() -> None:
+    """A handler still running at the deadline is cancelled with a 504."""
+    cancelled = asyncio.Event()
+    router = APIRouter(route_class=TimedRoute)
+
+    @router.get("/slow")
+    async def slow() -> None:
+        """Wait longer than any deadline."""
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    app = FastAPI()
+    app.include_router(router)
+
+    response = TestClient(app).get("/slow", headers={"x-request-timeout-ms": "50"})
+
+    assert response.status_code == status.HTTP_504_GATEWAY_TIMEOUT
+    assert cancelled.is_set()
@@ -0,0 +1,99 @@
+import uuid
+from datetime import datetime, timedelta
+
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette import status
+
+from operaclone2.db.dao.idempotency_dao import IdempotencyDAO
+from operaclone2.services import idempotency_service
+
+URL = "/api/rsv/v1/hotels/SBOXD1/reservations"
+
+
+def _reservation_payload(surname: str) -> dict[str, object]:
+    return {
+        "reservations": {
+            "reservation": [
+                {
+                    "roomStay": {"arrivalDate": "2026-03-01", "departureDate": "2026-03-03"},
+                    "reservationGuests": [
+                        {
+                            "profileInfo": {
+                                "profile": {
+                                    "customer": {
+                                        "personName": [{"givenName": "Jane", "surname": surname}]
+                                    }
+                                }
+                            }
+                        }
+                    ],
+                }
+            ]
+        }
+    }
+
+
+async def test_create_reservation_replays_response(client: AsyncClient) -> None:
+    """Retrying a create with the same key returns the original reservation."""
+    headers = {"Idempotency-Key": uuid.uuid4().hex}
+    payload = _reservation_payload("Doe")
+
+    first = await client.post(URL, json=payload, headers=headers)
+    second = await client.post(URL, json=payload, headers=headers)
+
+    assert first.status_code == status.HTTP_200_OK
+    assert second.status_code == status.HTTP_200_OK
+    assert first.json() == second.json()
+
+
+async def test_create_reservation_replays_response_stored_by_another_worker(
+    client: AsyncClient,
+) -> None:
+    """A retry missing the front cache loses the claim and replays the stored row."""
+    headers = {"Idempotency-Key": uuid.uuid4().hex}
+    payload = _reservation_payload("Doe")
+
+    first = await client.post(URL, json=payload, headers=headers)
+    idempotency_service._response_cache.clear()  # noqa: SLF001
+    second = await client.post(URL, json=payload, headers=headers)
+
+    assert second.status_code == status.HTTP_200_OK
+    assert first.json() == second.json()
+
+
+async def test_create_reservation_without_key_is_not_deduplicated(client: AsyncClient) -> None:
+    """Requests without a key create separate reservations."""
+    payload = _reservation_payload("Doe")
+
+    first = await client.post(URL, json=payload)
+    second = await client.post(URL, json=payload)
+
+    first_ids = first.json()["reservations"]["reservation"][0]["reservationIdList"]
+    second_ids = second.json()["reservations"]["reservation"][0]["reservationIdList"]
+    assert first_ids != second_ids
+
+
+async def test_idempotency_key_reuse_with_other_body(client: AsyncClient) -> None:
+    """Reusing a key for a different request is rejected."""
+    headers = {"Idempotency-Key": uuid.uuid4().hex}
+
+    first = await client.post(URL, json=_reservation_payload("Doe"), headers=headers)
+    second = await client.post(URL, json=_reservation_payload("Smith"), headers=headers)
+
+    assert first.status_code == status.HTTP_200_OK
+    assert second.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+async def test_delete_expired_keys(dbsession: AsyncSession) -> None:
+    """Expired keys are deleted, live ones are kept."""
+    dao = IdempotencyDAO(dbsession)
+    expired, live = uuid.uuid4().hex, uuid.uuid4().hex
+    await dao.claim(expired, "hash", datetime.now() - timedelta(seconds=1))
+    await dao.claim(live, "hash", datetime.now() + timedelta(hours=1))
+    await dao.complete(live, {})
+
+    assert await dao.delete_expired() >= 1
+    assert await dao.get_by_key(live) is not None
+    assert not await dao.claim(live, "hash", datetime.now() + timedelta(hours=1))
+    assert await dao.claim(expired, "hash", datetime.now() + timedelta(hours=1))
@@ -0,0 +1,38 @@
+from operaclone2.db.instrumentation import (
+    normalize_statement,
+    record_statement,
+    redact_parameters,
+    reset_statistics,
+    slowest_statements,
+)
+
+
+def test_statements_differing_in_values_share_a_shape() -> None:
+    """Literals, bound parameters and IN-lists are normalized away."""
+    first = normalize_statement("SELECT *  FROM hotels\nWHERE id = 'H1' AND n IN ($1, $2, $3)")
+    second = normalize_statement("SELECT * FROM hotels WHERE id = 'H2' AND n IN ($1)")
+
+    assert first == "SELECT * FROM hotels WHERE id = ? AND n IN (?, ...)"
+    assert second == "SELECT * FROM hotels WHERE id = ? AND n IN (?)"
+
+
+def test_parameters_are_redacted() -> None:
+    """Only the types of bound values are kept."""
+    assert redact_parameters(("secret", 3, None)) == ("<str>", "<int>", None)
+    assert redact_parameters({"name": "secret"}) == {"name": "<str>"}
+
+
+def test_slowest_statements() -> None:
+    """Statements are aggregated by shape and sorted by the chosen statistic."""
+    reset_statistics()
+    record_statement("SELECT 1", 0.001)
+    record_statement("SELECT 2", 0.003)
+    record_statement("UPDATE hotels SET name = 'x'", 0.002)
+
+    fast, slow = slowest_statements(2, "total")
+
+    assert fast.statement == "SELECT ?"
+    assert fast.count == 2
+    assert fast.max == 0.003
+    assert slow.statement == "UPDATE hotels SET name = ?"
+    reset_statistics()
@@ -0,0 +1,31 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from starlette import status
+
+from operaclone2.web.api.router import DOCS, ECHO
+from operaclone2.web.lazy import LazyRoute, add_lazy_routers
+
+
+def test_lazy_router_is_loaded_on_first_request() -> None:
+    """The placeholder is replaced by the real routes of the router."""
+    app = FastAPI()
+    add_lazy_routers(app, (ECHO, DOCS), prefix="/api")
+    client = TestClient(app)
+
+    assert client.get("/api/missing").status_code == status.HTTP_404_NOT_FOUND
+    assert sum(isinstance(route, LazyRoute) for route in app.router.routes) == 2
+
+    response = client.post("/api/echo/", json={"message": "hello"})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == {"message": "hello"}
+    assert sum(isinstance(route, LazyRoute) for route in app.router.routes) == 1
+
+
+def test_openapi_loads_lazy_routers() -> None:
+    """The schema lists the routes of lazy routers that were never requested."""
+    app = FastAPI()
+    add_lazy_routers(app, (ECHO,), prefix="/api")
+
+    assert "/api/echo/" in app.openapi()["paths"]
+    assert not any(isinstance(route, LazyRoute) for route in app.router.routes)
@@ -0,0 +1,31 @@
+import asyncio
+
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from operaclone2.db.leader import lock_key, run_startup_tasks
+
+
+def test_lock_key_is_a_stable_bigint() -> None:
+    """Every worker derives the same 64 bit key from a name."""
+    key = lock_key("operaclone2.startup")
+
+    assert key == lock_key("operaclone2.startup")
+    assert key != lock_key("operaclone2.other")
+    assert -(2**63) <= key < 2**63
+
+
+async def test_only_the_leader_runs_startup_tasks(_engine: AsyncEngine) -> None:
+    """Concurrent workers wait for the leader instead of repeating its tasks."""
+    runs = 0
+
+    async def task() -> None:
+        nonlocal runs
+        runs += 1
+        await asyncio.sleep(0.2)
+
+    leaders = await asyncio.gather(
+        *(run_startup_tasks(_engine, [task], timeout=5) for _ in range(4)),
+    )
+
+    assert sorted(leaders) == [False, False, False, True]
+    assert runs == 1
@@ -0,0 +1,54 @@
+import io
+import logging
+
+import pytest
+import ujson
+from loguru import logger
+
+from operaclone2.log import SamplingFilter, json_format
+
+
+def _record(name: str, level: int = logging.INFO) -> logging.LogRecord:
+    return logging.LogRecord(name, level, __file__, 1, "message", None, None)
+
+
+def test_sampling_filter_uses_the_most_specific_rate() -> None:
+    """Children inherit the rate of the closest configured parent."""
+    sampler = SamplingFilter({"operaclone2": 0.5, "operaclone2.web": 0.0})
+
+    assert sampler.rate("operaclone2.web.api.content.views") == 0.0
+    assert sampler.rate("operaclone2.services") == 0.5
+    assert sampler.rate("operaclone2_other") == 1.0
+    assert sampler.rate("uvicorn.access") == 1.0
+
+
+def test_sampling_filter_keeps_warnings() -> None:
+    """Warnings and errors are never sampled out."""
+    sampler = SamplingFilter({"operaclone2": 0.0})
+
+    assert not sampler.filter(_record("operaclone2.seed"))
+    assert sampler.filter(_record("operaclone2.seed", logging.WARNING))
+    assert sampler.filter(_record("uvicorn.error"))
+
+
+def test_json_format_writes_one_object_per_line() -> None:
+    """Records are rendered as JSON with their extra fields."""
+    stream = io.StringIO()
+    handler_id = logger.add(stream, format=json_format, colorize=False)
+    try:
+        logger.bind(request_id="abc").info("Hotel {code} not found", code="X")
+        with pytest.raises(ZeroDivisionError):
+            try:
+                1 / 0  # noqa: B018
+            except ZeroDivisionError:
+                logger.bind(request_id="def").exception("Failed")
+                raise
+    finally:
+        logger.remove(handler_id)
+
+    first, second = (ujson.loads(line) for line in stream.getvalue().splitlines())
+    assert first["message"] == "Hotel X not found"
+    assert first["request_id"] == "abc"
+    assert first["level"] == "INFO"
+    assert first["function"] == "test_json_format_writes_one_object_per_line"
+    assert "ZeroDivisionError" in second["exception"]
@@ -0,0 +1,59 @@
+import asyncio
+import time
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from operaclone2.loop_monitor import LoopMonitor, event_loop_blocked, event_loop_lag
+from operaclone2.web.middlewares import MetricsMiddleware
+
+
+@pytest.mark.anyio
+async def test_blocking_route_is_reported(caplog: pytest.LogCaptureFixture) -> None:
+    """Blocking the loop inside a request is attributed to its route."""
+    app = FastAPI()
+
+    @app.get("/blocking/{item}")
+    async def blocking(item: int) -> int:
+        """Block the event loop for 150 ms."""
+        time.sleep(0.15)
+        return item
+
+    app.add_middleware(MetricsMiddleware)
+    monitor = LoopMonitor(threshold=0.05)
+    lag_before = sum(event_loop_lag.snapshot()[0])
+    monitor.start()
+    try:
+        await asyncio.sleep(0.1)
+        transport = ASGITransport(app=app)
+        async with AsyncClient(transport=transport, base_url="http://test") as client:
+            response = await client.get("/blocking/1")
+        await asyncio.sleep(0.1)
+    finally:
+        await monitor.stop()
+
+    assert response.json() == 1
+    assert ("event_loop_blocked_total", {"route": "/blocking/{item}"}, 1.0) in list(
+        event_loop_blocked.samples(),
+    )
+    assert "in blocking" in caplog.text
+    assert sum(event_loop_lag.snapshot()[0]) > lag_before
+
+
+@pytest.mark.anyio
+async def test_monitor_can_be_restarted(caplog: pytest.LogCaptureFixture) -> None:
+    """A monitor started again after stop keeps watching the loop."""
+    monitor = LoopMonitor(threshold=0.05)
+    monitor.start()
+    await monitor.stop()
+
+    monitor.start()
+    try:
+        await asyncio.sleep(0.05)
+        time.sleep(0.15)
+        await asyncio.sleep(0.05)
+    finally:
+        await monitor.stop()
+
+    assert "Event loop blocked" in caplog.text
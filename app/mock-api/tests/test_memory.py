@@ -0,0 +1,99 @@
+import tracemalloc
+from collections.abc import Iterator
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from operaclone2 import memory
+from operaclone2.memory import PACKAGE_DIR, MemoryTracker, attribute, module_of, take_snapshot
+from operaclone2.web.middlewares import MetricsMiddleware
+
+
+@pytest.fixture
+def tracker(monkeypatch: pytest.MonkeyPatch) -> Iterator[MemoryTracker]:
+    """Tracker used by the middleware, stopped after the test."""
+    tracker = MemoryTracker()
+    monkeypatch.setattr(memory, "memory_tracker", tracker)
+    monkeypatch.setattr("operaclone2.web.middlewares.metrics.memory_tracker", tracker)
+    yield tracker
+    tracker.stop()
+
+
+def test_module_of() -> None:
+    """Application files map to dotted modules, libraries to their package."""
+    assert module_of(str(PACKAGE_DIR / "services" / "shop.py")) == "operaclone2.services.shop"
+    assert module_of(str(PACKAGE_DIR / "db" / "__init__.py")) == "operaclone2.db"
+    assert module_of("/venv/lib/site-packages/sqlalchemy/orm/session.py") == "sqlalchemy"
+    assert module_of("/usr/lib/python3.13/json/decoder.py") == "decoder"
+
+
+def test_allocations_are_charged_to_the_innermost_application_frame() -> None:
+    """Memory allocated by a library for the application counts for the application."""
+    traceback = tracemalloc.Traceback(
+        (
+            ("/venv/lib/site-packages/pydantic/main.py", 10),
+            (str(PACKAGE_DIR / "services" / "shop.py"), 20),
+            (str(PACKAGE_DIR / "web" / "application.py"), 30),
+        ),
+    )
+
+    assert attribute(traceback, "module") == "operaclone2.services.shop"
+    assert attribute(traceback, "line") == "/venv/lib/site-packages/pydantic/main.py:10"
+
+
+def test_report_shows_growth_since_the_baseline(tracker: MemoryTracker) -> None:
+    """Memory kept alive after the baseline appears as a diff of its site."""
+    tracker.start(frames=5)
+    leaked = [bytearray(1000) for _ in range(100)]
+
+    sites = {site.location: site for site in tracker.report("line", limit=1000)}
+
+    grown = max(sites.values(), key=lambda site: site.size_diff)
+    assert "test_memory.py:" in grown.location
+    assert grown.size_diff >= 100_000
+    assert grown.count_diff >= len(leaked)
+
+    tracker.reset_baseline()
+    assert all(site.size_diff < 100_000 for site in tracker.report("line", limit=1000))
+
+    tracker.stop()
+    assert not tracemalloc.is_tracing()
+    assert tracker.baseline is None
+
+
+def test_snapshots_ignore_tracemalloc_itself(tracker: MemoryTracker) -> None:
+    """Snapshots taken by the tracker are not reported as allocations."""
+    tracker.start(frames=1)
+
+    snapshot = take_snapshot()
+
+    assert not any(trace.traceback[0].filename == tracemalloc.__file__ for trace in snapshot.traces)
+
+
+def test_route_peaks_are_sampled(tracker: MemoryTracker) -> None:
+    """One request in ``ROUTE_SAMPLE_RATE`` records its peak allocation."""
+    app = FastAPI()
+
+    @app.get("/items/{item_id}")
+    async def get_item(item_id: int) -> int:
+        """Allocate a temporary buffer."""
+        return len(bytearray(200_000)) + item_id
+
+    app.add_middleware(MetricsMiddleware)
+    client = TestClient(app)
+    tracker.start(frames=1)
+
+    for item_id in range(memory.ROUTE_SAMPLE_RATE * 2):
+        client.get(f"/items/{item_id}")
+
+    [peak] = tracker.largest_route_peaks()
+    assert peak.route == "/items/{item_id}"
+    assert peak.samples == 2
+    assert peak.max >= 200_000
+
+
+def test_route_peaks_are_not_sampled_without_tracing(tracker: MemoryTracker) -> None:
+    """The middleware does nothing while tracing is off."""
+    assert tracker.begin_route_sample() is None
+    assert not tracker.route_peaks
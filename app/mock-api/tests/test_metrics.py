@@ -0,0 +1,32 @@
+import pytest
+from fastapi import FastAPI
+from httpx import AsyncClient
+from starlette import status
+
+from operaclone2.settings import settings
+
+
+async def test_metrics_exposes_route_templates(
+    client: AsyncClient,
+    fastapi_app: FastAPI,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Requests are counted by route template and channel, unknown channels as other."""
+    monkeypatch.setattr(settings, "metric_channels", ["METRICS_TEST"])
+    for channel in ("METRICS_TEST", "UNKNOWN_CHANNEL"):
+        await client.get(
+            "/api/content/v1/hotels/UNKNOWN",
+            headers={"x-channelCode": channel},
+        )
+
+    response = await client.get(fastapi_app.url_path_for("get_metrics"))
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"].startswith("text/plain")
+    assert (
+        'http_requests_total{route="/api/content/v1/hotels/{hotelCode}",method="GET",'
+        'channel="METRICS_TEST",status="404"}'
+    ) in response.text
+    assert 'channel="other",status="404"}' in response.text
+    assert "UNKNOWN_CHANNEL" not in response.text
+    assert "# TYPE http_request_duration_seconds histogram" in response.text
@@ -0,0 +1,86 @@
+import json
+import re
+import time
+from collections import Counter
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from starlette import status
+
+from operaclone2 import profiling
+from operaclone2.profiling import PROFILE_ID_PATTERN, collapse
+from operaclone2.settings import settings
+from operaclone2.web.middlewares import ProfilingMiddleware, ServerTimingMiddleware
+
+
+@pytest.fixture
+def profiled_app(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> FastAPI:
+    """Application with profiling turned on, writing to a temporary directory."""
+    monkeypatch.setattr(settings, "profiling_enabled", True)
+    monkeypatch.setattr(profiling, "PROFILE_DIR", tmp_path)
+
+    app = FastAPI()
+
+    @app.get("/items")
+    async def get_items() -> list[int]:
+        """Return a few items after 20 ms of work."""
+        deadline = time.perf_counter() + 0.02
+        while time.perf_counter() < deadline:
+            pass
+        return [1, 2, 3]
+
+    app.add_middleware(ProfilingMiddleware)
+    app.add_middleware(ServerTimingMiddleware)
+    return app
+
+
+def test_profile_is_saved_under_a_generated_id(profiled_app: FastAPI, tmp_path: Path) -> None:
+    """Profile files are named by the response header, the request id is metadata."""
+    client = TestClient(profiled_app)
+
+    response = client.get("/items", headers={"x-profile": "1", "x-request-id": "req/42"})
+
+    assert response.status_code == status.HTTP_200_OK
+    profile = response.headers["x-profile-id"]
+    assert re.fullmatch(PROFILE_ID_PATTERN, profile)
+    assert (tmp_path / f"{profile}.pstats").stat().st_size > 0
+    assert (
+        "test_profiling:profiled_app.<locals>.get_items"
+        in (tmp_path / f"{profile}.collapsed").read_text()
+    )
+    assert json.loads((tmp_path / f"{profile}.json").read_text()) == {
+        "requestId": "req/42",
+        "method": "GET",
+        "path": "/items",
+    }
+
+
+def test_reused_request_ids_do_not_overwrite_profiles(profiled_app: FastAPI) -> None:
+    """Requests sharing an x-request-id get profiles of their own."""
+    client = TestClient(profiled_app)
+    headers = {"x-profile": "1", "x-request-id": "same"}
+
+    first = client.get("/items", headers=headers).headers["x-profile-id"]
+    second = client.get("/items", headers=headers).headers["x-profile-id"]
+
+    assert first != second
+
+
+def test_requests_without_header_are_not_profiled(
+    profiled_app: FastAPI,
+    tmp_path: Path,
+) -> None:
+    """Profiling is opt-in per request."""
+    response = TestClient(profiled_app).get("/items")
+
+    assert "x-profile-id" not in response.headers
+    assert not list(tmp_path.iterdir())
+
+
+def test_collapse_renders_flamegraph_lines() -> None:
+    """Stacks are written root first with their sample count."""
+    samples = Counter({"main:run;app:handler": 3, "main:run": 1})
+
+    assert collapse(samples) == "main:run;app:handler 3\nmain:run 1\n"
@@ -0,0 +1,166 @@
+import uuid
+from typing import Any
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from httpx import AsyncClient
+from sqlalchemy import create_engine, insert, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette import status
+from starlette.routing import Route
+
+from operaclone2.db.models.hotel import Hotel
+from operaclone2.db.models.room_type import RoomType
+from operaclone2.seed import hotel_seed_data, room_type_seed_data
+from operaclone2.web.application import get_app
+from tests.conftest import QUERY_BUDGETS, QueryBudgetGuard, listen_for_statements
+
+HOTEL_CODE = hotel_seed_data()["hotel_code"]
+HEADERS = {"x-channelCode": "WEB"}
+STAY = {"ArrivalDate": "2026-06-01", "DepartureDate": "2026-06-04"}
+RESERVATIONS = "/api/rsv/v1/hotels/SBOXD1/reservations"
+
+
+def _reservation_payload(surname: str) -> dict[str, Any]:
+    return {
+        "reservations": {
+            "reservation": [
+                {
+                    "roomStay": {"arrivalDate": "2026-06-01", "departureDate": "2026-06-04"},
+                    "reservationGuests": [
+                        {
+                            "profileInfo": {
+                                "profile": {
+                                    "customer": {
+                                        "personName": [{"givenName": "Jane", "surname": surname}]
+                                    }
+                                }
+                            }
+                        }
+                    ],
+                }
+            ]
+        }
+    }
+
+
+@pytest.fixture
+async def seeded_hotel(dbsession: AsyncSession) -> None:
+    """Insert the seed hotel and its room types in the test transaction."""
+    await dbsession.execute(insert(Hotel).values(hotel_seed_data()))
+    await dbsession.execute(insert(RoomType).values(room_type_seed_data()))
+
+
+@pytest.fixture
+def counted_app() -> FastAPI:
+    """Application running a given number of statements on an in-memory database."""
+    engine = create_engine("sqlite://")
+    listen_for_statements(engine)
+    app = FastAPI()
+
+    @app.get("/items/{count}")
+    def get_items(count: int) -> int:
+        """Run ``count`` statements."""
+        with engine.connect() as conn:
+            for _ in range(count):
+                conn.execute(text("SELECT 1"))
+        return count
+
+    return app
+
+
+def test_every_route_has_a_budget() -> None:
+    """New routes must declare how many statements they may run."""
+    routes = {
+        f"{method} {route.path}"
+        for route in get_app().routes
+        if isinstance(route, Route)
+        for method in route.methods or ()
+        if method != "HEAD"
+    }
+
+    assert sorted(routes - QUERY_BUDGETS.keys()) == []
+
+
+def test_requests_within_budget_pass(counted_app: FastAPI) -> None:
+    """The budget is an upper bound."""
+    client = TestClient(QueryBudgetGuard(counted_app, {"GET /items/{count}": 2}))
+
+    assert client.get("/items/2").status_code == status.HTTP_200_OK
+
+
+def test_requests_over_budget_fail(counted_app: FastAPI) -> None:
+    """The failure lists the executed statements."""
+    client = TestClient(QueryBudgetGuard(counted_app, {"GET /items/{count}": 2}))
+
+    with pytest.raises(AssertionError, match=r"executed 3 statements, budget is 2:\nSELECT 1"):
+        client.get("/items/3")
+
+
+def test_routes_without_budget_fail(counted_app: FastAPI) -> None:
+    """Unlisted routes are reported by name."""
+    client = TestClient(QueryBudgetGuard(counted_app, {}))
+
+    with pytest.raises(AssertionError, match=r"GET /items/\{count\} has no query budget"):
+        client.get("/items/0")
+
+
+@pytest.mark.usefixtures("seeded_hotel")
+async def test_shop_and_content_routes_stay_within_budget(client: AsyncClient) -> None:
+    """Every shop and content route reads the seeded hotel within its budget."""
+    responses = [
+        await client.get(
+            "/api/shop/v1/hotels",
+            params={"HotelCodes": HOTEL_CODE, **STAY},
+            headers=HEADERS,
+        ),
+        await client.get(f"/api/shop/v1/hotels/{HOTEL_CODE}/offers", params=STAY, headers=HEADERS),
+        await client.get(f"/api/shop/v1/hotels/{HOTEL_CODE}/offer", params=STAY, headers=HEADERS),
+        await client.get("/api/content/v1/hotels", headers=HEADERS),
+        await client.get(f"/api/content/v1/hotels/{HOTEL_CODE}", headers=HEADERS),
+        await client.get(
+            f"/api/content/v1/hotels/{HOTEL_CODE}/roomTypes",
+            params={"includeRoomAmenities": "true"},
+            headers=HEADERS,
+        ),
+    ]
+
+    assert [response.status_code for response in responses] == [status.HTTP_200_OK] * 6
+    assert responses[0].json()["roomStays"][0]["propertyInfo"]["hotelCode"] == HOTEL_CODE
+    assert responses[4].json()["propertyInfo"]["hotelCode"] == HOTEL_CODE
+    assert len(responses[5].json()["roomTypes"]) == min(len(room_type_seed_data()), 20)
+
+
+async def test_reservation_routes_stay_within_budget(client: AsyncClient) -> None:
+    """Every reservation route works on a created reservation within its budget."""
+    created = await client.post(
+        RESERVATIONS,
+        json=_reservation_payload("Doe"),
+        headers={"Idempotency-Key": uuid.uuid4().hex},
+    )
+    [reservation] = created.json()["reservations"]["reservation"]
+    reservation_id = reservation["reservationIdList"][0]["id"]
+
+    listed = await client.get(RESERVATIONS, params={"surname": "Doe"})
+    summary = await client.get(f"{RESERVATIONS}/summary", params={"lastName": "Doe"})
+    statistics = await client.get(f"{RESERVATIONS}/statistics")
+    updated = await client.put(
+        f"{RESERVATIONS}/{reservation_id}",
+        json=_reservation_payload("Smith"),
+        headers={"Idempotency-Key": uuid.uuid4().hex},
+    )
+    cancelled = await client.post(
+        f"{RESERVATIONS}/{reservation_id}/cancellations",
+        json={"reason": {"code": "CHG", "description": "Change of plans"}},
+        headers={"Idempotency-Key": uuid.uuid4().hex},
+    )
+
+    assert created.status_code == status.HTTP_200_OK
+    [found] = listed.json()["reservations"]["reservation"]
+    assert found["reservationIdList"][0]["id"] == reservation_id
+    assert summary.status_code == status.HTTP_200_OK
+    assert statistics.status_code == status.HTTP_200_OK
+    assert updated.status_code == status.HTTP_200_OK
+    assert cancelled.status_code == status.HTTP_201_CREATED
+    assert cancelled.json()["reservationIdList"][0]["id"] == reservation_id
@@ -0,0 +1,26 @@
+from httpx import AsyncClient
+from starlette import status
+
+URL = "/api/rsv/v1/hotels/SBOXD1/reservations"
+PAYLOAD = {
+    "reservations": {
+        "reservation": [
+            {"roomStay": {"arrivalDate": "2026-03-01", "departureDate": "2026-03-03"}},
+        ]
+    }
+}
+
+
+async def test_created_reservation_ids_are_unique_and_increasing(client: AsyncClient) -> None:
+    """Reservation IDs and confirmation numbers come from the block allocator."""
+    ids = []
+    for _ in range(3):
+        response = await client.post(URL, json=PAYLOAD)
+        assert response.status_code == status.HTTP_200_OK
+        id_list = response.json()["reservations"]["reservation"][0]["reservationIdList"]
+        ids.append({item["type"]: int(item["id"]) for item in id_list})
+
+    reservation_ids = [item["Reservation"] for item in ids]
+    confirmation_numbers = [item["Confirmation"] for item in ids]
+    assert reservation_ids == sorted(set(reservation_ids))
+    assert confirmation_numbers == sorted(set(confirmation_numbers))
@@ -0,0 +1,74 @@
+import asyncio
+
+from operaclone2.db.scheduler import FairScheduler
+
+
+async def _grant_order(scheduler: FairScheduler, channels: list[str]) -> list[str]:
+    """Queue one waiter per channel behind a held slot and record who gets it first."""
+    order: list[str] = []
+
+    async def worker(channel: str) -> None:
+        async with scheduler.slot(channel):
+            order.append(channel)
+            await asyncio.sleep(0)
+
+    await scheduler.acquire("holder")
+    tasks = [asyncio.create_task(worker(channel)) for channel in channels]
+    await asyncio.sleep(0)
+    scheduler.release("holder")
+    await asyncio.gather(*tasks)
+    return order
+
+
+async def test_weights_share_sessions_under_contention() -> None:
+    """A channel of weight 2 is served twice as often as one of weight 1."""
+    scheduler = FairScheduler(1, weights={"direct": 2.0, "ota": 1.0}, limits={})
+
+    order = await _grant_order(scheduler, ["ota"] * 6 + ["direct"] * 6)
+
+    assert order[:6].count("direct") == 4
+    assert order[:6].count("ota") == 2
+    assert scheduler.active == 0
+    assert not scheduler.channels
+
+
+async def test_bulk_channel_cannot_starve_others() -> None:
+    """A late channel overtakes the backlog of a busy one."""
+    scheduler = FairScheduler(1, weights={}, limits={})
+
+    order = await _grant_order(scheduler, ["bulk"] * 10 + ["direct"])
+
+    assert order.index("direct") <= 1
+
+
+async def test_channel_limit() -> None:
+    """A channel at its limit waits even when the capacity is not used up."""
+    scheduler = FairScheduler(3, weights={}, limits={"ota": 1})
+
+    await scheduler.acquire("ota")
+    waiting = asyncio.create_task(scheduler.acquire("ota"))
+    await asyncio.sleep(0)
+    await asyncio.wait_for(scheduler.acquire("direct"), timeout=1)
+
+    assert not waiting.done()
+    # Unconfigured channels share one label.
+    assert scheduler.queue_depths() == [(("ota",), 1), (("other",), 0)]
+
+    scheduler.release("ota")
+    await asyncio.wait_for(waiting, timeout=1)
+    assert scheduler.channels["ota"].active == 1
+
+
+async def test_cancelled_waiters_leave_no_trace() -> None:
+    """A waiter cancelled by a client disconnect neither holds nor leaks a slot."""
+    scheduler = FairScheduler(1, weights={}, limits={})
+    await scheduler.acquire("direct")
+    waiting = asyncio.create_task(scheduler.acquire("ota"))
+    await asyncio.sleep(0)
+
+    waiting.cancel()
+    await asyncio.gather(waiting, return_exceptions=True)
+    scheduler.release("direct")
+
+    assert scheduler.active == 0
+    assert not scheduler.channels
@@ -0,0 +1,50 @@
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker
+
+from operaclone2.db.models.room_type import RoomType
+from operaclone2.seed import (
+    SEED_HOTEL_ID,
+    hotel_seed_data,
+    room_type_seed_data,
+    seed_database,
+    seed_fingerprint,
+)
+
+
+def test_seed_fingerprint_is_stable() -> None:
+    """Building the seed twice gives the same fingerprint."""
+    first = seed_fingerprint(hotel_seed_data(), room_type_seed_data())
+    second = seed_fingerprint(hotel_seed_data(), room_type_seed_data())
+
+    assert first == second
+    assert len(first) == 64
+
+
+def test_seed_fingerprint_changes_with_the_data() -> None:
+    """Any change of a seeded value changes the fingerprint."""
+    hotel = hotel_seed_data()
+    room_types = room_type_seed_data()
+    fingerprint = seed_fingerprint(hotel, room_types)
+
+    room_types[-1]["number_of_units"] += 1
+
+    assert seed_fingerprint(hotel, room_types) != fingerprint
+
+
+async def test_seed_database_skips_unchanged_seed(_engine: AsyncEngine) -> None:
+    """The second run finds the stored fingerprint and does nothing."""
+    connection = await _engine.connect()
+    transaction = await connection.begin()
+    session_factory = async_sessionmaker(connection, expire_on_commit=False)
+    try:
+        assert await seed_database(session_factory)
+        assert not await seed_database(session_factory)
+
+        async with session_factory() as session:
+            count = await session.scalar(
+                select(func.count()).where(RoomType.hotel_id_fk == SEED_HOTEL_ID),
+            )
+        assert count == len(room_type_seed_data())
+    finally:
+        await transaction.rollback()
+        await connection.close()
@@ -0,0 +1,56 @@
+import re
+
+import pytest
+from fastapi import APIRouter, FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from operaclone2.timing import current_timing
+from operaclone2.web.middlewares import ServerTimingMiddleware
+from operaclone2.web.routing import TimedRoute
+
+
+@pytest.fixture
+def timed_app() -> FastAPI:
+    """Application with one timed route recording a database round trip."""
+    router = APIRouter(route_class=TimedRoute)
+
+    @router.get("/items/{item_id}")
+    async def get_item(item_id: int) -> dict[str, int]:
+        """Return the item after a fake statement."""
+        timing = current_timing()
+        assert timing is not None
+        timing.add_db(0.002)
+        return {"itemId": item_id}
+
+    app = FastAPI()
+    app.include_router(router)
+    app.add_middleware(ServerTimingMiddleware)
+    return app
+
+
+@pytest.mark.anyio
+async def test_server_timing_header(timed_app: FastAPI) -> None:
+    """The time breakdown and the request id are sent with the response."""
+    transport = ASGITransport(app=timed_app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await client.get("/items/3", headers={"x-request-id": "abc"})
+
+    assert response.json() == {"itemId": 3}
+    assert response.headers["x-request-id"] == "abc"
+    timings = dict(
+        re.findall(r"(\w+);dur=([\d.]+)", response.headers["server-timing"]),
+    )
+    assert set(timings) == {"db", "service", "serialization", "total"}
+    assert float(timings["db"]) == 2.0
+    assert 'desc="1 round trips"' in response.headers["server-timing"]
+
+
+@pytest.mark.anyio
+async def test_request_id_is_generated(timed_app: FastAPI) -> None:
+    """Requests without an id get a fresh one."""
+    transport = ASGITransport(app=timed_app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        first = await client.get("/items/1")
+        second = await client.get("/items/1")
+
+    assert first.headers["x-request-id"] != second.headers["x-request-id"]
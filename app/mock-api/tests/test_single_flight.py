@@ -0,0 +1,63 @@
+import asyncio
+
+import pytest
+
+from operaclone2.services.single_flight import SingleFlight
+
+
+async def test_concurrent_calls_share_one_execution() -> None:
+    """Callers arriving while a computation runs get its result."""
+    flight = SingleFlight("test")
+    runs = 0
+
+    async def compute() -> int:
+        nonlocal runs
+        runs += 1
+        await asyncio.sleep(0.01)
+        return runs
+
+    results = await asyncio.gather(*(flight.do("key", compute) for _ in range(5)))
+
+    assert results == [1] * 5
+    assert flight.executions == 1
+    assert flight.coalesced == 4
+    assert flight.in_flight == 0
+
+    # Finished computations are not cached.
+    assert await flight.do("key", compute) == 2
+
+
+async def test_errors_are_shared_but_not_kept() -> None:
+    """Followers see the leader's error, the next call runs again."""
+    flight = SingleFlight("test")
+
+    async def fail() -> None:
+        await asyncio.sleep(0.01)
+        raise LookupError
+
+    results = await asyncio.gather(
+        flight.do("key", fail), flight.do("key", fail), return_exceptions=True
+    )
+    assert all(isinstance(result, LookupError) for result in results)
+
+    with pytest.raises(LookupError):
+        await flight.do("key", fail)
+    assert flight.executions == 2
+
+
+async def test_follower_takes_over_cancelled_leader() -> None:
+    """If the leader is cancelled, a follower runs the computation itself."""
+    flight = SingleFlight("test")
+
+    async def compute() -> str:
+        await asyncio.sleep(0.01)
+        return "done"
+
+    leader = asyncio.create_task(flight.do("key", compute))
+    await asyncio.sleep(0)
+    follower = asyncio.create_task(flight.do("key", compute))
+    await asyncio.sleep(0)
+    leader.cancel()
+
+    assert await follower == "done"
+    assert flight.executions == 2
@@ -0,0 +1,19 @@
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.pool import QueuePool
+
+from operaclone2.db.warmup import warm_up_pool
+from operaclone2.settings import settings
+
+
+async def test_warm_up_pool_fills_the_pool(_engine: AsyncEngine) -> None:
+    """Primed connections stay in the pool for the first requests."""
+    engine = create_async_engine(str(settings.db_url), pool_size=3)
+    try:
+        assert await warm_up_pool(engine, 10) == 3
+
+        pool = engine.pool
+        assert isinstance(pool, QueuePool)
+        assert pool.checkedin() == 3
+        assert pool.checkedout() == 0
+    finally:
+        await engine.dispose()